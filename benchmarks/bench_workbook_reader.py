@@ -0,0 +1,216 @@
+# benchmarks/bench_workbook_reader.py
+"""
+Sprint Workbook Reader Benchmark
+
+Katta sintetik sprint workbook'ini yaratib, o'qish usullarini solishtiradi:
+    - legacy_full:      load_workbook(read_only=False) + ws.cell(row, col)  (eski 2_load_sprints.py)
+    - legacy_readonly:  load_workbook(read_only=True)  + ws.cell(row, col)  (eski statistics.py)
+    - streaming:        SprintWorkbookReader.iter_issues()                  (iter_rows(values_only=True))
+
+Har biri uchun vaqt va tracemalloc peak xotira o'lchanadi.
+legacy_readonly kvadratik (har bir ws.cell sheet XML'ni boshidan o'qiydi) -
+katta --rows bilan uni --methods'dan chiqarib qo'ying.
+
+Usage:
+    python -m benchmarks.bench_workbook_reader --rows 20000 --methods legacy_full,streaming
+    python -m benchmarks.bench_workbook_reader --rows 5000 --methods streaming,legacy_full
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Dict, Any, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+from openpyxl import Workbook, load_workbook
+
+from benchmarks.run_benchmarks import get_git_commit
+from benchmarks.synthetic_corpus import SyntheticCorpus
+from utils.sprint_workbook_reader import SprintWorkbookReader, ISSUE_COLUMNS
+
+load_dotenv()
+
+ALL_METHODS = ['legacy_full', 'legacy_readonly', 'streaming']
+
+# download_file.py ACTIVE_COLUMNS bilan bir xil tartib (issue'da yo'q ustunlar bo'sh qoladi)
+HEADERS = [
+    'Key', 'Sprint', 'Summary', 'Description', 'Type', 'Status', 'Priority',
+    'Assignee', 'Reporter', 'Story Points', 'Created Date', 'Resolved Date',
+    'Added to Sprint', 'PR Status', 'PR Count', 'PR Last Updated',
+    'Comment Count', 'Comments', 'Comment Authors', 'Status History',
+    'Time in Each Status', 'Testing Time', 'Return from Test Count',
+    'Return Reasons', 'Labels', 'Components', 'Linked Issues',
+]
+
+
+# ============================================================================
+# WORKBOOK GENERATION
+# ============================================================================
+def generate_workbook(path: str, rows: int, seed: int = 42):
+    """Sintetik sprint workbook (download_file.py kabi oddiy Workbook - sheet dimension yoziladi)"""
+    header_to_field = {}
+    for field, headers, _, _ in ISSUE_COLUMNS:
+        for header in headers:
+            header_to_field[header] = field
+
+    wb = Workbook()
+    ws = wb.active
+    ws.title = 'Sprint Report'
+    ws.append(HEADERS)
+
+    corpus = SyntheticCorpus(seed=seed)
+    for issue in corpus.iter_issues(rows):
+        ws.append([
+            issue.get(header_to_field.get(header), '') if header in header_to_field else ''
+            for header in HEADERS
+        ])
+
+    wb.save(path)
+
+
+# ============================================================================
+# READ METHODS
+# ============================================================================
+def _read_with_cell(path: str, read_only: bool) -> int:
+    """Eski usul: header map + har bir maydon uchun ws.cell()"""
+    wb = load_workbook(path, read_only=read_only, data_only=True)
+    ws = wb.active
+
+    headers = {}
+    for col in range(1, ws.max_column + 1):
+        value = ws.cell(row=1, column=col).value
+        if value:
+            headers[value] = col
+
+    count = 0
+    for row in range(2, ws.max_row + 1):
+        issue = {}
+        for field, names, default, _ in ISSUE_COLUMNS:
+            col = next((headers[n] for n in names if n in headers), None)
+            issue[field] = ws.cell(row=row, column=col).value if col else default
+        if issue['key']:
+            count += 1
+
+    wb.close()
+    return count
+
+
+def read_legacy_full(path: str) -> int:
+    return _read_with_cell(path, read_only=False)
+
+
+def read_legacy_readonly(path: str) -> int:
+    return _read_with_cell(path, read_only=True)
+
+
+def read_streaming(path: str) -> int:
+    count = 0
+    with SprintWorkbookReader(path) as reader:
+        for _ in reader.iter_issues():
+            count += 1
+    return count
+
+
+METHODS = {
+    'legacy_full': read_legacy_full,
+    'legacy_readonly': read_legacy_readonly,
+    'streaming': read_streaming,
+}
+
+
+def measure(method: str, path: str) -> Dict[str, Any]:
+    """
+    Bitta usulni o'lchash
+
+    Vaqt va xotira alohida run'larda: tracemalloc har bir allocation'ni kuzatadi
+    va vaqtni bir necha barobar oshiradi.
+    """
+    start = time.perf_counter()
+    count = METHODS[method](path)
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    METHODS[method](path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'issues': count,
+        'seconds': round(seconds, 4),
+        'rows_per_s': round(count / seconds, 1) if seconds > 0 else None,
+        'peak_mb': round(peak / (1024 * 1024), 2),
+    }
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Sprint workbook reader benchmark")
+    parser.add_argument('--rows', type=int, default=10000, help="Workbook qatorlar soni")
+    parser.add_argument('--methods', default=','.join(ALL_METHODS),
+                        help=f"Vergul bilan: {','.join(ALL_METHODS)}")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--workbook', help="Tayyor workbook (default: vaqtincha yaratiladi)")
+    parser.add_argument('--output-dir', default=os.path.join(os.getenv('DATA_DIR', './data'), 'benchmarks'))
+    args = parser.parse_args(argv)
+
+    methods = [m.strip() for m in args.methods.split(',') if m.strip()]
+    unknown = [m for m in methods if m not in METHODS]
+    if unknown:
+        print(f"❌ Noma'lum usul: {', '.join(unknown)}")
+        return 2
+
+    tmp_dir = None
+    path = args.workbook
+    if not path:
+        tmp_dir = tempfile.mkdtemp(prefix='bench_wb_')
+        path = os.path.join(tmp_dir, f"DEV_Sprint_9999_Bench_{args.rows}.xlsx")
+        print(f"📝 Workbook yaratilmoqda: {args.rows} qator...")
+        generate_workbook(path, args.rows, seed=args.seed)
+
+    file_size_mb = os.path.getsize(path) / (1024 * 1024)
+    print(f"📂 {path} ({file_size_mb:.1f} MB)\n")
+
+    results = {}
+    try:
+        for method in methods:
+            print(f"⏱️  {method}...", flush=True)
+            results[method] = measure(method, path)
+    finally:
+        if tmp_dir:
+            os.remove(path)
+            os.rmdir(tmp_dir)
+
+    print(f"\n{'method':<18}{'issues':>8}{'seconds':>10}{'rows/s':>12}{'peak MB':>10}")
+    print("-" * 58)
+    for method, r in results.items():
+        print(f"{method:<18}{r['issues']:>8}{r['seconds']:>10.2f}{r['rows_per_s'] or 0:>12.0f}{r['peak_mb']:>10.1f}")
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    commit = get_git_commit()
+    out_path = os.path.join(
+        args.output_dir,
+        f"bench_workbook_{args.rows}_{commit}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    with open(out_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'benchmark': 'workbook_reader',
+            'commit': commit,
+            'rows': args.rows,
+            'file_size_mb': round(file_size_mb, 2),
+            'results': results,
+        }, f, ensure_ascii=False, indent=2)
+
+    print(f"\n💾 {out_path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
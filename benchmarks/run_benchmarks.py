@@ -0,0 +1,337 @@
+# benchmarks/run_benchmarks.py
+"""
+Chunking va Ingest Benchmark
+
+Hot path'larni alohida o'lchaydi:
+    - chunking:        ChunkingHelper.create_chunks
+    - embedding:       EmbeddingHelper.encode_chunks
+    - weighting:       WeightingHelper.weight_issues
+    - vectordb_write:  VectorDBHelper.add_issues_batch_with_chunks
+    - vectordb_search: VectorDBHelper.search_with_chunks
+
+Natija JSON faylga yoziladi (commit hash bilan) - commitlar orasidagi
+regressiyalarni --compare bilan ko'rish mumkin.
+
+Usage:
+    python -m benchmarks.run_benchmarks --scale 10k
+    python -m benchmarks.run_benchmarks --scale 1k --stages chunking,weighting
+    python -m benchmarks.run_benchmarks --scale 10k --compare data/benchmarks/bench_10k_abc1234.json
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from dotenv import load_dotenv
+
+from benchmarks.synthetic_corpus import SyntheticCorpus, SCALES
+from utils.chunking_helper import ChunkingHelper
+from utils.ingest_pipeline import build_issue_metadata
+from utils.weighting_helper import WeightingHelper, EMBEDDING_DIM
+
+load_dotenv()
+
+ALL_STAGES = ['chunking', 'embedding', 'weighting', 'vectordb_write', 'vectordb_search']
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+class StageTimer:
+    """Bitta stage uchun vaqt va element sonini yig'ish"""
+
+    def __init__(self, name: str, unit: str):
+        self.name = name
+        self.unit = unit
+        self.seconds = 0.0
+        self.items = 0
+
+    def measure(self, func, *args, items: int = 1, **kwargs):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        self.seconds += time.perf_counter() - start
+        self.items += items
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'unit': self.unit,
+            'items': self.items,
+            'seconds': round(self.seconds, 6),
+            'per_item_ms': round(self.seconds / self.items * 1000, 6) if self.items else None,
+            'throughput_per_s': round(self.items / self.seconds, 2) if self.seconds > 0 else None,
+        }
+
+
+def get_git_commit() -> str:
+    """Joriy commit hash (qisqa)"""
+    try:
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=root, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return 'unknown'
+
+
+def random_unit_vectors(rng: np.random.Generator, n: int, dim: int = EMBEDDING_DIM) -> np.ndarray:
+    """Embedding o'rniga ishlatiladigan tasodifiy normallashtirilgan vektorlar"""
+    vectors = rng.standard_normal((n, dim)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+def run_benchmark(
+        scale: str,
+        stages: List[str],
+        batch_size: int = 1000,
+        embed_limit: int = 2000,
+        search_queries: int = 100,
+        seed: int = 42,
+        max_chunk_length: int = 1500
+) -> Dict[str, Any]:
+    """
+    Benchmark ishga tushirish
+
+    Issue'lar batch'lab generatsiya qilinadi - 100k da ham xotira tekis qoladi.
+    Embedding faqat embed_limit ta chunk uchun real model bilan o'lchanadi
+    (CPU da e5-large 100k issue uchun soatlab ishlaydi); qolgan stage'lar
+    uchun tasodifiy vektorlar ishlatiladi.
+    """
+    n_issues = SCALES[scale]
+    corpus = SyntheticCorpus(seed=seed)
+    chunking_helper = ChunkingHelper(max_chunk_length=max_chunk_length)
+    rng = np.random.default_rng(seed)
+
+    timers = {
+        'chunking': StageTimer('chunking', 'issue'),
+        'embedding': StageTimer('embedding', 'chunk'),
+        'weighting': StageTimer('weighting', 'issue'),
+        'vectordb_write': StageTimer('vectordb_write', 'issue'),
+        'vectordb_search': StageTimer('vectordb_search', 'query'),
+    }
+
+    embedding_helper = None
+    if 'embedding' in stages:
+        from utils.embedding_helper import EmbeddingHelper
+        embedding_helper = EmbeddingHelper()
+
+    vectordb_helper = None
+    tmp_dir = None
+    if 'vectordb_write' in stages or 'vectordb_search' in stages:
+        from utils.vectordb_helper import VectorDBHelper
+        tmp_dir = tempfile.mkdtemp(prefix='bench_vectordb_')
+        vectordb_helper = VectorDBHelper(db_path=tmp_dir)
+
+    # Embedding matritsasi pool - weighting va write uchun qayta ishlatiladi
+    vector_pool = random_unit_vectors(rng, 4096)
+
+    total_chunks = 0
+    chunk_types: Dict[str, int] = {}
+    embedded_chunks = 0
+
+    print(f"📊 Scale: {scale} ({n_issues:,} issue), batch: {batch_size}")
+
+    for batch_start in range(0, n_issues, batch_size):
+        count = min(batch_size, n_issues - batch_start)
+        issues = list(corpus.iter_issues(count, start=batch_start))
+
+        # 1. CHUNKING
+        all_chunks_data = timers['chunking'].measure(
+            lambda: [chunking_helper.create_chunks(issue) for issue in issues],
+            items=count
+        )
+        flat_chunks = [chunk for issue_chunks in all_chunks_data for chunk in issue_chunks]
+        total_chunks += len(flat_chunks)
+        for chunk in flat_chunks:
+            chunk_types[chunk['type']] = chunk_types.get(chunk['type'], 0) + 1
+
+        # 2. EMBEDDING (limit bilan)
+        if embedding_helper is not None and embedded_chunks < embed_limit:
+            to_embed = flat_chunks[:embed_limit - embedded_chunks]
+            timers['embedding'].measure(
+                embedding_helper.encode_chunks, to_embed, show_progress=False,
+                items=len(to_embed)
+            )
+            embedded_chunks += len(to_embed)
+
+        # Qolgan stage'lar uchun vektorlar
+        idx = np.arange(len(flat_chunks)) % len(vector_pool)
+        flat_embeddings = vector_pool[idx]
+
+        # 3. WEIGHTING
+        weighted = None
+        if 'weighting' in stages or vectordb_helper is not None:
+            weighted = timers['weighting'].measure(
+                WeightingHelper.weight_issues, all_chunks_data, flat_embeddings,
+                items=count
+            )
+
+        # 4. VECTORDB WRITE
+        if vectordb_helper is not None:
+            keys = [issue['key'] for issue in issues]
+            full_texts = [chunking_helper.create_full_text_for_backward_compatibility(i) for i in issues]
+            metadatas = [build_issue_metadata(i) for i in issues]
+            timers['vectordb_write'].measure(
+                vectordb_helper.add_issues_batch_with_chunks,
+                keys=keys,
+                weighted_embeddings=weighted,
+                full_texts=full_texts,
+                metadatas=metadatas,
+                all_chunks_data=all_chunks_data,
+                items=count
+            )
+
+        done = batch_start + count
+        print(f"   ⏳ {done:,}/{n_issues:,} issue", end='\r')
+
+    print()
+
+    # 5. VECTORDB SEARCH
+    if 'vectordb_search' in stages and vectordb_helper is not None:
+        queries = random_unit_vectors(rng, search_queries)
+        for query in queries:
+            timers['vectordb_search'].measure(
+                vectordb_helper.search_with_chunks, query.tolist(), n_results=20
+            )
+
+    if tmp_dir:
+        vectordb_helper = None
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return {
+        'meta': {
+            'commit': get_git_commit(),
+            'timestamp': datetime.now().isoformat(),
+            'scale': scale,
+            'issues': n_issues,
+            'seed': seed,
+            'batch_size': batch_size,
+            'embed_limit': embed_limit,
+            'max_chunk_length': max_chunk_length,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+        },
+        'corpus': {
+            'chunks': total_chunks,
+            'chunks_per_issue': round(total_chunks / n_issues, 3) if n_issues else 0,
+            'chunk_types': chunk_types,
+        },
+        'stages': {name: timers[name].to_dict() for name in stages},
+    }
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Ikki natijani solishtirish
+
+    Returns:
+        Regressiya bo'lgan stage'lar ro'yxati
+    """
+    regressions = []
+    print()
+    print(f"📈 SOLISHTIRISH: {baseline['meta']['commit']} → {current['meta']['commit']}")
+    print(f"{'Stage':<18} {'Baseline ms':>14} {'Current ms':>14} {'Delta':>10}")
+    print("-" * 60)
+
+    for name, stage in current['stages'].items():
+        base_stage = baseline.get('stages', {}).get(name)
+        if not base_stage or not base_stage.get('per_item_ms') or not stage.get('per_item_ms'):
+            continue
+
+        delta = (stage['per_item_ms'] - base_stage['per_item_ms']) / base_stage['per_item_ms']
+        marker = ''
+        if delta > threshold:
+            marker = ' ⚠️'
+            regressions.append(name)
+
+        print(f"{name:<18} {base_stage['per_item_ms']:>14.4f} {stage['per_item_ms']:>14.4f} "
+              f"{delta * 100:>9.1f}%{marker}")
+
+    return regressions
+
+
+def print_results(results: Dict[str, Any]):
+    print()
+    print("=" * 80)
+    print(f"⏱️  NATIJA ({results['meta']['scale']}, commit {results['meta']['commit']})")
+    print("=" * 80)
+    print(f"📦 Chunks: {results['corpus']['chunks']:,} ({results['corpus']['chunks_per_issue']} per issue)")
+    print()
+    print(f"{'Stage':<18} {'Items':>10} {'Seconds':>10} {'ms/item':>12} {'items/s':>12}")
+    print("-" * 66)
+    for name, stage in results['stages'].items():
+        per_item = f"{stage['per_item_ms']:.4f}" if stage['per_item_ms'] is not None else '-'
+        throughput = f"{stage['throughput_per_s']:.1f}" if stage['throughput_per_s'] is not None else '-'
+        print(f"{name:<18} {stage['items']:>10,} {stage['seconds']:>10.3f} {per_item:>12} {throughput:>12}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Chunking va ingest benchmark")
+    parser.add_argument('--scale', choices=list(SCALES.keys()), default='1k')
+    parser.add_argument('--stages', default=','.join(ALL_STAGES),
+                        help=f"Vergul bilan: {','.join(ALL_STAGES)}")
+    parser.add_argument('--batch-size', type=int, default=1000, help="Bir batch dagi issue soni")
+    parser.add_argument('--embed-limit', type=int, default=2000, help="Real model bilan encode qilinadigan chunk soni")
+    parser.add_argument('--search-queries', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output-dir', default=os.path.join(os.getenv('DATA_DIR', './data'), 'benchmarks'))
+    parser.add_argument('--compare', help="Oldingi natija JSON fayli")
+    parser.add_argument('--threshold', type=float, default=0.10, help="Regressiya chegarasi (0.10 = 10%%)")
+    args = parser.parse_args(argv)
+
+    stages = [s.strip() for s in args.stages.split(',') if s.strip()]
+    unknown = [s for s in stages if s not in ALL_STAGES]
+    if unknown:
+        parser.error(f"Noma'lum stage: {', '.join(unknown)}")
+
+    print("=" * 80)
+    print("⏱️  CHUNKING VA INGEST BENCHMARK")
+    print("=" * 80)
+
+    results = run_benchmark(
+        scale=args.scale,
+        stages=stages,
+        batch_size=args.batch_size,
+        embed_limit=args.embed_limit,
+        search_queries=args.search_queries,
+        seed=args.seed,
+    )
+
+    print_results(results)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    filename = f"bench_{args.scale}_{results['meta']['commit']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output_path = os.path.join(args.output_dir, filename)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    print()
+    print(f"📝 Natija yozildi: {output_path}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_results(results, baseline, args.threshold)
+        if regressions:
+            print()
+            print(f"⚠️  Regressiya: {', '.join(regressions)}")
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,252 @@
+# benchmarks/synthetic_corpus.py
+"""
+Synthetic JIRA corpus - benchmark uchun
+
+O'zbek / Rus / Ingliz tillarida realistik issue'lar generatsiya qiladi:
+description, comments, return reasons, status history va boshqa ustunlar.
+Natija 2_load_sprints.py dagi issue_data formatiga to'liq mos keladi.
+
+Generatsiya deterministik (seed bilan) - har bir commit bir xil
+korpus ustida o'lchanadi.
+"""
+import random
+from datetime import datetime, timedelta
+from typing import Dict, Any, Iterator, List
+
+# Benchmark o'lchamlari
+SCALES = {
+    '1k': 1_000,
+    '10k': 10_000,
+    '100k': 100_000,
+}
+
+LANGUAGES = ['uz', 'ru', 'en']
+
+# Tilga qarab matn bo'laklari
+SUMMARIES = {
+    'uz': [
+        "{module} sahifasida xatolik",
+        "{module} modulida hisobot noto'g'ri chiqmoqda",
+        "{module}: saqlash tugmasi ishlamayapti",
+        "{module} bo'limiga yangi filtr qo'shish",
+        "{module} ro'yxatida sahifalash buzilgan",
+    ],
+    'ru': [
+        "Ошибка на странице {module}",
+        "{module}: неверный расчёт итоговой суммы",
+        "Не работает кнопка сохранения в {module}",
+        "Добавить экспорт в Excel для {module}",
+        "{module}: зависает загрузка списка",
+    ],
+    'en': [
+        "Error on {module} page",
+        "{module}: totals are calculated incorrectly",
+        "Save button does not work in {module}",
+        "Add Excel export to {module}",
+        "{module} list pagination is broken",
+    ],
+}
+
+DESCRIPTION_SENTENCES = {
+    'uz': [
+        "Foydalanuvchi {module} sahifasini ochganda ma'lumotlar yuklanmayapti.",
+        "Filtr qo'llanganda ro'yxat bo'sh qaytmoqda.",
+        "Hisobotdagi jami summa buxgalteriya bilan mos kelmayapti.",
+        "Sahifa yangilanganda tanlangan qiymatlar yo'qolib qolmoqda.",
+        "Mobil versiyada tugmalar ekrandan chiqib ketmoqda.",
+        "Eksport qilingan faylda sana formati noto'g'ri.",
+    ],
+    'ru': [
+        "При открытии страницы {module} данные не загружаются.",
+        "После применения фильтра список возвращается пустым.",
+        "Итоговая сумма в отчёте не совпадает с бухгалтерией.",
+        "При обновлении страницы выбранные значения сбрасываются.",
+        "В мобильной версии кнопки выходят за пределы экрана.",
+        "В экспортированном файле неверный формат даты.",
+    ],
+    'en': [
+        "When the user opens the {module} page the data is not loaded.",
+        "After applying a filter the list comes back empty.",
+        "The report total does not match the accounting figures.",
+        "Selected values are lost after the page is refreshed.",
+        "On mobile the buttons overflow the screen.",
+        "The exported file has a wrong date format.",
+    ],
+}
+
+ROOT_CAUSES = {
+    'uz': "Sabab: {module} servisida null qiymat tekshirilmagan, shu sababli so'rov xatolik bilan tugayapti. "
+          "Muammo tranzaksiya yopilmasdan oldin kesh yangilanishida.",
+    'ru': "Причина: в сервисе {module} не проверялось значение null, из-за этого запрос падал с ошибкой. "
+          "Проблема в том, что кэш обновлялся до закрытия транзакции.",
+    'en': "Root cause: the {module} service did not check for null values, because of that the request failed. "
+          "The problem was that the cache was refreshed before the transaction was committed.",
+}
+
+SOLUTIONS = {
+    'uz': "Yechim: null tekshiruvi qo'shildi va kesh tranzaksiyadan keyin yangilanadigan qilib tuzatildi. "
+          "{module} uchun regression testlar yangilandi.",
+    'ru': "Решение: добавлена проверка на null, кэш теперь обновляется после коммита. "
+          "Исправлено и обновлено покрытие тестами для {module}.",
+    'en': "Solution: added a null check and fixed by refreshing the cache after commit. "
+          "Updated regression tests for {module}.",
+}
+
+COMMENTS = {
+    'uz': [
+        "Tekshirdim, test serverda qayta takrorlanmoqda.",
+        "PR tayyor, review qilib bering.",
+        "QA: mobil versiyada ham tekshirish kerak.",
+        "Bu task oldingi sprintdagi bug bilan bog'liq.",
+    ],
+    'ru': [
+        "Проверил, на тестовом сервере воспроизводится.",
+        "PR готов, посмотрите пожалуйста.",
+        "QA: нужно проверить также мобильную версию.",
+        "Задача связана с багом из прошлого спринта.",
+    ],
+    'en': [
+        "Checked, reproducible on the test server.",
+        "PR is ready, please review.",
+        "QA: mobile version should be checked as well.",
+        "This task is related to the bug from the previous sprint.",
+    ],
+}
+
+RETURN_REASONS = {
+    'uz': "Testdan qaytdi: {module} sahifasida filtr hali ham noto'g'ri ishlayapti",
+    'ru': "Возврат с теста: на странице {module} фильтр всё ещё работает неверно",
+    'en': "Returned from testing: filter on {module} page still works incorrectly",
+}
+
+MODULES = [
+    'Orders', 'Invoices', 'Warehouse', 'Payroll', 'CRM', 'Reports',
+    'Cashbox', 'Deals', 'Clients', 'Products', 'Price list', 'Dashboard',
+]
+DEVELOPERS = [
+    'Aziz Karimov', 'Dilshod Rahimov', 'Olga Petrova', 'Sardor Aliyev',
+    'Ivan Smirnov', 'Nodira Yusupova', 'Timur Xasanov', 'Elena Kim',
+]
+TESTERS = ['Malika Tursunova', 'Anna Volkova', 'Bekzod Nazarov']
+ISSUE_TYPES = ['Bug', 'Task', 'Story', 'Bug', 'Task']
+PRIORITIES = ['Highest', 'High', 'Medium', 'Medium', 'Low']
+STATUSES = ['CLOSED', 'Closed', 'Done', 'TESTING', 'In Progress']
+COMPONENTS = ['Backend', 'Frontend', 'Mobile', 'Reports', 'Integration']
+LABELS = ['regression', 'hotfix', 'ui', 'performance', 'customer']
+STATUS_FLOW = ['Open', 'In Progress', 'Ready to Test', 'TESTING', 'NEED CLARIFICATION/RETURN TEST']
+
+
+class SyntheticCorpus:
+    """Deterministik synthetic issue generator"""
+
+    def __init__(self, seed: int = 42, project_key: str = 'DEV', sprint_ids: List[int] = None):
+        self.seed = seed
+        self.project_key = project_key
+        self.sprint_ids = sprint_ids or [2148, 2351, 2352, 2379, 2775, 2842, 3014]
+
+    def iter_issues(self, count: int, start: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Issue'larni birma-bir generatsiya qilish (xotira tejamli)
+
+        Har bir issue o'z seed'i bilan yaratiladi, shuning uchun
+        istalgan oraliqni alohida generatsiya qilish mumkin.
+        """
+        for idx in range(start, start + count):
+            yield self.make_issue(idx)
+
+    def make_issue(self, idx: int) -> Dict[str, Any]:
+        """Bitta issue - 2_load_sprints.py issue_data formatida"""
+        rng = random.Random(self.seed * 1_000_003 + idx)
+
+        lang = rng.choice(LANGUAGES)
+        module = rng.choice(MODULES)
+        issue_type = rng.choice(ISSUE_TYPES)
+        assignee = rng.choice(DEVELOPERS)
+        status = rng.choice(STATUSES)
+
+        created = datetime(2025, 1, 1) + timedelta(days=rng.randint(0, 330), minutes=rng.randint(0, 1440))
+        resolved = created + timedelta(days=rng.randint(1, 20)) if status in ('CLOSED', 'Closed', 'Done') else None
+
+        # Description - qisqa yoki uzun (uzunlari chunking'ni ishlatadi)
+        sentences = DESCRIPTION_SENTENCES[lang]
+        n_sentences = rng.choice([2, 3, 5, 12, 25])
+        description = ' '.join(rng.choice(sentences) for _ in range(n_sentences)).format(module=module)
+        if issue_type == 'Bug' and rng.random() < 0.4:
+            description += '\n\n' + ROOT_CAUSES[lang].format(module=module)
+
+        # Comments
+        comment_parts = []
+        comment_authors = []
+        for c_idx in range(rng.randint(0, 6)):
+            author = rng.choice(DEVELOPERS + TESTERS)
+            date = (created + timedelta(days=c_idx)).strftime('%Y-%m-%d')
+            comment_parts.append(f"[{date}] {rng.choice(COMMENTS[lang])}")
+            if author not in comment_authors:
+                comment_authors.append(author)
+        if comment_parts and issue_type == 'Bug' and rng.random() < 0.3:
+            comment_parts.append(f"[{created.strftime('%Y-%m-%d')}] " + SOLUTIONS[lang].format(module=module))
+
+        # Status history va returns
+        history, return_reasons, return_count, testing_hours = self._status_history(rng, created, lang, module)
+
+        story_points = rng.choice(['', 1, 2, 3, 5, 8])
+        pr_status = rng.choice(['', 'MERGED', 'OPEN', 'MERGED'])
+        sprint_id = rng.choice(self.sprint_ids)
+
+        return {
+            'key': f"{self.project_key}-{10000 + idx}",
+            'summary': rng.choice(SUMMARIES[lang]).format(module=module),
+            'description': description,
+            'type': issue_type,
+            'status': status,
+            'assignee': assignee,
+            'reporter': rng.choice(TESTERS + DEVELOPERS),
+            'priority': rng.choice(PRIORITIES),
+            'story_points': story_points,
+            'created_date': created.strftime('%Y-%m-%d'),
+            'resolved_date': resolved.strftime('%Y-%m-%d') if resolved else '',
+            'comments': '\n\n'.join(comment_parts),
+            'comment_authors': ', '.join(comment_authors),
+            'return_count': return_count,
+            'return_reasons': return_reasons,
+            'status_history': history,
+            'testing_time': f"{testing_hours:.1f}h" if testing_hours > 0 else '',
+            'labels': ', '.join(rng.sample(LABELS, rng.randint(0, 2))),
+            'components': ', '.join(rng.sample(COMPONENTS, rng.randint(0, 2))),
+            'linked_issues': '',
+            'pr_status': pr_status,
+            'pr_count': 1 if pr_status else 0,
+            'pr_last_updated': (created + timedelta(days=2)).strftime('%Y-%m-%d %H:%M') if pr_status else '',
+            'sprint_id': str(sprint_id),
+        }
+
+    @staticmethod
+    def _status_history(rng: random.Random, created: datetime, lang: str, module: str):
+        """Status transitionlar, return reasons va testing vaqti"""
+        lines = []
+        reasons = []
+        return_count = 0
+        testing_hours = 0.0
+        current = created
+        prev_status = 'Open'
+
+        for _ in range(rng.randint(2, 9)):
+            step = timedelta(hours=rng.randint(1, 72))
+            next_status = rng.choice(STATUS_FLOW[1:])
+            current += step
+
+            if prev_status in ('TESTING', 'Ready to Test'):
+                testing_hours += step.total_seconds() / 3600
+
+            stamp = current.strftime('%Y-%m-%d %H:%M')
+            lines.append(f"{stamp}: {prev_status} → {next_status}")
+
+            if prev_status == 'TESTING' and next_status == 'NEED CLARIFICATION/RETURN TEST':
+                return_count += 1
+                reasons.append(
+                    f"Return #{return_count} [{stamp}]: {RETURN_REASONS[lang].format(module=module)} "
+                    f"(by {rng.choice(TESTERS)})"
+                )
+            prev_status = next_status
+
+        return '\n'.join(lines), '\n'.join(reasons), return_count, testing_hours
@@ -6,19 +6,38 @@ Yangi ustunlar:
 ✅ Testing Return Who, Testing Return When
 """
 
+import os
+import sys
+import time
+import argparse
+import threading
+import multiprocessing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from jira import JIRA
 from dotenv import load_dotenv
-import os
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.utils import get_column_letter
 from datetime import datetime
-from collections import defaultdict
-from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from tqdm import tqdm
 import logging
 import json
 import re
 
+from utils.jira.field_sets import REPORT
+from utils.jira.issue_archive import JiraIssueArchive
+from utils.jira.issue_fetcher import JiraIssueFetcher, RateLimiter
+from utils.jira.issue_store import JiraIssueStore
+from utils.jira.issue_timeline import get_timeline
+from utils.jira.sprint_catalog import JiraSprintCatalog
+from utils.jira.payload_log import attach_payload_stats
+from utils.sprint_snapshot import write_sprint_snapshot, snapshot_path
+from utils.sprint_statistics import SprintStatistics, STATS_REPORT_COLUMNS
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -92,6 +111,9 @@ ACTIVE_COLUMNS = [
     'Linked Issues',
 ]
 
+# Statistika ham shu qatorlardan hisoblanadi - ACTIVE_COLUMNS'da yo'q ustunlar qo'shiladi
+REPORT_COLUMNS = ACTIVE_COLUMNS + [column for column in STATS_REPORT_COLUMNS if column not in ACTIVE_COLUMNS]
+
 COLUMN_WIDTHS = {
     'Key': 12,
     'Sprint': 25,
@@ -202,27 +224,8 @@ def extract_pr_info(issue):
 # ============================================================================
 def extract_testing_returns_detailed(issue):
     """Testing dan qaytganlar - kim va qachon"""
-    who_list = []
-    when_list = []
-
-    try:
-        if not hasattr(issue, 'changelog') or not issue.changelog:
-            return '', ''
-
-        for history in issue.changelog.histories:
-            for item in history.items:
-                if item.field == 'status':
-                    if item.fromString in Config.TESTING_STATUSES and item.toString == Config.RETURN_STATUS:
-                        date = history.created[:16].replace('T', ' ')
-                        who = safe_get(history.author, 'displayName', 'Unknown') if hasattr(history,
-                                                                                            'author') else 'Unknown'
-
-                        when_list.append(date)
-                        who_list.append(who)
-    except:
-        pass
-
-    return '\n'.join(who_list), '\n'.join(when_list)
+    returns = get_timeline(issue).returns(Config.TESTING_STATUSES, Config.RETURN_STATUS)
+    return '\n'.join(change.author for change in returns), '\n'.join(change.minute for change in returns)
 
 
 # ============================================================================
@@ -232,10 +235,9 @@ def extract_key(issue, sprint_info_map):
     return issue.key
 
 
-def extract_sprint(issue, sprint_info_map):
-    """Sprint va sprint qo'shilgan sana"""
+def extract_sprint_names(issue, sprint_info_map):
+    """Sprint nomlari (tanlangan sprintlar - Config.SPRINT_IDS, main() belgilaydi)"""
     found_sprints = []
-    sprint_added_date = ''
 
     try:
         if hasattr(issue.fields, Config.SPRINT_FIELD):
@@ -245,29 +247,24 @@ def extract_sprint(issue, sprint_info_map):
                     if hasattr(sprint_obj, 'id'):
                         obj_id = getattr(sprint_obj, 'id')
                         if obj_id in Config.SPRINT_IDS:
-                            sprint_name = sprint_info_map.get(obj_id, {}).get('name', f'Sprint {obj_id}')
+                            sprint_name = sprint_info_map.get(obj_id, {}).get(
+                                'name', getattr(sprint_obj, 'name', None) or f'Sprint {obj_id}')
                             if sprint_name not in found_sprints:
                                 found_sprints.append(sprint_name)
     except:
         pass
 
-    try:
-        if hasattr(issue, 'changelog') and issue.changelog:
-            for history in issue.changelog.histories:
-                for item in history.items:
-                    if item.field == 'Sprint' and not sprint_added_date:
-                        sprint_added_date = history.created[:10]
-                        break
-    except:
-        pass
+    return ', '.join(found_sprints or ['Unknown'])
 
-    if not found_sprints:
-        found_sprints = ['Unknown']
 
-    if not sprint_added_date:
-        sprint_added_date = safe_date(issue.fields.created)
+def extract_sprint_added(issue, sprint_info_map):
+    """Sprint qo'shilgan sana (birinchi Sprint o'zgarishi, bo'lmasa yaratilgan sana)"""
+    return get_timeline(issue).sprint_added or safe_date(issue.fields.created)
 
-    return ', '.join(found_sprints), sprint_added_date
+
+def extract_sprint(issue, sprint_info_map):
+    """Sprint va sprint qo'shilgan sana"""
+    return extract_sprint_names(issue, sprint_info_map), extract_sprint_added(issue, sprint_info_map)
 
 
 def extract_summary(issue, sprint_info_map):
@@ -370,162 +367,37 @@ def extract_comment_authors(issue, sprint_info_map):
 
 
 def extract_status_history(issue, sprint_info_map):
-    history = []
-    try:
-        if hasattr(issue, 'changelog') and issue.changelog:
-            for h in issue.changelog.histories:
-                for item in h.items:
-                    if item.field == 'status':
-                        date = h.created[:16].replace('T', ' ')
-                        from_status = item.fromString or 'None'
-                        to_status = item.toString or 'None'
-                        history.append(f"{date}: {from_status} → {to_status}")
-    except:
-        pass
-    return '\n'.join(history)
+    return '\n'.join(
+        f"{change.minute}: {change.from_status} → {change.to_status}"
+        for change in get_timeline(issue).status_changes
+    )
 
 
 def extract_time_in_each_status(issue, sprint_info_map):
-    status_durations = {}
-
-    try:
-        if not hasattr(issue, 'changelog') or not issue.changelog:
-            return ''
-
-        status_changes = []
-        for history in issue.changelog.histories:
-            for item in history.items:
-                if item.field == 'status':
-                    status_changes.append({
-                        'date': history.created,
-                        'from': item.fromString or 'None',
-                        'to': item.toString or 'None'
-                    })
-
-        if not status_changes:
-            return ''
-
-        # Boshlang'ich status
-        initial_status = status_changes[0]['from']
-        initial_date = datetime.fromisoformat(status_changes[0]['date'].replace('Z', '+00:00'))
-        created_date = datetime.fromisoformat(issue.fields.created.replace('Z', '+00:00'))
-        duration = (initial_date - created_date).total_seconds() / 3600
-        status_durations[initial_status] = duration
-
-        # Har bir status
-        for i in range(len(status_changes)):
-            current_status = status_changes[i]['to']
-            current_date = datetime.fromisoformat(status_changes[i]['date'].replace('Z', '+00:00'))
-
-            if i + 1 < len(status_changes):
-                next_date = datetime.fromisoformat(status_changes[i + 1]['date'].replace('Z', '+00:00'))
-            else:
-                if issue.fields.resolutiondate:
-                    next_date = datetime.fromisoformat(issue.fields.resolutiondate.replace('Z', '+00:00'))
-                else:
-                    next_date = datetime.now(current_date.tzinfo)
+    status_durations = get_timeline(issue).time_in_status()
 
-            duration = (next_date - current_date).total_seconds() / 3600
+    result = []
+    for status, hours in sorted(status_durations.items(), key=lambda x: x[1], reverse=True):
+        result.append(f"{status}: {hours:.1f}h ({hours / 24:.1f}d)")
 
-            if current_status in status_durations:
-                status_durations[current_status] += duration
-            else:
-                status_durations[current_status] = duration
-
-        # Format
-        result = []
-        for status, hours in sorted(status_durations.items(), key=lambda x: x[1], reverse=True):
-            result.append(f"{status}: {hours:.1f}h ({hours / 24:.1f}d)")
-
-        return '\n'.join(result)
-    except:
-        return ''
+    return '\n'.join(result)
 
 
 def extract_testing_time(issue, sprint_info_map):
-    total_hours = 0
-
-    try:
-        if not hasattr(issue, 'changelog') or not issue.changelog:
-            return ''
-
-        status_changes = []
-        for history in issue.changelog.histories:
-            for item in history.items:
-                if item.field == 'status':
-                    status_changes.append({
-                        'date': history.created,
-                        'to': item.toString or 'None'
-                    })
-
-        for i, change in enumerate(status_changes):
-            if change['to'] in Config.TESTING_STATUSES:
-                start = datetime.fromisoformat(change['date'].replace('Z', '+00:00'))
-
-                if i + 1 < len(status_changes):
-                    end = datetime.fromisoformat(status_changes[i + 1]['date'].replace('Z', '+00:00'))
-                else:
-                    if issue.fields.resolutiondate:
-                        end = datetime.fromisoformat(issue.fields.resolutiondate.replace('Z', '+00:00'))
-                    else:
-                        end = datetime.now(start.tzinfo)
-
-                hours = (end - start).total_seconds() / 3600
-                total_hours += hours
-    except:
-        pass
-
+    total_hours = get_timeline(issue).testing_hours(Config.TESTING_STATUSES)
     return f"{total_hours:.1f}h" if total_hours > 0 else ''
 
 
 def extract_return_count(issue, sprint_info_map):
-    return_count = 0
-
-    try:
-        if not hasattr(issue, 'changelog') or not issue.changelog:
-            return 0
-
-        for history in issue.changelog.histories:
-            for item in history.items:
-                if item.field == 'status':
-                    if item.fromString in Config.TESTING_STATUSES and item.toString == Config.RETURN_STATUS:
-                        return_count += 1
-    except:
-        pass
-
-    return return_count
+    return len(get_timeline(issue).returns(Config.TESTING_STATUSES, Config.RETURN_STATUS))
 
 
 def extract_return_reasons(issue, sprint_info_map):
-    return_reasons = []
-    return_count = 0
-
-    try:
-        if not hasattr(issue, 'changelog') or not issue.changelog:
-            return ''
-
-        status_changes = []
-        for history in issue.changelog.histories:
-            for item in history.items:
-                if item.field == 'status':
-                    status_changes.append({
-                        'date': history.created[:16].replace('T', ' '),
-                        'from': item.fromString or 'None',
-                        'to': item.toString or 'None',
-                        'author': safe_get(history.author, 'displayName', 'Unknown') if hasattr(history,
-                                                                                                'author') else 'Unknown'
-                    })
-
-        for change in status_changes:
-            if change['from'] in Config.TESTING_STATUSES and change['to'] == Config.RETURN_STATUS:
-                return_count += 1
-                return_reasons.append(
-                    f"Return #{return_count} [{change['date']}]: {change['from']} → {change['to']} (by {change['author']})"
-                )
-    except:
-        pass
-
-    return '\n'.join(return_reasons)
+    returns = get_timeline(issue).returns(Config.TESTING_STATUSES, Config.RETURN_STATUS)
+    return '\n'.join(
+        f"Return #{number} [{change.minute}]: {change.from_status} → {change.to_status} (by {change.author})"
+        for number, change in enumerate(returns, 1)
+    )
 
 
 def extract_testing_return_who(issue, sprint_info_map):
@@ -559,7 +431,7 @@ def extract_linked_issues(issue, sprint_info_map):
 # ============================================================================
 COLUMN_FUNCTIONS = {
     'Key': extract_key,
-    'Sprint': lambda issue, si: extract_sprint(issue, si)[0],
+    'Sprint': extract_sprint_names,
     'Summary': extract_summary,
     'Description': extract_description,
     'Type': extract_type,
@@ -570,7 +442,7 @@ COLUMN_FUNCTIONS = {
     'Story Points': extract_story_points,
     'Created Date': extract_created_date,
     'Resolved Date': extract_resolved_date,
-    'Added to Sprint': lambda issue, si: extract_sprint(issue, si)[1],
+    'Added to Sprint': extract_sprint_added,
     'PR Status': extract_pr_status,
     'PR Count': extract_pr_count,
     'PR Last Updated': extract_pr_last_updated,
@@ -597,6 +469,7 @@ def get_jira_client():
             server=os.getenv('JIRA_SERVER'),
             basic_auth=(os.getenv('JIRA_EMAIL'), os.getenv('JIRA_API_TOKEN'))
         )
+        attach_payload_stats(jira, logger)
         logger.info(f"✅ Jira ga ulandi: {os.getenv('JIRA_SERVER')}")
         return jira
     except Exception as e:
@@ -604,328 +477,678 @@ def get_jira_client():
         raise
 
 
-@lru_cache(maxsize=100)
+_sprint_catalog = None
+_sprint_catalog_lock = threading.Lock()
+
+
+def get_sprint_catalog():
+    """Lokal sprint katalogi (Config.BOARD_ID, process bo'yicha bitta)"""
+    global _sprint_catalog
+    with _sprint_catalog_lock:
+        if _sprint_catalog is None:
+            _sprint_catalog = JiraSprintCatalog(board_id=Config.BOARD_ID)
+        return _sprint_catalog
+
+
+def refresh_sprint_catalog(jira, full=False):
+    """Board sprintlarini katalogga olish (faqat ochiqlari, TTL ichida - so'rovsiz)"""
+    catalog = get_sprint_catalog()
+    try:
+        result = catalog.refresh(jira, full=full)
+    except Exception as e:
+        logger.warning(f"⚠️ Sprint katalogini yangilab bo'lmadi: {e}")
+        return catalog
+
+    if not result['skipped']:
+        logger.info(f"🗂️  Sprint katalogi: {result['discovered']} ta yangi, {result['refreshed']} ta yangilandi "
+                    f"({result['requests']} so'rov, {result['seconds']}s)")
+    return catalog
+
+
+def add_sprint_arguments(parser):
+    """Sprint tanlash argumentlari (download skriptlar va ingest_from_jira)"""
+    parser.add_argument('--sprint-ids', type=int, nargs='+',
+                        help="Sprint ID'lar (default: Config.SPRINT_IDS)")
+    parser.add_argument('--last', type=int,
+                        help="Board'ning oxirgi N ta sprinti (yopilgan + aktiv, katalogdan)")
+    parser.add_argument('--active', action='store_true',
+                        help="Board'ning aktiv sprint(lar)i")
+    parser.add_argument('--refresh-sprints', action='store_true',
+                        help="Sprint katalogini to'liq yangilash (yopilganlar ham)")
+
+
+def resolve_sprint_ids(jira=None, sprint_ids=None, last=None, active=False):
+    """
+    Sprintlar: --sprint-ids > --last N / --active (katalogdan) > Config.SPRINT_IDS
+
+    Args:
+        jira: None - faqat lokal katalog (--from-archive)
+    """
+    if sprint_ids:
+        return list(sprint_ids)
+    if last or active:
+        catalog = refresh_sprint_catalog(jira) if jira is not None else get_sprint_catalog()
+        states = ['active'] if active else ['closed', 'active']
+        return catalog.select(last=last, states=states)
+    return list(getattr(Config, 'SPRINT_IDS', None) or [])
+
+
 def get_sprint_info(jira, sprint_id):
+    """Sprint ma'lumotlari - lokal katalogdan (yopilgan sprint JIRA'dan qayta so'ralmaydi)"""
     try:
-        sprint = jira.sprint(sprint_id)
-        return {
-            'id': sprint_id,
-            'name': sprint.name,
-            'state': sprint.state,
-            'startDate': sprint.startDate[:10] if hasattr(sprint, 'startDate') and sprint.startDate else None,
-            'endDate': sprint.endDate[:10] if hasattr(sprint, 'endDate') and sprint.endDate else None,
-        }
+        info = get_sprint_catalog().sprint_info(jira, sprint_id)
+        if info is not None:
+            return info
     except Exception as e:
         logger.warning(f"Sprint {sprint_id} ma'lumotlarini olishda xatolik: {e}")
-        return {
-            'id': sprint_id,
-            'name': f"Sprint {sprint_id}",
-            'state': 'Unknown',
-            'startDate': None,
-            'endDate': None,
-        }
+    return {
+        'id': sprint_id,
+        'name': f"Sprint {sprint_id}",
+        'state': 'Unknown',
+        'startDate': None,
+        'endDate': None,
+    }
 
 
 # ============================================================================
 # DATA FETCHING
 # ============================================================================
 def fetch_issues(jira, jql):
+    """Hamma issue'lar ro'yxat sifatida (sahifalar parallel - JiraIssueFetcher)"""
     logger.info("📥 Issuelarni yuklamoqda...")
 
-    try:
-        temp = jira.search_issues(jql, maxResults=0)
-        total = temp.total if hasattr(temp, 'total') else 0
-    except:
-        temp = jira.search_issues(jql, maxResults=1)
-        total = temp.total if hasattr(temp, 'total') else 1
+    fetcher = JiraIssueFetcher(jira)
+    all_issues = fetcher.fetch_all(jql, expand=REPORT.expand, fields=REPORT.fields_param)
 
-    logger.info(f"Jami {total} ta issue topildi")
+    logger.info(f"✅ {len(all_issues)} ta issue yuklandi ({fetcher.stats['pages']} sahifa, "
+                f"{fetcher.stats['seconds']}s)")
+    return all_issues
 
-    print("   ⏳ Barcha issuelar yuklanmoqda...")
-    all_issues = jira.search_issues(
-        jql,
-        maxResults=False,
-        expand='changelog,renderedFields'
-    )
 
-    logger.info(f"✅ {len(all_issues)} ta issue yuklandi")
-    return all_issues
+def fetch_report_rows(jira, jql, sprint_info_map, show_progress=True, limiter=None, archive_run=None):
+    """
+    Issue'lar → report qatorlari + statistika, sahifalar kelishi bilan
+
+    Sahifalar parallel olinadi, har bir issue kelgan zahoti ustunlari hisoblanadi
+    va statistikaga qo'shiladi - Issue obyektlari xotirada yig'ilmaydi, CPU ishi
+    tarmoq kutish bilan ustma-ust tushadi.
+
+    Args:
+        show_progress: tqdm (parallel sprintlarda - o'chiq)
+        limiter: Umumiy RateLimiter (bir nechta sprint bir vaqtda yuklanganda)
+        archive_run: ArchiveRun - raw JSON arxivga yoziladi (--from-archive uchun)
+
+    Returns:
+        (rows, stats)
+    """
+    logger.info("📥 Issuelarni yuklamoqda...")
+
+    fetcher = JiraIssueFetcher(jira, limiter=limiter)
+    rows = []
+
+    with tqdm(desc="Yuklash + ustunlar", unit="issue", disable=not show_progress) as pbar:
+        for issue in fetcher.iter_issues(jql, expand=REPORT.expand, fields=REPORT.fields_param):
+            if pbar.total is None and fetcher.stats['total'] is not None:
+                pbar.total = fetcher.stats['total']
+            if archive_run is not None:
+                archive_run.add(issue.raw)
+            rows.append(build_report_row(issue, sprint_info_map))
+            pbar.update(1)
+
+    logger.info(f"✅ {len(rows)} ta issue yuklandi ({fetcher.stats['pages']} sahifa, "
+                f"{fetcher.stats['requests']} so'rov, {fetcher.stats['seconds']}s)")
+    if fetcher.stats['changelogs_completed']:
+        logger.info(f"📜 To'liq changelog: {fetcher.stats['changelogs_completed']} ta issue "
+                    f"({fetcher.changelogs.stats['requests']} so'rov)")
+    return rows, report_statistics(rows)
+
+
+def sync_issue_store(jira, sprint_ids, full=False, project_key=None):
+    """
+    Lokal issue store'ni yangilash (--incremental)
+
+    Store'da yo'q sprintlar to'liq, qolganlari - faqat oxirgi sync'dan beri
+    o'zgargan issue'lar (updated >= watermark).
+
+    Returns:
+        JiraIssueStore
+    """
+    store = JiraIssueStore(sprint_field=Config.SPRINT_FIELD)
+    logger.info(f"🗄️  Issue store: {store.db_path}")
+
+    with tqdm(desc="Store sync", unit="issue") as pbar:
+        def on_page(size, total):
+            pbar.update(size)
+
+        result = store.sync(jira, project_key or Config.PROJECT_KEY, sprint_ids=list(sprint_ids), full=full,
+                            page_callback=on_page)
+
+    if result['full_sprints']:
+        logger.info(f"📥 To'liq yuklandi: {len(result['full_sprints'])} ta sprint, "
+                    f"{result['full_issues']} ta issue")
+    if result['window_minutes'] is not None:
+        logger.info(f"🔄 O'zgarganlar (oxirgi {result['window_minutes']} daqiqa): "
+                    f"{result['changed_issues']} ta issue")
+    logger.info(f"✅ Store sync: {result['seconds']}s, jami {store.count()} ta issue")
+    return store
+
+
+def store_report_rows(store, sprint_id, sprint_info_map, show_progress=True, archive_run=None):
+    """
+    Store'dagi sprint issue'lari → report qatorlari + statistika (JIRA'ga so'rov yo'q)
+
+    Args:
+        sprint_id: Sprint ID yoki ro'yxat
+        archive_run: ArchiveRun - raw JSON arxivga yoziladi
+
+    Returns:
+        (rows, stats)
+    """
+    rows = []
+
+    for issue in tqdm(store.iter_issues(sprint_id=sprint_id), total=store.count(sprint_id),
+                      desc="Ustunlar (store)", unit="issue", disable=not show_progress):
+        if archive_run is not None:
+            archive_run.add(issue.raw)
+        rows.append(build_report_row(issue, sprint_info_map))
+
+    return rows, report_statistics(rows)
 
 
 # ============================================================================
-# EXCEL GENERATION
+# RAW ARXIV - report'larni JIRA'siz qayta yaratish (--from-archive)
 # ============================================================================
-def create_excel_report(issues, sprint_info_map, project_key):
-    logger.info("📄 Excel yaratilmoqda...")
+def archive_name(sprint_ids):
+    """Manifest nomi: 'DEV_sprint_3081' yoki 'DEV_sprints_2148-2842' (bir nechta)"""
+    if isinstance(sprint_ids, int):
+        return f"{Config.PROJECT_KEY}_sprint_{sprint_ids}"
+    return f"{Config.PROJECT_KEY}_sprints_{'-'.join(map(str, sorted(sprint_ids)))}"
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Sprint Report"
 
-    # Styling
-    header_fill = PatternFill(start_color=Config.HEADER_COLOR, fill_type="solid")
-    header_font = Font(bold=True, color="FFFFFF", size=10)
-    header_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-    thin_border = Border(
-        left=Side(style='thin'), right=Side(style='thin'),
-        top=Side(style='thin'), bottom=Side(style='thin')
-    )
+def archive_sprint_info_map(manifest):
+    """Manifest meta → {sprint_id: sprint_info} (JSON kalitlari - str)"""
+    return {int(sprint_id): info for sprint_id, info in manifest['meta']['sprint_info_map'].items()}
 
-    # Headers
-    for col_idx, column_name in enumerate(ACTIVE_COLUMNS, 1):
-        cell = ws.cell(row=1, column=col_idx, value=column_name)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = header_alignment
-        cell.border = thin_border
-
-        # Column width
-        width = COLUMN_WIDTHS.get(column_name, 20)
-        if col_idx <= 26:
-            col_letter = chr(64 + col_idx)
-        else:
-            col_letter = f"A{chr(64 + col_idx - 26)}"
-        ws.column_dimensions[col_letter].width = width
 
-    # Data rows
-    logger.info(f"Ma'lumotlar yozilmoqda: {len(issues)} ta issue")
+def archive_report_rows(archive, manifest, sprint_info_map, show_progress=True):
+    """
+    Arxivdagi raw JSON → report qatorlari + statistika (tarmoqsiz)
 
-    with tqdm(total=len(issues), desc="Excel ga yozish") as pbar:
-        for row_idx, issue in enumerate(issues, start=2):
-            for col_idx, column_name in enumerate(ACTIVE_COLUMNS, 1):
-                try:
-                    func = COLUMN_FUNCTIONS.get(column_name)
-                    if func:
-                        value = func(issue, sprint_info_map)
-                    else:
-                        value = ''
-
-                    cell = ws.cell(row=row_idx, column=col_idx, value=value)
-                    cell.border = thin_border
-                    cell.alignment = Alignment(vertical='top', wrap_text=True)
-
-                    # Status rang
-                    if column_name == 'Status' and value in Config.DONE_STATUSES:
-                        cell.fill = PatternFill(start_color=Config.CLOSED_STATUS_COLOR, fill_type="solid")
-                except Exception as e:
-                    logger.debug(f"Ustun {column_name} uchun xatolik: {e}")
-                    ws.cell(row=row_idx, column=col_idx, value='')
+    Returns:
+        (rows, stats)
+    """
+    rows = []
 
-            pbar.update(1)
+    for issue in tqdm(archive.iter_issues(manifest), total=len(manifest['issues']),
+                      desc="Ustunlar (arxiv)", unit="issue", disable=not show_progress):
+        rows.append(build_report_row(issue, sprint_info_map))
 
-    # Auto filter va freeze
-    last_col_idx = len(ACTIVE_COLUMNS)
-    if last_col_idx <= 26:
-        last_col = chr(64 + last_col_idx)
-    else:
-        last_col = f"A{chr(64 + last_col_idx - 26)}"
-    ws.auto_filter.ref = f"A1:{last_col}{len(issues) + 1}"
-    ws.freeze_panes = 'A2'
+    return rows, report_statistics(rows)
 
-    return wb
+
+# ============================================================================
+# REPORT ROWS - Excel va Parquet snapshot uchun bitta hisoblash
+# ============================================================================
+def build_report_row(issue, sprint_info_map, columns=None):
+    """Bitta issue: {ustun: qiymat} (default: REPORT_COLUMNS - Excel + statistika)"""
+    row = {}
+    for column_name in columns or REPORT_COLUMNS:
+        try:
+            func = COLUMN_FUNCTIONS.get(column_name)
+            row[column_name] = func(issue, sprint_info_map) if func else ''
+        except Exception as e:
+            logger.debug(f"Ustun {column_name} uchun xatolik: {e}")
+            row[column_name] = ''
+    return row
+
+
+def build_report_rows(issues, sprint_info_map):
+    """
+    Har bir issue uchun {ustun: qiymat} (ACTIVE_COLUMNS tartibida)
+
+    Extractor'lar bir marta chaqiriladi - natija Excel'ga ham, snapshot'ga ham yoziladi.
+    """
+    return [
+        build_report_row(issue, sprint_info_map)
+        for issue in tqdm(issues, desc="Ustunlarni hisoblash")
+    ]
 
 
 # ============================================================================
-# STATISTICS
+# EXCEL GENERATION
 # ============================================================================
-def generate_statistics(issues, sprint_info_map):
-    logger.info("📊 Statistika hisoblanmoqda...")
+def create_report_styles():
+    """
+    Report named style'lari - workbook'ga bir marta qo'shiladi
 
-    stats = {
-        'sprint': defaultdict(int),
-        'developer': defaultdict(lambda: {'total': 0, 'closed': 0, 'bugs': 0, 'points': 0}),
-        'type': defaultdict(int),
-        'status': defaultdict(int),
-        'bug_points': 0,
-        'total_points': 0,
-        'return_count': 0,
-        'pr_count': 0,
-        'testing_returner': defaultdict(int),
-    }
+    Returns:
+        (header, cell, closed) - NamedStyle
+    """
+    thin_border = Border(
+        left=Side(style='thin'), right=Side(style='thin'),
+        top=Side(style='thin'), bottom=Side(style='thin')
+    )
+    header = NamedStyle(
+        name='report_header',
+        font=Font(bold=True, color="FFFFFF", size=10),
+        fill=PatternFill(start_color=Config.HEADER_COLOR, fill_type="solid"),
+        alignment=Alignment(horizontal='center', vertical='center', wrap_text=True),
+        border=thin_border
+    )
+    cell = NamedStyle(
+        name='report_cell',
+        alignment=Alignment(vertical='top', wrap_text=True),
+        border=thin_border
+    )
+    # Status ustuni - yopilgan tasklar
+    closed = NamedStyle(
+        name='report_closed',
+        alignment=Alignment(vertical='top', wrap_text=True),
+        border=thin_border,
+        fill=PatternFill(start_color=Config.CLOSED_STATUS_COLOR, fill_type="solid")
+    )
+    return header, cell, closed
 
-    for issue in tqdm(issues, desc="Statistika"):
-        sprint_name, _ = extract_sprint(issue, sprint_info_map)
-        for sprint in sprint_name.split(', '):
-            stats['sprint'][sprint] += 1
 
-        assignee = extract_assignee(issue, sprint_info_map)
-        stats['developer'][assignee]['total'] += 1
+def create_excel_report(issues, sprint_info_map, project_key, rows=None, show_progress=True):
+    """
+    Report workbook (write-only - qatorlar streaming yoziladi)
 
-        status = extract_status(issue, sprint_info_map)
-        if status in Config.DONE_STATUSES:
-            stats['developer'][assignee]['closed'] += 1
+    Faqat workbook tomoni streaming: openpyxl katak obyektlarini xotirada
+    saqlamaydi. rows esa oldindan to'liq qurilgan ro'yxat - uning xotirasi
+    issue soniga proporsional.
 
-        issue_type = extract_type(issue, sprint_info_map)
-        if issue_type == 'Bug':
-            stats['developer'][assignee]['bugs'] += 1
+    Style'lar NamedStyle sifatida bir marta yaratiladi, har bir katak faqat
+    style nomini oladi. Write-only workbook faqat bir marta save() qilinadi.
+    """
+    logger.info("📄 Excel yaratilmoqda...")
 
-        sp = extract_story_points(issue, sprint_info_map)
-        if sp:
-            try:
-                points = float(sp)
-                stats['developer'][assignee]['points'] += points
-                stats['total_points'] += points
+    if rows is None:
+        rows = build_report_rows(issues, sprint_info_map)
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sprint Report")
 
-                if issue_type == 'Bug':
-                    stats['bug_points'] += points
-            except:
-                pass
+    # Styling
+    header_style, cell_style, closed_style = create_report_styles()
+    for style in (header_style, cell_style, closed_style):
+        wb.add_named_style(style)
+
+    # Column width, auto filter va freeze - write-only'da qatorlardan oldin
+    for col_idx, column_name in enumerate(ACTIVE_COLUMNS, 1):
+        ws.column_dimensions[get_column_letter(col_idx)].width = COLUMN_WIDTHS.get(column_name, 20)
 
-        stats['type'][issue_type] += 1
-        stats['status'][status] += 1
+    last_col = get_column_letter(len(ACTIVE_COLUMNS))
+    ws.auto_filter.ref = f"A1:{last_col}{len(rows) + 1}"
+    ws.freeze_panes = 'A2'
 
-        return_count = extract_return_count(issue, sprint_info_map)
-        stats['return_count'] += return_count
+    def styled_cell(value, style_name):
+        try:
+            cell = WriteOnlyCell(ws, value=value)
+        except Exception as e:
+            logger.debug(f"Qiymat yozib bo'lmadi: {e}")
+            cell = WriteOnlyCell(ws, value='')
+        cell.style = style_name
+        return cell
 
-        # PR statistics
-        pr_count = extract_pr_count(issue, sprint_info_map)
-        if pr_count > 0:
-            stats['pr_count'] += 1
+    # Headers
+    ws.append([styled_cell(column_name, header_style.name) for column_name in ACTIVE_COLUMNS])
 
-        # Testing returner statistics
-        who = extract_testing_return_who(issue, sprint_info_map)
-        if who:
-            for person in who.split('\n'):
-                stats['testing_returner'][person] += 1
+    # Data rows
+    logger.info(f"Ma'lumotlar yozilmoqda: {len(rows)} ta issue")
+
+    done_statuses = set(Config.DONE_STATUSES)
+    for row in tqdm(rows, desc="Excel ga yozish", disable=not show_progress):
+        cells = []
+        for column_name in ACTIVE_COLUMNS:
+            value = row.get(column_name, '')
+            if column_name == 'Status' and value in done_statuses:
+                cells.append(styled_cell(value, closed_style.name))
+            else:
+                cells.append(styled_cell(value, cell_style.name))
+        ws.append(cells)
 
-    return stats
+    return wb
+
+
+# ============================================================================
+# STATISTICS - utils/sprint_statistics.py (groupby, report qatorlaridan)
+# ============================================================================
+def generate_statistics(issues, sprint_info_map):
+    logger.info("📊 Statistika hisoblanmoqda...")
+    return SprintStatistics.from_report_rows(build_report_rows(issues, sprint_info_map),
+                                             done_statuses=Config.DONE_STATUSES)
+
+
+def report_statistics(rows):
+    """Report qatorlari → SprintStatistics (extractor'lar qayta chaqirilmaydi)"""
+    return SprintStatistics.from_report_rows(rows, done_statuses=Config.DONE_STATUSES)
 
 
 def print_statistics(stats, total_issues):
+    overview = stats.overview()
+
     print("\n" + "=" * 80)
     print("📊 STATISTIKA")
     print("=" * 80)
 
     # Sprint bo'yicha
     print("\n📊 SPRINT BO'YICHA:")
-    for sprint_name, count in sorted(stats['sprint'].items()):
-        pct = (count / total_issues) * 100
-        print(f"   {sprint_name:30s}: {count:4d} ta ({pct:5.1f}%)")
+    for row in stats.by_sprint().sort_values('Sprint').itertuples(index=False):
+        pct = (row.Issues / total_issues) * 100
+        print(f"   {row.Sprint:30s}: {row.Issues:4d} ta ({pct:5.1f}%)")
 
     # Status bo'yicha
     print("\n📈 STATUS BO'YICHA:")
-    for status, count in sorted(stats['status'].items(), key=lambda x: x[1], reverse=True):
-        pct = (count / total_issues) * 100
-        bar = "█" * int(pct / 5)
-        print(f"   {status:30s}: {count:4d} ta {bar} ({pct:5.1f}%)")
+    for row in stats.by_status().itertuples(index=False):
+        bar = "█" * int(row.Percent / 5)
+        print(f"   {row.Status:30s}: {row.Count:4d} ta {bar} ({row.Percent:5.1f}%)")
 
     # Developer bo'yicha
     print("\n👥 DEVELOPER BO'YICHA (TOP 10):")
-    print(f"{'Developer':<25} {'Total':<8} {'Closed':<8} {'Bugs':<8} {'Points':<8}")
-    print("-" * 65)
+    print(f"{'Developer':<25} {'Total':<8} {'Closed':<8} {'Bugs':<8} {'Points':<8} {'Returns':<8}")
+    print("-" * 75)
 
-    top_devs = sorted(stats['developer'].items(), key=lambda x: x[1]['total'], reverse=True)[:10]
-    for dev, dev_stats in top_devs:
-        print(f"{dev:<25} {dev_stats['total']:<8} {dev_stats['closed']:<8} "
-              f"{dev_stats['bugs']:<8} {dev_stats['points']:<8.1f}")
+    for row in stats.by_developer().head(10).to_dict('records'):
+        print(f"{row['Developer']:<25} {row['Issues']:<8} {row['Closed']:<8} "
+              f"{row['Bugs']:<8} {row['Story Points']:<8.1f} {row['Returns']:<8}")
 
     # Type bo'yicha
     print("\n📋 TYPE BO'YICHA:")
-    for issue_type, count in sorted(stats['type'].items(), key=lambda x: x[1], reverse=True):
-        pct = (count / total_issues) * 100
-        bar = "█" * int(pct / 5)
-        print(f"   {issue_type:20s}: {count:3d} ta {bar} ({pct:.1f}%)")
+    for row in stats.by_type().itertuples(index=False):
+        bar = "█" * int(row.Percent / 5)
+        print(f"   {row.Type:20s}: {row.Count:3d} ta {bar} ({row.Percent:.1f}%)")
+
+    # Priority bo'yicha
+    print("\n⚡ PRIORITY BO'YICHA:")
+    for row in stats.by_priority().to_dict('records'):
+        print(f"   {row['Priority']:20s}: {row['Issues']:3d} ta, qaytgan {row['Return Rate']:.1f}%")
 
     # Pull Request
     print("\n🔗 PULL REQUEST:")
-    pr_pct = (stats['pr_count'] / total_issues) * 100 if total_issues > 0 else 0
-    print(f"   PR bor tasklar: {stats['pr_count']}/{total_issues} ({pr_pct:.1f}%)")
+    pr_pct = (overview['pr_tasks'] / total_issues) * 100 if total_issues > 0 else 0
+    print(f"   PR bor tasklar: {overview['pr_tasks']}/{total_issues} ({pr_pct:.1f}%)")
 
     # Testing Returner
     print("\n🔄 KIM QAYTARDI (QA):")
-    for returner, count in sorted(stats['testing_returner'].items(), key=lambda x: x[1], reverse=True):
-        print(f"   {returner:30s}: {count} marta")
+    for row in stats.by_returner().itertuples(index=False):
+        print(f"   {row.Returner:30s}: {row.Returns} marta")
 
     # Bug statistikasi
     print("\n🐛 BUG STATISTIKASI:")
-    if stats['total_points'] > 0:
-        bug_pct = (stats['bug_points'] / stats['total_points']) * 100
-        print(f"   Bug Points: {stats['bug_points']:.1f}")
-        print(f"   Total Points: {stats['total_points']:.1f}")
+    if overview['story_points'] > 0:
+        bug_pct = (overview['bug_points'] / overview['story_points']) * 100
+        print(f"   Bug Points: {overview['bug_points']:.1f}")
+        print(f"   Total Points: {overview['story_points']:.1f}")
         print(f"   Bug %: {bug_pct:.1f}%")
 
     # Return statistikasi
     print("\n🔄 TESTDAN QAYTGAN:")
-    print(f"   Jami: {stats['return_count']} marta")
+    print(f"   Jami: {overview['returns']} marta")
     if total_issues > 0:
-        avg_return = stats['return_count'] / total_issues
-        print(f"   O'rtacha: {avg_return:.2f} marta/task")
+        print(f"   O'rtacha: {overview['avg_returns']:.2f} marta/task")
+        print(f"   Qaytgan tasklar: {overview['tasks_with_returns']} ta ({overview['return_rate']:.1f}%)")
+    if overview['testing_hours'] > 0:
+        print(f"   Testing vaqti: {overview['testing_hours']:.1f}h "
+              f"(o'rtacha {overview['avg_testing_hours']:.1f}h/task)")
 
 
 # ============================================================================
-# MAIN
+# SPRINT TASKS - fetch (thread pool) va workbook (process pool)
 # ============================================================================
+def fetch_sprint_rows(jira, sprint_id, sprint_info, store=None, limiter=None, show_progress=True,
+                      archive=None, manifest=None):
+    """
+    Bitta sprint: issue'lar → qatorlar + statistika (thread pool'da - tarmoq kutish)
+
+    Args:
+        archive: JiraIssueArchive - raw JSON yoziladi (manifest bo'lsa - o'qiladi)
+        manifest: Arxiv manifest'i (--from-archive) - JIRA'ga so'rov yo'q
+
+    Returns:
+        (rows, stats, seconds)
+    """
+    started = time.perf_counter()
+    sprint_info_map = {sprint_id: sprint_info}
+
+    if manifest is not None:
+        rows, stats = archive_report_rows(archive, manifest, sprint_info_map, show_progress=show_progress)
+        return rows, stats, time.perf_counter() - started
+
+    archive_run = archive.begin(archive_name(sprint_id), sprint_info_map=sprint_info_map) if archive else None
+    if store is not None:
+        rows, stats = store_report_rows(store, sprint_id, sprint_info_map, show_progress=show_progress,
+                                        archive_run=archive_run)
+    else:
+        jql = f'project = "{Config.PROJECT_KEY}" AND sprint = {sprint_id} ORDER BY created DESC'
+        logger.info(f"🔍 JQL: {jql}")
+        rows, stats = fetch_report_rows(jira, jql, sprint_info_map, show_progress=show_progress,
+                                        limiter=limiter, archive_run=archive_run)
+
+    if archive_run is not None:
+        archive_run.save()
+
+    return rows, stats, time.perf_counter() - started
+
+
+def write_sprint_report(rows, sprint_id, sprint_name, output_dir, show_progress=True):
+    """
+    Qatorlar → Excel + Parquet snapshot (process pool'da - CPU ish)
+
+    Top-level funksiya - ProcessPoolExecutor uni pickle qiladi, argumentlar
+    faqat oddiy qiymatlar (qatorlar - dict'lar).
+
+    Returns:
+        (filename, snapshot_file, seconds)
+    """
+    started = time.perf_counter()
+
+    wb = create_excel_report(None, {}, Config.PROJECT_KEY, rows=rows, show_progress=show_progress)
+
+    # Fayl nomi - sprint ID va nomi bilan
+    safe_sprint_name = sprint_name.replace('/', '-').replace('\\', '-')
+    filename = os.path.join(
+        output_dir,
+        f'{Config.PROJECT_KEY}_Sprint_{sprint_id}_{safe_sprint_name}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx'
+    )
+    wb.save(filename)
+
+    # Parquet snapshot (loader va statistika shuni o'qiydi, Excel - odamlar uchun)
+    snapshot_file = write_sprint_snapshot(rows, ACTIVE_COLUMNS, snapshot_path(filename))
+
+    return filename, snapshot_file, time.perf_counter() - started
+
+
+def print_timings(results, total_seconds):
+    """Sprintlar bo'yicha vaqtlar jadvali"""
+    print("\n" + "=" * 80)
+    print("⏱️  SPRINTLAR BO'YICHA VAQT")
+    print("=" * 80)
+    print(f"{'Sprint':<30} {'Issues':>7} {'Fetch':>9} {'Excel':>9}  Natija")
+    print("-" * 80)
+
+    for sprint_id, result in results.items():
+        fetch = f"{result['fetch_seconds']:.1f}s" if result.get('fetch_seconds') is not None else '-'
+        build = f"{result['build_seconds']:.1f}s" if result.get('build_seconds') is not None else '-'
+        if result.get('error'):
+            outcome = f"❌ {result['error'][:60]}"
+        elif result.get('filename'):
+            outcome = f"✅ {os.path.basename(result['filename'])}"
+        else:
+            outcome = "⚠️ issue yo'q"
+        print(f"{result['name'][:30]:<30} {result.get('issues', 0):>7} {fetch:>9} {build:>9}  {outcome}")
+
+    print("-" * 80)
+    fetch_sum = sum(r.get('fetch_seconds') or 0 for r in results.values())
+    build_sum = sum(r.get('build_seconds') or 0 for r in results.values())
+    print(f"   Jami: {total_seconds:.1f}s (ketma-ket bo'lganda ~{fetch_sum + build_sum:.1f}s)")
+
 
 # ============================================================================
 # MAIN - HAR BIR SPRINT UCHUN ALOHIDA
 # ============================================================================
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Har bir sprint uchun alohida Excel report")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Lokal issue store orqali: faqat oxirgi sync'dan beri o'zgarganlar yuklanadi")
+    parser.add_argument('--full-sync', action='store_true',
+                        help="--incremental: store'dagi sprintlarni to'liq qayta yuklash")
+    parser.add_argument('--output-dir', default=os.getenv('EXCEL_DIR') or '.',
+                        help="Excel/Parquet papkasi (default: EXCEL_DIR yoki joriy papka)")
+    parser.add_argument('--fetch-workers', type=int, default=int(os.getenv('REPORT_FETCH_WORKERS', 3)),
+                        help="Bir vaqtda yuklanadigan sprintlar (default: REPORT_FETCH_WORKERS yoki 3)")
+    parser.add_argument('--build-workers', type=int, default=int(os.getenv('REPORT_BUILD_WORKERS', 2)),
+                        help="Excel yaratuvchi process'lar (default: REPORT_BUILD_WORKERS yoki 2)")
+    parser.add_argument('--from-archive', action='store_true',
+                        help="JIRA'siz: Excel/Parquet raw JSON arxivdan qayta yaratiladi")
+    parser.add_argument('--archive-version',
+                        help="--from-archive: manifest versiyasi yoki prefiksi (default: eng oxirgisi)")
+    parser.add_argument('--no-archive', action='store_true',
+                        help="Raw JSON arxivga yozilmasin")
+    add_sprint_arguments(parser)
+    args = parser.parse_args(argv)
+
+    jira = None if args.from_archive else get_jira_client()
+    if jira is not None:
+        refresh_sprint_catalog(jira, full=args.refresh_sprints)
+
+    sprint_ids = resolve_sprint_ids(jira, args.sprint_ids, args.last, args.active)
+    if not sprint_ids:
+        print("❌ Sprintlar tanlanmagan (--sprint-ids / --last / --active yoki Config.SPRINT_IDS)")
+        return 1
+    Config.SPRINT_IDS = sprint_ids
+
+    fetch_workers = max(1, min(args.fetch_workers, len(sprint_ids)))
+    build_workers = max(1, min(args.build_workers, len(sprint_ids)))
+    # Bitta sprint - oldingidek progress bar'lar bilan
+    show_progress = fetch_workers == 1
+
     print("=" * 80)
     print("🚀 JIRA REPORT - HAR BIR SPRINT UCHUN ALOHIDA EXCEL")
     print("=" * 80)
     print(f"📊 Aktiv ustunlar: {len(ACTIVE_COLUMNS)} ta")
-    print(f"🏃 Sprintlar soni: {len(Config.SPRINT_IDS)} ta")
+    print(f"🏃 Sprintlar soni: {len(sprint_ids)} ta")
+    print(f"⚡ Parallel: {fetch_workers} ta sprint yuklash, {build_workers} ta Excel process")
+    print(f"📁 Papka: {os.path.abspath(args.output_dir)}")
     print("=" * 80)
     print()
 
-    jira = get_jira_client()
-
-    # Sprint ma'lumotlarini olish
-    sprint_info_map = {}
-    for sprint_id in Config.SPRINT_IDS:
-        sprint_info_map[sprint_id] = get_sprint_info(jira, sprint_id)
+    os.makedirs(args.output_dir, exist_ok=True)
+    started = time.perf_counter()
+
+    archive = None if args.no_archive and not args.from_archive else JiraIssueArchive()
+    manifests = {}
+
+    if args.from_archive:
+        # Tarmoqsiz: sprint ma'lumotlari va issue'lar - arxiv manifest'laridan
+        print(f"🗄️  Arxiv: {os.path.abspath(archive.root)}")
+        sprint_info_map = {}
+        for sprint_id in sprint_ids:
+            manifest = archive.load_manifest(archive_name(sprint_id), args.archive_version)
+            if manifest is None:
+                sprint_info_map[sprint_id] = {'id': sprint_id, 'name': f"Sprint {sprint_id}", 'state': 'Unknown',
+                                              'startDate': None, 'endDate': None}
+                continue
+            manifests[sprint_id] = manifest
+            sprint_info_map[sprint_id] = archive_sprint_info_map(manifest)[sprint_id]
+    else:
+        # Sprint ma'lumotlari - katalogdan (yangilangan, so'rovsiz)
+        sprint_info_map = {sprint_id: get_sprint_info(jira, sprint_id) for sprint_id in sprint_ids}
 
     print("\n📋 SPRINT MA'LUMOTLARI:")
     for sprint_id, info in sprint_info_map.items():
-        print(f"   🏃 {info['name']} (ID: {sprint_id}, Status: {info['state']})")
-
-    # Har bir sprint uchun alohida Excel yaratish
-    for sprint_id in Config.SPRINT_IDS:
-        print("\n" + "=" * 80)
-        sprint_info = sprint_info_map[sprint_id]
-        sprint_name = sprint_info['name']
-        print(f"🔄 {sprint_name} ishlanmoqda...")
-        print("=" * 80)
-
-        # Faqat shu sprint uchun JQL
-        jql = f'project = "{Config.PROJECT_KEY}" AND sprint = {sprint_id} ORDER BY created DESC'
-        print(f"🔍 JQL: {jql}")
+        version = f", arxiv: {manifests[sprint_id]['version']}" if sprint_id in manifests else ''
+        print(f"   🏃 {info['name']} (ID: {sprint_id}, Status: {info['state']}{version})")
 
-        # Issues olish
-        issues = fetch_issues(jira, jql)
+    # Incremental: bitta sync (hamma sprintlar), keyin reportlar store'dan
+    store = sync_issue_store(jira, sprint_ids, full=args.full_sync) if args.incremental and jira else None
 
-        if not issues:
-            print(f"⚠️ {sprint_name} uchun issue topilmadi, o'tkazib yuborildi")
-            continue
+    results = {
+        sprint_id: {'name': sprint_info_map[sprint_id]['name'], 'issues': 0}
+        for sprint_id in sprint_ids
+    }
+    if args.from_archive:
+        for sprint_id in sprint_ids:
+            if sprint_id not in manifests:
+                results[sprint_id]['error'] = "arxivda yo'q"
+        sprint_ids = [sprint_id for sprint_id in sprint_ids if sprint_id in manifests]
+
+    # Sprintlar parallel yuklanadi (JIRA_MAX_RPS - hammasiga umumiy), tayyor bo'lgani
+    # darhol Excel process'iga beriladi - tarmoq kutish va workbook yaratish ustma-ust.
+    # spawn - fork thread'lar ishlayotganda lock'larni (logging, tqdm) nusxalab qotib qoladi
+    limiter = RateLimiter()
+    with ThreadPoolExecutor(max_workers=fetch_workers, thread_name_prefix='sprint-fetch') as fetch_pool, \
+            ProcessPoolExecutor(max_workers=build_workers,
+                                mp_context=multiprocessing.get_context('spawn')) as build_pool:
+        fetch_futures = {
+            fetch_pool.submit(fetch_sprint_rows, jira, sprint_id, sprint_info_map[sprint_id],
+                              store, limiter, show_progress, archive, manifests.get(sprint_id)): sprint_id
+            for sprint_id in sprint_ids
+        }
 
-        # Statistika
-        stats = generate_statistics(issues, {sprint_id: sprint_info})
+        build_futures = {}
+        for future in as_completed(fetch_futures):
+            sprint_id = fetch_futures[future]
+            sprint_name = sprint_info_map[sprint_id]['name']
+            try:
+                rows, stats, seconds = future.result()
+            except Exception as e:
+                logger.error(f"❌ {sprint_name} yuklashda xatolik: {e}")
+                results[sprint_id]['error'] = str(e)
+                continue
+
+            results[sprint_id].update(issues=len(rows), fetch_seconds=seconds)
+            if not rows:
+                print(f"⚠️ {sprint_name} uchun issue topilmadi, o'tkazib yuborildi")
+                continue
+
+            build_futures[build_pool.submit(
+                write_sprint_report, rows, sprint_id, sprint_name, args.output_dir, show_progress
+            )] = sprint_id
+
+            print("\n" + "=" * 80)
+            print(f"🔄 {sprint_name}: {len(rows)} ta issue ({seconds:.1f}s) - Excel yaratilmoqda")
+            print("=" * 80)
+            print_statistics(stats, len(rows))
+
+        for future in as_completed(build_futures):
+            sprint_id = build_futures[future]
+            try:
+                filename, snapshot_file, seconds = future.result()
+            except Exception as e:
+                logger.error(f"❌ {results[sprint_id]['name']} Excel yaratishda xatolik: {e}")
+                results[sprint_id]['error'] = str(e)
+                continue
 
-        # Excel yaratish
-        wb = create_excel_report(issues, {sprint_id: sprint_info}, Config.PROJECT_KEY)
+            results[sprint_id].update(filename=filename, snapshot=snapshot_file, build_seconds=seconds)
+            print(f"   📄 {filename}")
+            print(f"   🗃️  {snapshot_file}")
 
-        # Fayl nomi - sprint ID va nomi bilan
-        safe_sprint_name = sprint_name.replace('/', '-').replace('\\', '-')
-        filename = f'{Config.PROJECT_KEY}_Sprint_{sprint_id}_{safe_sprint_name}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx'
-        wb.save(filename)
+    if store is not None:
+        store.close()
 
-        # Statistika chiqarish
-        print_statistics(stats, len(issues))
+    if jira is not None:
+        attach_payload_stats(jira).log_summary(logger)
+    if archive is not None and not args.from_archive:
+        logger.info(f"🗄️  Raw arxiv: {archive.stats['written']} ta yangi versiya, "
+                    f"{archive.stats['reused']} ta o'zgarmagan ({archive.root})")
+    print_timings(results, time.perf_counter() - started)
 
-        print("\n" + "=" * 80)
-        print("✅ TAYYOR!")
-        print("=" * 80)
-        print(f"   📄 Fayl: {filename}")
-        print(f"   📊 Issues: {len(issues)} ta")
-        print(f"   📋 Ustunlar: {len(ACTIVE_COLUMNS)} ta")
-        print("=" * 80)
+    created = sum(1 for result in results.values() if result.get('filename'))
+    failed = [result['name'] for result in results.values() if result.get('error')]
 
     print("\n" + "=" * 80)
-    print("🎉 BARCHA SPRINTLAR MUVAFFAQIYATLI YARATILDI!")
+    if failed:
+        print(f"⚠️  XATOLIK: {', '.join(failed)}")
+    else:
+        print("🎉 BARCHA SPRINTLAR MUVAFFAQIYATLI YARATILDI!")
     print("=" * 80)
-    print(f"   📊 Jami {len(Config.SPRINT_IDS)} ta Excel fayl yaratildi")
+    print(f"   📊 Jami {created} ta Excel fayl (+ .parquet snapshot) yaratildi")
+    print(f"   📁 Papka: {os.path.abspath(args.output_dir)}")
+    print(f"   📋 Ustunlar: {len(ACTIVE_COLUMNS)} ta")
     print("=" * 80)
+    return 1 if failed else 0
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,212 @@
+# scripts/ingest_from_jira.py - JIRA → VectorDB (Excel'siz)
+"""
+Sprint issue'larini to'g'ridan-to'g'ri JIRA'dan VectorDB ga yuklash
+
+Oldingi yo'l: download_file.py → .xlsx (joriy papkada) → EXCEL_DIR ga ko'chirish
+→ 2_load_sprints.py. Bu skript o'sha extractor'larni (COLUMN_FUNCTIONS) ishlatib,
+issue'larni sahifalab (page) oladi va to'g'ridan-to'g'ri ingest pipeline'ga
+(chunk → embed → upsert) uzatadi. Workbook yaratilmaydi.
+
+Xotira: bitta JIRA sahifasi + pipeline queue'lari - sprint hajmiga bog'liq emas.
+O'zgarmagan issue'lar (manifest'dagi hash bir xil) qayta embed qilinmaydi,
+shuning uchun skriptni xohlagancha qayta ishga tushirish mumkin.
+
+Usage:
+    python scripts/ingest_from_jira.py --sprint-ids 3081 3014
+    python scripts/ingest_from_jira.py --sprint-ids 3081 --page-size 50
+    python scripts/ingest_from_jira.py --incremental   # lokal issue store orqali
+    python scripts/ingest_from_jira.py --last 3        # board'ning oxirgi 3 ta sprinti
+"""
+import argparse
+import os
+import sys
+from datetime import datetime
+from typing import Dict, Any, Iterator, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+from scripts.download_file import (
+    Config, COLUMN_FUNCTIONS, get_jira_client, get_sprint_info, build_report_row, sync_issue_store,
+    add_sprint_arguments, refresh_sprint_catalog, resolve_sprint_ids
+)
+from services.ingest_service import IngestService
+from utils.jira.field_sets import REPORT
+from utils.jira.issue_fetcher import JiraIssueFetcher
+from utils.jira.payload_log import attach_payload_stats
+from utils.sprint_workbook_reader import ISSUE_COLUMNS, build_issue
+
+load_dotenv()
+
+# Faqat loader ishlatadigan ustunlar hisoblanadi (Time in Each Status va h.k. kerak emas)
+INGEST_COLUMNS = [
+    header for _, headers, _, _ in ISSUE_COLUMNS for header in headers
+    if header in COLUMN_FUNCTIONS
+]
+
+
+# ============================================================================
+# JIRA PAGING
+# ============================================================================
+def count_issues(jira, jql: str) -> int:
+    return JiraIssueFetcher(jira).count(jql)
+
+
+def iter_jira_issues(jira, jql: str, page_size: int = 100) -> Iterator[Any]:
+    """
+    JQL natijasini sahifalab o'qish (JiraIssueFetcher - sahifalar parallel)
+
+    maxResults=False kabi hammasini bir vaqtda xotiraga olmaydi - bir vaqtda
+    faqat bir nechta sahifa (worker'lar soniga qarab).
+    """
+    yield from JiraIssueFetcher(jira, page_size=page_size).iter_issues(
+        jql, expand=REPORT.expand, fields=REPORT.fields_param
+    )
+
+
+def iter_sprint_issue_dicts(jira, sprint_id: int, sprint_info: Dict[str, Any],
+                            project_key: str, page_size: int, store=None) -> Iterator[Dict[str, Any]]:
+    """
+    JIRA issue → build_issue() formatidagi dict (2_load_sprints.py bilan bir xil)
+
+    Args:
+        store: JiraIssueStore - berilsa issue'lar store'dan o'qiladi (JIRA'ga so'rov yo'q)
+    """
+    if store is not None:
+        issues = store.iter_issues(sprint_id=sprint_id)
+    else:
+        jql = f'project = "{project_key}" AND sprint = {sprint_id} ORDER BY created DESC'
+        issues = iter_jira_issues(jira, jql, page_size)
+    sprint_info_map = {sprint_id: sprint_info}
+
+    for position, issue in enumerate(issues):
+        row = build_report_row(issue, sprint_info_map, columns=INGEST_COLUMNS)
+        issue_data = build_issue(row, str(sprint_id))
+        if not issue_data['key']:
+            continue
+        issue_data['row'] = position + 2
+        yield issue_data
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+def sprint_source_name(project_key: str, sprint_id: int) -> str:
+    """Manifest / chunk cache nomi"""
+    return f"JIRA_{project_key}_Sprint_{sprint_id}"
+
+
+def ingest_sprint(service: IngestService, jira, sprint_id: int, project_key: str = None,
+                  page_size: int = None, show_progress: bool = True, store=None):
+    """
+    Bitta sprintni JIRA'dan yuklash (webhook ham shuni chaqiradi)
+
+    Args:
+        store: Sinxronlangan JiraIssueStore (--incremental) - issue'lar shundan
+
+    Returns:
+        (sprint_info, IngestResult)
+    """
+    project_key = project_key or Config.PROJECT_KEY
+    page_size = page_size or int(os.getenv('JIRA_PAGE_SIZE', 100))
+    sprint_info = get_sprint_info(jira, sprint_id)
+    if store is not None:
+        total = store.count(sprint_id)
+    else:
+        total = count_issues(jira, f'project = "{project_key}" AND sprint = {sprint_id}')
+
+    # JIRA manba uchun kontent hash yo'q - har bir run yangi versiya, o'zgarmagan
+    # issue'lar issue hash bo'yicha o'tkazib yuboriladi
+    result = service.ingest_issues(
+        iter_sprint_issue_dicts(jira, sprint_id, sprint_info, project_key, page_size, store=store),
+        source=sprint_source_name(project_key, sprint_id),
+        total=total,
+        version=f"jira-{datetime.now().isoformat()}",
+        show_progress=show_progress
+    )
+    return sprint_info, result
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="JIRA sprint'larini to'g'ridan-to'g'ri VectorDB ga yuklash")
+    parser.add_argument('--project', default=Config.PROJECT_KEY)
+    parser.add_argument('--page-size', type=int, default=int(os.getenv('JIRA_PAGE_SIZE', 100)),
+                        help="JIRA sahifa hajmi (default: JIRA_PAGE_SIZE yoki 100)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Lokal issue store orqali: faqat oxirgi sync'dan beri o'zgarganlar yuklanadi")
+    add_sprint_arguments(parser)
+    args = parser.parse_args(argv)
+
+    jira = get_jira_client()
+    refresh_sprint_catalog(jira, full=args.refresh_sprints)
+    args.sprint_ids = resolve_sprint_ids(jira, args.sprint_ids, args.last, args.active)
+    if not args.sprint_ids:
+        print("❌ Sprintlar tanlanmagan (--sprint-ids / --last / --active yoki Config.SPRINT_IDS)")
+        return 1
+    Config.SPRINT_IDS = args.sprint_ids
+
+    print("=" * 80)
+    print("⚡ JIRA → VECTORDB (EXCEL'SIZ)")
+    print("=" * 80)
+    print(f"🏃 Sprintlar: {', '.join(map(str, args.sprint_ids))}")
+    print(f"📄 Sahifa hajmi: {args.page_size}")
+    print()
+
+    print("📦 Helpers yuklanmoqda...")
+    service = IngestService()
+    service.warm_up()
+    print("✅ Tayyor!")
+    print()
+
+    store = None
+    if args.incremental:
+        store = sync_issue_store(jira, args.sprint_ids, project_key=args.project)
+        print()
+
+    total_loaded = 0
+    total_skipped = 0
+    failed = []
+
+    for sprint_id in args.sprint_ids:
+        print("=" * 80)
+        print(f"🏃 Sprint {sprint_id}")
+        print("=" * 80)
+
+        try:
+            sprint_info, result = ingest_sprint(service, jira, sprint_id, args.project, args.page_size,
+                                                store=store)
+        except Exception as e:
+            print(f"❌ Sprint {sprint_id} yuklashda xatolik: {e}")
+            print()
+            failed.append(sprint_id)
+            continue
+
+        total_loaded += result.issues
+        total_skipped += result.skipped
+
+        print(f"✅ {sprint_info['name']} ({sprint_info['state']}): yuklandi {result.issues} ta issue, "
+              f"o'zgarmagan: {result.skipped} ta")
+        result.print_summary()
+        print()
+
+    service.close()
+    if store is not None:
+        store.close()
+    attach_payload_stats(jira).log_summary()
+
+    print("=" * 80)
+    print("🎉 YAKUNIY NATIJA")
+    print("=" * 80)
+    print(f"   • Yangi/yangilangan: {total_loaded} ta")
+    print(f"   • O'zgarmagan: {total_skipped} ta")
+    print(f"   • VectorDB jami: {service.vectordb.get_stats()['total_issues']} ta")
+    if failed:
+        print(f"   ❌ Xatolik: {', '.join(map(str, failed))}")
+    print("=" * 80)
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
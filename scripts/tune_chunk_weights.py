@@ -0,0 +1,335 @@
+# scripts/tune_chunk_weights.py
+"""
+Chunk Weight Tuning - Offline
+
+ChunkingHelper weight'lari (summary 3.5, root_cause 3.0, ...) qo'lda tanlangan.
+Bu script cache'dagi chunk vektorlarni BIR MARTA yuklaydi va yuzlab weight
+to'plamlari uchun issue vektorlarini qayta hisoblaydi (vectorized) - embedder
+ishlatilmaydi, qayta ingest kerak emas.
+
+Har bir to'plam labeled bug → culprit ro'yxatiga nisbatan baholanadi:
+    - MRR (mean reciprocal rank)
+    - Recall@K
+
+Labels fayl (CSV yoki JSONL):
+    bug,culprit[,query]
+    DEV-6959,DEV-6120,"Login sahifasida xatolik..."
+
+Query vektor:
+    - --query-vectors fayl bo'lsa: undagi vektor (encode_query natijasi)
+    - aks holda: bug issue'ning o'zi cache'dan, shu weight to'plami bilan
+
+Usage:
+    python scripts/tune_chunk_weights.py --labels data/labels.csv --random 300
+    python scripts/tune_chunk_weights.py --labels data/labels.csv --grid data/weight_grid.json
+    python scripts/tune_chunk_weights.py --labels data/labels.csv --encode-queries data/query_vectors.npz
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import List, Dict, Any, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from dotenv import load_dotenv
+
+from utils.chunking_helper import ChunkingHelper
+from utils.chunk_vector_cache import ChunkVectorCache
+
+load_dotenv()
+
+DEFAULT_WEIGHTS = ChunkingHelper().weights
+CHUNK_TYPES = list(DEFAULT_WEIGHTS.keys())
+
+
+# ============================================================================
+# DATA LOADING
+# ============================================================================
+def load_labels(path: str) -> List[Dict[str, str]]:
+    """bug → culprit ro'yxati (CSV yoki JSONL)"""
+    labels = []
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith('.jsonl') or path.endswith('.json'):
+            for line in f:
+                line = line.strip()
+                if line:
+                    labels.append(json.loads(line))
+        else:
+            for row in csv.DictReader(f):
+                labels.append(row)
+
+    return [
+        {'bug': str(l['bug']).strip(), 'culprit': str(l['culprit']).strip(), 'query': l.get('query') or ''}
+        for l in labels if l.get('bug') and l.get('culprit')
+    ]
+
+
+def build_type_sums(cache: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Issue x type bo'yicha chunk vektorlar yig'indisi
+
+    Weight faqat chunk type'ga bog'liq (description qismlaridagi 0.9, 0.8 ... kamayish
+    va bo'sh issue'dagi 0.5 - type weight'iga nisbatan koeffitsient sifatida saqlanadi).
+    Shuning uchun har qanday weight to'plami W uchun:
+        issue_vec = sum_k W[k] * T[i, k] / sum_k W[k] * F[i, k]
+
+    Returns:
+        T: (n_issues, n_types, dim) float32, F: (n_issues, n_types) float64
+    """
+    counts = cache['counts']
+    n_issues = len(counts)
+    n_types = len(CHUNK_TYPES)
+    dim = cache['vectors'].shape[1]
+
+    type_index = {t: i for i, t in enumerate(CHUNK_TYPES)}
+    chunk_types = np.array([type_index.get(str(t), type_index['metadata']) for t in cache['types']])
+    defaults = np.array([DEFAULT_WEIGHTS[CHUNK_TYPES[t]] for t in chunk_types], dtype=np.float64)
+    factors = np.where(defaults > 0, cache['weights'] / np.where(defaults > 0, defaults, 1.0), 1.0)
+
+    issue_idx = np.repeat(np.arange(n_issues), counts)
+    cell = issue_idx * n_types + chunk_types
+
+    F = np.bincount(cell, weights=factors, minlength=n_issues * n_types).reshape(n_issues, n_types)
+
+    # Segment sum - cell bo'yicha tartiblab reduceat
+    order = np.argsort(cell, kind='stable')
+    sorted_cells = cell[order]
+    starts = np.flatnonzero(np.r_[True, sorted_cells[1:] != sorted_cells[:-1]])
+    scaled = cache['vectors'][order] * factors[order, None].astype(np.float32)
+
+    T = np.zeros((n_issues * n_types, dim), dtype=np.float32)
+    T[sorted_cells[starts]] = np.add.reduceat(scaled, starts, axis=0)
+
+    return T.reshape(n_issues, n_types, dim), F
+
+
+def make_weight_sets(grid_path: str, n_random: int, low: float, high: float, seed: int) -> List[Dict[str, float]]:
+    """Baholanadigan weight to'plamlari - birinchisi har doim joriy default"""
+    sets = [dict(DEFAULT_WEIGHTS)]
+
+    if grid_path:
+        with open(grid_path, 'r', encoding='utf-8') as f:
+            for partial in json.load(f):
+                sets.append({**DEFAULT_WEIGHTS, **partial})
+
+    rng = np.random.default_rng(seed)
+    for _ in range(n_random):
+        values = np.round(rng.uniform(low, high, len(CHUNK_TYPES)), 2)
+        sets.append(dict(zip(CHUNK_TYPES, values.tolist())))
+
+    return sets
+
+
+# ============================================================================
+# SWEEP
+# ============================================================================
+def sweep(
+        T: np.ndarray,
+        F: np.ndarray,
+        weight_sets: List[Dict[str, float]],
+        query_idx: np.ndarray,
+        culprit_idx: np.ndarray,
+        fixed_queries: np.ndarray = None,
+        top_k: Tuple[int, ...] = (1, 5, 10, 20),
+        batch_sets: int = 4
+) -> List[Dict[str, Any]]:
+    """
+    Weight to'plamlarini batch'lab baholash
+
+    Args:
+        query_idx: Bug issue indekslari (cache ichida, -1 - cache'da yo'q)
+        culprit_idx: Culprit issue indekslari
+        fixed_queries: (n_queries, dim) oldindan encode qilingan query'lar (yoki None)
+    """
+    W = np.array([[ws[t] for t in CHUNK_TYPES] for ws in weight_sets], dtype=np.float32)
+    results = []
+    rows = np.arange(len(culprit_idx))
+
+    for start in range(0, len(W), batch_sets):
+        Wb = W[start:start + batch_sets]
+
+        # (b, n_issues, dim) - weighted average
+        V = np.einsum('bk,ikd->bid', Wb, T, optimize=True)
+        den = (F @ Wb.T.astype(np.float64)).T.astype(np.float32)
+        V /= np.where(den > 0, den, 1.0)[..., None]
+
+        # Cosine uchun normalizatsiya
+        norms = np.linalg.norm(V, axis=2, keepdims=True)
+        V /= np.where(norms > 0, norms, 1.0)
+
+        if fixed_queries is not None:
+            sims = np.einsum('qd,bid->bqi', fixed_queries, V, optimize=True)
+        else:
+            sims = np.einsum('bqd,bid->bqi', V[:, query_idx], V, optimize=True)
+
+        # Bug o'zini o'zi topmasligi kerak
+        self_idx = query_idx >= 0
+        sims[:, rows[self_idx], query_idx[self_idx]] = -np.inf
+
+        target = sims[:, rows, culprit_idx]
+        ranks = (sims > target[..., None]).sum(axis=2) + 1
+
+        for b in range(len(Wb)):
+            r = ranks[b]
+            metrics = {'mrr': float(np.mean(1.0 / r))}
+            for k in top_k:
+                metrics[f'recall@{k}'] = float(np.mean(r <= k))
+            results.append({
+                'index': start + b,
+                'weights': weight_sets[start + b],
+                'metrics': metrics,
+            })
+
+    return results
+
+
+def encode_queries(labels: List[Dict[str, str]], output_path: str):
+    """Query matnlarini bir marta encode qilib saqlash (embedder faqat shu yerda)"""
+    from utils.embedding_helper import EmbeddingHelper
+
+    with_text = [l for l in labels if l['query']]
+    if not with_text:
+        print("❌ Labels faylida 'query' ustuni bo'sh")
+        sys.exit(1)
+
+    embedding_helper = EmbeddingHelper()
+    vectors = np.array([embedding_helper.encode_query(l['query']) for l in with_text], dtype=np.float32)
+    np.savez(output_path, keys=np.array([l['bug'] for l in with_text], dtype=np.str_), vectors=vectors)
+    print(f"✅ {len(with_text)} ta query vektor yozildi: {output_path}")
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Chunk weight tuning (offline)")
+    parser.add_argument('--labels', required=True, help="bug,culprit[,query] - CSV yoki JSONL")
+    parser.add_argument('--grid', help="Weight to'plamlari JSON (list of dict)")
+    parser.add_argument('--random', type=int, default=0, help="Tasodifiy to'plamlar soni")
+    parser.add_argument('--low', type=float, default=0.5)
+    parser.add_argument('--high', type=float, default=4.0)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--metric', default='mrr', help="Saralash metrikasi: mrr, recall@5, ...")
+    parser.add_argument('--batch-sets', type=int, default=4, help="Bir vaqtda baholanadigan to'plamlar")
+    parser.add_argument('--query-vectors', help="encode_query natijasi (.npz: keys, vectors)")
+    parser.add_argument('--encode-queries', metavar='OUT_NPZ', help="Query'larni encode qilib saqlash va chiqish")
+    parser.add_argument('--cache-dir', help="Chunk vektor cache papkasi")
+    parser.add_argument('--output', help="Natija JSON fayli")
+    parser.add_argument('--top', type=int, default=10, help="Ekranga chiqariladigan to'plamlar")
+    args = parser.parse_args(argv)
+
+    print("=" * 80)
+    print("⚖️  CHUNK WEIGHT TUNING")
+    print("=" * 80)
+
+    labels = load_labels(args.labels)
+    print(f"🏷️  Labels: {len(labels)} ta bug → culprit")
+
+    if args.encode_queries:
+        encode_queries(labels, args.encode_queries)
+        return 0
+
+    # 1. Cache'ni bir marta yuklash
+    start = time.perf_counter()
+    cache = ChunkVectorCache(args.cache_dir).load_all()
+    if cache is None:
+        print("❌ Chunk vektor cache bo'sh. Avval 2_load_sprints.py ni ishga tushiring.")
+        return 1
+
+    key_index = {k: i for i, k in enumerate(cache['keys'].tolist())}
+    T, F = build_type_sums(cache)
+    print(f"📦 Cache: {len(key_index):,} issue, {len(cache['types']):,} chunk "
+          f"({time.perf_counter() - start:.1f}s)")
+    del cache
+
+    # 2. Query va culprit indekslari
+    fixed = None
+    if args.query_vectors:
+        with np.load(args.query_vectors) as data:
+            fixed = dict(zip(data['keys'].tolist(), data['vectors']))
+
+    usable = []
+    for l in labels:
+        if l['culprit'] not in key_index:
+            continue
+        if fixed is not None:
+            if l['bug'] in fixed:
+                usable.append(l)
+        elif l['bug'] in key_index:
+            usable.append(l)
+
+    if not usable:
+        print("❌ Hech bir label cache bilan mos kelmadi")
+        return 1
+
+    skipped = len(labels) - len(usable)
+    print(f"🎯 Baholanadi: {len(usable)} ta label" + (f" ({skipped} ta cache'da yo'q)" if skipped else ""))
+
+    culprit_idx = np.array([key_index[l['culprit']] for l in usable])
+    query_idx = np.array([key_index.get(l['bug'], -1) for l in usable])
+    fixed_queries = None
+    if fixed is not None:
+        fixed_queries = np.array([fixed[l['bug']] for l in usable], dtype=np.float32)
+        fixed_queries /= np.linalg.norm(fixed_queries, axis=1, keepdims=True)
+
+    # 3. Sweep
+    weight_sets = make_weight_sets(args.grid, args.random, args.low, args.high, args.seed)
+    print(f"⚖️  Weight to'plamlari: {len(weight_sets)} ta")
+
+    start = time.perf_counter()
+    results = sweep(T, F, weight_sets, query_idx, culprit_idx, fixed_queries, batch_sets=args.batch_sets)
+    elapsed = time.perf_counter() - start
+    print(f"⏱️  Sweep: {elapsed:.1f}s ({elapsed / len(weight_sets) * 1000:.0f} ms/to'plam)")
+
+    if args.metric not in results[0]['metrics']:
+        print(f"❌ Noma'lum metrika: {args.metric}")
+        return 1
+
+    baseline = results[0]
+    ranked = sorted(results, key=lambda r: r['metrics'][args.metric], reverse=True)
+
+    # 4. Natija
+    print()
+    print(f"🏆 TOP {args.top} ({args.metric}):")
+    metric_names = list(baseline['metrics'].keys())
+    print(f"{'#':<5}" + ''.join(f"{m:>11}" for m in metric_names))
+    print("-" * (5 + 11 * len(metric_names)))
+    for r in ranked[:args.top]:
+        label = 'base' if r['index'] == 0 else str(r['index'])
+        print(f"{label:<5}" + ''.join(f"{r['metrics'][m]:>11.4f}" for m in metric_names))
+
+    best = ranked[0]
+    print()
+    print("✅ Eng yaxshi weight'lar:")
+    for t in CHUNK_TYPES:
+        print(f"   {t:<16}: {best['weights'][t]:.2f}  (default {DEFAULT_WEIGHTS[t]:.2f})")
+    gain = best['metrics'][args.metric] - baseline['metrics'][args.metric]
+    print(f"   {args.metric}: {baseline['metrics'][args.metric]:.4f} → {best['metrics'][args.metric]:.4f} ({gain:+.4f})")
+
+    output = args.output or os.path.join(
+        os.getenv('DATA_DIR', './data'), 'tuning', f"chunk_weights_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({
+            'metric': args.metric,
+            'labels': len(usable),
+            'baseline': baseline,
+            'best': best,
+            'results': ranked,
+        }, f, indent=2, ensure_ascii=False)
+
+    print()
+    print(f"📝 Natija: {output}")
+    print("   Qo'llash: ChunkingHelper(max_chunk_length=1500, weights=<best.weights>)")
+    print("=" * 80)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,423 @@
+# services/ingest_service.py
+"""
+Ingest Service - sprint fayllar / issue'lar → VectorDB
+
+2_load_sprints.py va ingest_from_jira.py shu service'ni chaqiradi; webhook
+service ham (sprint yopilganda) - o'zining allaqachon yuklangan modeli bilan,
+yangi process va e5-large'ni qayta yuklamasdan.
+
+Helper'lar tashqaridan berilishi mumkin (webhook, UI), berilmasa birinchi
+ishlatilganda yaratiladi (lazy). Bitta service'da bir vaqtda bitta ingest
+(lock) - manifest va chunk cache bir xil faylga ikki marta yozilmasin.
+
+Usage:
+    service = IngestService(embedding_helper=..., vectordb_helper=...)
+    report = service.ingest_workbook("D:/reports/DEV_Sprint_3081.xlsx")
+    result = service.ingest_issues(issue_dicts, source="JIRA_DEV_Sprint_3081")
+"""
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Iterable, Callable
+
+from dotenv import load_dotenv
+from tqdm import tqdm
+
+from utils.ingest_manifest import file_content_hash
+from utils.ingest_pipeline import IngestResult, IngestSource
+from utils.sprint_snapshot import list_sprint_sources, resolve_sprint_source, open_sprint_reader
+from utils.sprint_workbook_reader import parse_sprint_id
+
+load_dotenv()
+
+
+@dataclass
+class WorkbookIngestResult:
+    """Bitta fayl natijasi"""
+    file_name: str                 # manifest nomi (fayl nomi)
+    file_path: str
+    state: str = ''                # new / changed / stale / in_progress / done
+    status: str = 'pending'        # loaded / skipped / empty / failed
+    source_path: str = ''          # haqiqatda o'qilgan fayl (.parquet yoki .xlsx)
+    total_rows: int = 0
+    resumed_from: int = 0          # --resume: shu qatorgacha oldin yozilgan
+    result: Optional[IngestResult] = None
+    error_message: str = ""
+
+    @property
+    def success(self) -> bool:
+        return self.status in ('loaded', 'skipped', 'empty')
+
+
+@dataclass
+class IngestReport:
+    """ingest_workbooks() natijasi"""
+    files: List[WorkbookIngestResult] = field(default_factory=list)
+    pipeline: Optional[IngestResult] = None    # run_many() umumiy natija (stages)
+    error_message: str = ""                    # butun run xatoligi (embed/write)
+
+    def by_status(self, status: str) -> List[WorkbookIngestResult]:
+        return [f for f in self.files if f.status == status]
+
+    @property
+    def success(self) -> bool:
+        return not self.error_message and all(f.success for f in self.files)
+
+    @property
+    def issues(self) -> int:
+        return sum(f.result.issues for f in self.by_status('loaded'))
+
+    @property
+    def chunks(self) -> int:
+        return sum(f.result.chunks for f in self.by_status('loaded'))
+
+    @property
+    def root_causes(self) -> int:
+        return sum(f.result.root_causes for f in self.by_status('loaded'))
+
+    @property
+    def solutions(self) -> int:
+        return sum(f.result.solutions for f in self.by_status('loaded'))
+
+
+class IngestService:
+    """Sprint ma'lumotlarini VectorDB ga yuklash - helper'lar qayta ishlatiladi"""
+
+    def __init__(
+            self,
+            embedding_helper=None,
+            vectordb_helper=None,
+            chunking_helper=None,
+            chunk_cache=None,
+            manifest=None,
+            pipeline=None
+    ):
+        """
+        Args:
+            embedding_helper: EmbeddingHelper (None - lazy)
+            vectordb_helper: VectorDBHelper (None - lazy)
+            chunking_helper: ChunkingHelper (None - lazy, max_chunk_length=1500)
+            chunk_cache: ChunkVectorCache (None - lazy)
+            manifest: IngestManifest (None - lazy, INGEST_MANIFEST_PATH)
+            pipeline: IngestPipeline (None - yuqoridagi helper'lardan)
+        """
+        self._embedding_helper = embedding_helper
+        self._vectordb_helper = vectordb_helper
+        self._chunking_helper = chunking_helper
+        self._chunk_cache = chunk_cache
+        self._manifest = manifest
+        self._pipeline = pipeline
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------------
+    # Lazy helpers
+    # ------------------------------------------------------------------------
+    @property
+    def embedding(self):
+        """Lazy EmbeddingHelper (model yuklanadi)"""
+        if self._embedding_helper is None:
+            from utils.embedding_helper import EmbeddingHelper
+            self._embedding_helper = EmbeddingHelper()
+        return self._embedding_helper
+
+    @property
+    def vectordb(self):
+        """Lazy VectorDBHelper"""
+        if self._vectordb_helper is None:
+            from utils.vectordb_helper import VectorDBHelper
+            self._vectordb_helper = VectorDBHelper()
+        return self._vectordb_helper
+
+    @property
+    def chunking(self):
+        """Lazy ChunkingHelper"""
+        if self._chunking_helper is None:
+            from utils.chunking_helper import ChunkingHelper
+            self._chunking_helper = ChunkingHelper(max_chunk_length=1500)
+        return self._chunking_helper
+
+    @property
+    def chunk_cache(self):
+        """Lazy ChunkVectorCache"""
+        if self._chunk_cache is None:
+            from utils.chunk_vector_cache import ChunkVectorCache
+            self._chunk_cache = ChunkVectorCache()
+        return self._chunk_cache
+
+    @property
+    def manifest(self):
+        """Lazy IngestManifest"""
+        if self._manifest is None:
+            from utils.ingest_manifest import IngestManifest
+            self._manifest = IngestManifest()
+        return self._manifest
+
+    @property
+    def pipeline(self):
+        """Lazy IngestPipeline"""
+        if self._pipeline is None:
+            from utils.ingest_pipeline import IngestPipeline
+            self._pipeline = IngestPipeline(
+                self.embedding, self.vectordb, self.chunking, chunk_cache=self.chunk_cache
+            )
+        return self._pipeline
+
+    def warm_up(self):
+        """Hamma helper'larni oldindan yuklash (service startup)"""
+        return self.pipeline
+
+    def close(self):
+        if self._manifest is not None:
+            self._manifest.close()
+
+    # ------------------------------------------------------------------------
+    # Workbooks
+    # ------------------------------------------------------------------------
+    def check_workbooks(self, paths: List[str]) -> List[WorkbookIngestResult]:
+        """
+        Fayllar holati (manifest bo'yicha) - hech narsa yuklanmaydi
+
+        Holat 'done' bo'lsa status='skipped', qolganlari 'pending'.
+        """
+        signature = self.pipeline.signature()
+        files = []
+        for path in paths:
+            item = WorkbookIngestResult(file_name=os.path.basename(path), file_path=path)
+            try:
+                item.source_path = resolve_sprint_source(path)
+                item.state = self.manifest.file_state(
+                    item.file_name, file_content_hash(item.source_path), signature
+                )
+            except Exception as e:
+                item.status = 'failed'
+                item.error_message = f"Faylni o'qishda xatolik: {e}"
+            else:
+                if item.state == 'done':
+                    item.status = 'skipped'
+            files.append(item)
+        return files
+
+    def ingest_workbooks(
+            self,
+            paths: List[str],
+            resume: bool = False,
+            show_progress: bool = True,
+            status_callback: Optional[Callable[[str, str], None]] = None
+    ) -> IngestReport:
+        """
+        Sprint fayllarni yuklash (yangi/o'zgargan - manifest bo'yicha)
+
+        Hamma yuklanadigan fayllar bitta run_many() da: bir nechta fayl bir
+        vaqtda o'qiladi, embedder va writer bitta.
+
+        Args:
+            paths: .xlsx / .parquet yo'llari
+            resume: Yarim qolgan fayllarni checkpoint'dan davom ettirish
+            show_progress: tqdm progress bar
+            status_callback: Status update callback function(status_type, message)
+
+        Returns:
+            IngestReport
+        """
+
+        def update_status(status_type: str, message: str):
+            """Status update helper"""
+            if status_callback:
+                status_callback(status_type, message)
+            tqdm.write(message)  # progress bar buzilmasin
+
+        with self._lock:
+            files = self.check_workbooks(paths)
+            pending = [f for f in files if f.status == 'pending']
+            report = IngestReport(files=files)
+
+            for item in files:
+                if item.status == 'skipped':
+                    update_status("info", f"   ⏭️  O'tkazib yuborildi: {item.file_name} (allaqachon yuklangan)")
+                elif item.status == 'failed':
+                    update_status("error", f"   ❌ {item.file_name}: {item.error_message}")
+            if not pending:
+                return report
+
+            signature = self.pipeline.signature()
+            # O'zgarmagan issue'lar (hash + signature bir xil) - begin_file'lardan oldin o'qiladi
+            known_hashes = self.manifest.issue_hashes(signature)
+            readers = {}
+            sources = []
+
+            try:
+                for item in pending:
+                    source = self._prepare_workbook(item, resume, signature, known_hashes,
+                                                    readers, update_status)
+                    if source is not None:
+                        sources.append(source)
+
+                if sources:
+                    update_status("progress", f"⏳ Yuklanmoqda: {len(sources)} ta fayl "
+                                              f"(read → chunk → embed → write)...")
+                    report.pipeline = self.pipeline.run_many(sources, show_progress=show_progress)
+            except Exception as e:
+                report.error_message = str(e)
+                update_status("error", f"❌ VectorDB ga yuklashda xatolik: {e}")
+                update_status("info", "   💾 Checkpoint'lar saqlangan - davom ettirish uchun resume")
+                for item in pending:
+                    if item.status == 'pending':
+                        item.status = 'failed'
+                        item.error_message = str(e)
+            finally:
+                for reader in readers.values():
+                    reader.close()
+
+            return report
+
+    def ingest_workbook(self, path: str, resume: bool = False, show_progress: bool = True,
+                        status_callback: Optional[Callable[[str, str], None]] = None) -> WorkbookIngestResult:
+        """Bitta sprint faylni yuklash (ingest_workbooks() ning qisqa shakli)"""
+        report = self.ingest_workbooks([path], resume=resume, show_progress=show_progress,
+                                       status_callback=status_callback)
+        return report.files[0]
+
+    def ingest_directory(self, directory: str = None, **kwargs) -> IngestReport:
+        """Papkadagi hamma sprint fayllar (default: EXCEL_DIR)"""
+        directory = directory or os.getenv('EXCEL_DIR')
+        paths = [os.path.join(directory, name) for name in list_sprint_sources(directory)]
+        return self.ingest_workbooks(paths, **kwargs)
+
+    def _prepare_workbook(self, item: WorkbookIngestResult, resume: bool, signature: str,
+                          known_hashes: Dict[str, str], readers: Dict[str, Any],
+                          update_status: Callable[[str, str], None]) -> Optional[IngestSource]:
+        """Reader ochish, checkpoint, manifest.begin_file → IngestSource"""
+        manifest = self.manifest
+        name = item.file_name
+
+        try:
+            reader = open_sprint_reader(item.file_path, sprint_id=parse_sprint_id(name))
+            item.total_rows = reader.total_rows
+        except Exception as e:
+            item.status = 'failed'
+            item.error_message = f"Faylni o'qishda xatolik: {e}"
+            update_status("error", f"   ❌ {name}: {item.error_message}")
+            return None
+        readers[name] = reader
+
+        # Checkpoint (faqat resume, fayl va pipeline sozlamalari o'zgarmagan bo'lsa)
+        checkpoint = manifest.get_checkpoint(name) if item.state == 'in_progress' else None
+        resumed = bool(resume and checkpoint and checkpoint['signature'] == signature)
+        if resume and checkpoint and not resumed:
+            update_status("warning", f"   ⚠️  {name}: model/chunking sozlamalari o'zgargan - boshidan yuklanadi")
+
+        manifest.begin_file(
+            name, file_content_hash(item.source_path), signature=signature,
+            model=self.embedding.model_name, size=os.path.getsize(item.source_path), reset=not resumed
+        )
+        if not resumed:
+            checkpoint = manifest.get_checkpoint(name)
+            # O'zgargan / yarim qolgan fayl: skip qilinadigan (known_hashes) issue'larning
+            # chunk vektorlari eski shard'larda qoladi - start_batch=0 ularni o'chirardi
+            if item.state in ('changed', 'in_progress'):
+                checkpoint['batches'] = self.chunk_cache.next_batch_index(name)
+        else:
+            item.resumed_from = checkpoint['last_row']
+
+        update_status("info", f"   📖 {name}: {item.total_rows} qator ({os.path.basename(item.source_path)})"
+                              + (f", resume: qator {item.resumed_from} dan" if resumed else ""))
+
+        def on_done(result: IngestResult):
+            """Fayl tugadi (writer thread'ida) - manifest yakuniy holati"""
+            readers.pop(name).close()
+            item.result = result
+
+            if result.error is not None:
+                item.status = 'failed'
+                item.error_message = str(result.error)
+                last_row = (manifest.get_checkpoint(name) or {}).get('last_row', checkpoint['last_row'])
+                update_status("error", f"❌ {name}: yuklashda xatolik: {result.error} "
+                                       f"(checkpoint: qator {last_row})")
+                return
+
+            # Yakuniy holat - checkpoint o'chadi, hisoblagichlar files jadvaliga (bitta tranzaksiya)
+            manifest.complete_file(name, rows_count=item.total_rows)
+            if not manifest.file_issue_count(name):
+                item.status = 'empty'
+                update_status("warning", f"⚠️  {name}: ma'lumot topilmadi")
+                return
+
+            item.status = 'loaded'
+            update_status("success", f"✅ {name}: {result.issues} ta issue ({result.chunks} chunks), "
+                                     f"o'zgarmagan: {result.skipped} ta - {result.seconds:.1f}s")
+
+        return IngestSource(
+            name,
+            reader.iter_issues(start_row=checkpoint['last_row'] + 1),
+            total=max(item.total_rows - checkpoint['last_row'] + 1, 0),
+            start_batch=checkpoint['batches'],
+            on_batch=self._checkpoint_callback(signature),
+            skip_issue=lambda key, issue_hash: known_hashes.get(key) == issue_hash,
+            on_done=on_done
+        )
+
+    def _checkpoint_callback(self, signature: str) -> Callable:
+        def on_batch(batch, result):
+            """Batch VectorDB ga yozilgach - issue hash'lar + checkpoint bitta tranzaksiyada"""
+            self.manifest.save_batch(
+                batch.source,
+                last_row=batch.last_row,
+                batches=batch.index + 1,
+                issues=list(zip(batch.keys, batch.issue_hashes, batch.rows)) + batch.skipped,
+                chunks=batch.chunk_count,
+                signature=signature
+            )
+        return on_batch
+
+    # ------------------------------------------------------------------------
+    # Issues (JIRA va boshqa manbalar)
+    # ------------------------------------------------------------------------
+    def ingest_issues(
+            self,
+            issues: Iterable[Dict[str, Any]],
+            source: str,
+            total: int = None,
+            version: str = None,
+            show_progress: bool = True
+    ) -> IngestResult:
+        """
+        Issue dict'larni yuklash (build_issue() formatida, 'row' - tartib raqami)
+
+        Fayl yo'q - har bir chaqiruv manbaning yangi versiyasi; o'zgarmagan
+        issue'lar (hash bo'yicha) qayta embed qilinmaydi.
+
+        Args:
+            issues: Issue dict'lar iterable'i (generator bo'lishi mumkin)
+            source: Manifest / chunk cache nomi (JIRA_DEV_Sprint_3081)
+            total: Progress bar uchun taxminiy issue soni
+            version: Manifest content_hash o'rniga (default: vaqt)
+            show_progress: tqdm progress bar
+
+        Returns:
+            IngestResult
+
+        Raises:
+            Pipeline xatoligi (manifest'da checkpoint qoladi)
+        """
+        with self._lock:
+            signature = self.pipeline.signature()
+            known_hashes = self.manifest.issue_hashes(signature)
+            self.manifest.begin_file(
+                source, version or f"issues-{datetime.now().isoformat()}",
+                signature=signature, model=self.embedding.model_name
+            )
+
+            result = self.pipeline.run(
+                source,
+                issues,
+                total=total,
+                show_progress=show_progress,
+                # O'zgarmagan issue'lar skip qilinadi - ularning chunk vektorlari eski shard'larda qoladi
+                start_batch=self.chunk_cache.next_batch_index(source),
+                on_batch=self._checkpoint_callback(signature),
+                skip_issue=lambda key, issue_hash: known_hashes.get(key) == issue_hash
+            )
+
+            self.manifest.complete_file(source, rows_count=result.issues + result.skipped)
+            return result
@@ -236,19 +236,15 @@ class TestCaseGeneratorService:
             details = []
             tf, ta, tdel = 0, 0, 0
 
-            for item in urls:
-                url = item.get('url', '')
-                if not url:
-                    continue
-                owner, repo, num = self.github.parse_pr_url(url)
-                if not all([owner, repo, num]):
-                    continue
+            # PR'lar (info + files) parallel
+            from utils.github.async_github_client import fetch_prs
+            fetched_prs = fetch_prs([item.get('url', '') for item in urls if item.get('url')], self.github)
 
-                pr = self.github.get_pr_info(owner, repo, num)
-                if not pr:
+            for fetched in fetched_prs:
+                if not fetched or not fetched['info']:
                     continue
 
-                files = self.github.get_pr_files(owner, repo, num)
+                pr, files = fetched['info'], fetched['files']
                 tf += len(files)
                 ta += pr.get('additions', 0)
                 tdel += pr.get('deletions', 0)
@@ -153,24 +153,26 @@ class TZPRService:
             total_additions = 0
             total_deletions = 0
 
-            for idx, pr_info in enumerate(pr_urls, 1):
-                pr_url = pr_info['url']
-                update_status("progress", f"   🔗 [{idx}/{len(pr_urls)}] PR yuklanmoqda: {pr_url}")
+            # Hamma PR'lar (info + files) parallel - ketma-ket round-trip'lar o'rniga
+            from utils.github.async_github_client import fetch_prs
+            update_status("progress", f"   🔗 {len(pr_urls)} ta PR yuklanmoqda...")
+            fetched_prs = fetch_prs([pr_info['url'] for pr_info in pr_urls], self.github)
 
-                owner, repo, pr_number = self.github.parse_pr_url(pr_url)
+            for pr_info, fetched in zip(pr_urls, fetched_prs):
+                pr_url = pr_info['url']
 
-                if not all([owner, repo, pr_number]):
+                if fetched is None:
                     update_status("warning", f"   ⚠️ PR URL parse qilinmadi: {pr_url}")
                     continue
 
-                # PR info
-                pr_details = self.github.get_pr_info(owner, repo, pr_number)
+                pr_number = fetched['pr_number']
+                pr_details = fetched['info']
                 if not pr_details:
                     update_status("warning", f"   ⚠️ PR ma'lumotlari olinmadi: #{pr_number}")
                     continue
 
                 # PR files - BARCHA FAYLLAR!
-                pr_files = self.github.get_pr_files(owner, repo, pr_number)
+                pr_files = fetched['files']
 
                 total_files += len(pr_files)
                 total_additions += pr_details.get('additions', 0)
@@ -178,8 +180,8 @@ class TZPRService:
 
                 all_pr_details.append({
                     'url': pr_url,
-                    'owner': owner,
-                    'repo': repo,
+                    'owner': fetched['owner'],
+                    'repo': fetched['repo'],
                     'pr_number': pr_number,
                     'title': pr_details.get('title', ''),
                     'state': pr_details.get('state', ''),
@@ -3,7 +3,7 @@ JIRA Webhook Service - MINIMAL VERSION
 =======================================
 
 Task "Ready to Test" statusiga o'tganda avtomatik TZ-PR tekshirish
-Sprint close bo'lganda avtomatik Excel download va embedding
+Sprint close bo'lganda avtomatik embedding (JIRA → VectorDB, Excel'siz)
 
 Author: JASUR TURGUNOV
 Date: 2025-12-26
@@ -16,12 +16,14 @@ from datetime import datetime
 import logging
 import sys
 import os
+import threading
 
 # Loyiha root path qo'shish
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Imports
 from services.tz_pr_service import TZPRService
+from services.ingest_service import IngestService
 from utils.jira.jira_comment_writer import JiraCommentWriter
 
 # ============================================================================
@@ -49,6 +51,8 @@ app = FastAPI(
 # Services (lazy loading)
 _tz_pr_service = None
 _comment_writer = None
+_ingest_service = None
+_ingest_service_lock = threading.Lock()
 
 
 def get_tz_pr_service():
@@ -67,6 +71,20 @@ def get_comment_writer():
     return _comment_writer
 
 
+def get_ingest_service():
+    """
+    Ingest service - singleton (embedding model bir marta yuklanadi)
+
+    Sync background task'lardan (FastAPI threadpool) chaqiriladi - lock bo'lmasa ikkita
+    parallel sprint_closed ikkita service (ikkita lock, ikkita model) yaratardi.
+    """
+    global _ingest_service
+    with _ingest_service_lock:
+        if _ingest_service is None:
+            _ingest_service = IngestService()
+        return _ingest_service
+
+
 # ============================================================================
 # WEBHOOK MODELS
 # ============================================================================
@@ -102,7 +120,23 @@ async def jira_webhook(
         # Webhook event type
         event = body.get('webhookEvent')
 
-        # Faqat issue update'larni qabul qilamiz
+        # Sprint yopildi - issue'larni VectorDB ga yuklash
+        if event == "sprint_closed":
+            sprint = body.get('sprint', {})
+            sprint_id = sprint.get('id')
+            if not sprint_id:
+                logger.warning(" No sprint id found")
+                return {"status": "error", "reason": "no sprint id"}
+
+            logger.info(f"Sprint {sprint_id} ({sprint.get('name')}) closed - starting ingest...")
+            background_tasks.add_task(ingest_closed_sprint, sprint_id=int(sprint_id))
+            return {
+                "status": "processing",
+                "sprint_id": sprint_id,
+                "message": "Sprint ingest started"
+            }
+
+        # Qolganlaridan faqat issue update'larni qabul qilamiz
         if event != "jira:issue_updated":
             logger.info(f"⏭️  Event '{event}' ignored (not issue update)")
             return {"status": "ignored", "reason": f"event is '{event}'"}
@@ -230,6 +264,34 @@ async def check_tz_pr_and_comment(task_key: str, new_status: str):
             pass
 
 
+# ============================================================================
+# BACKGROUND TASK - SPRINT INGEST
+# ============================================================================
+
+def ingest_closed_sprint(sprint_id: int):
+    """
+    Background task: yopilgan sprint issue'larini VectorDB ga yuklash
+
+    Oddiy (sync) function - FastAPI uni threadpool'da ishlatadi, event loop
+    bloklanmaydi. Model va helper'lar service singleton'ida qoladi.
+    """
+    try:
+        from scripts.download_file import get_jira_client
+        from scripts.ingest_from_jira import ingest_sprint
+
+        logger.info(f"[Sprint {sprint_id}] Ingest started...")
+        sprint_info, result = ingest_sprint(
+            get_ingest_service(), get_jira_client(), sprint_id, show_progress=False
+        )
+        logger.info(
+            f"[Sprint {sprint_id}] {sprint_info['name']}: {result.issues} issue loaded, "
+            f"{result.skipped} unchanged, {result.chunks} chunks ({result.seconds:.1f}s)"
+        )
+
+    except Exception as e:
+        logger.error(f"[Sprint {sprint_id}] Ingest error: {e}", exc_info=True)
+
+
 # ============================================================================
 # COMMENT FORMATTERS
 # ============================================================================
@@ -346,6 +408,7 @@ async def root():
         "endpoints": {
             "webhook": "/webhook/jira",
             "manual_check": "/manual/check/{task_key}",
+            "manual_ingest": "/manual/ingest/sprint/{sprint_id}",
             "health": "/health"
         },
         "timestamp": datetime.now().isoformat()
@@ -403,6 +466,25 @@ async def manual_check(task_key: str, background_tasks: BackgroundTasks):
     }
 
 
+@app.post("/manual/ingest/sprint/{sprint_id}")
+async def manual_ingest(sprint_id: int, background_tasks: BackgroundTasks):
+    """
+    Manual trigger - sprintni VectorDB ga yuklash
+
+    Usage:
+        curl -X POST http://localhost:8000/manual/ingest/sprint/3081
+    """
+    logger.info(f"Manual ingest triggered for sprint {sprint_id}")
+
+    background_tasks.add_task(ingest_closed_sprint, sprint_id=sprint_id)
+
+    return {
+        "status": "processing",
+        "sprint_id": sprint_id,
+        "message": f"Sprint {sprint_id} ingest started"
+    }
+
+
 # ============================================================================
 # STARTUP EVENT
 # ============================================================================
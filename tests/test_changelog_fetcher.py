@@ -0,0 +1,68 @@
+# tests/test_changelog_fetcher.py
+"""
+JiraChangelogFetcher._merge - embed qilingan (+0500) va bulk (epoch ms) history'lar
+
+Ustunlar StatusChange.minute (created[:16]) ni ko'rsatadi - birlashgan tarixda
+hamma vaqtlar bitta offset'da bo'lishi kerak.
+"""
+from datetime import datetime, timezone
+
+from jira.resources import Issue
+
+from utils.jira.changelog_fetcher import JiraChangelogFetcher
+from utils.jira.issue_timeline import get_timeline
+
+
+def _history(history_id, created, from_status, to_status):
+    return {
+        'id': str(history_id), 'created': created, 'author': {'displayName': 'Dev'},
+        'items': [{'field': 'status', 'fromString': from_status, 'toString': to_status}],
+    }
+
+
+def _epoch_ms(value: str) -> int:
+    return int(datetime.fromisoformat(value).timestamp() * 1000)
+
+
+def test_merge_renders_bulk_epoch_histories_in_site_offset():
+    embedded = [
+        _history(3, '2025-01-15T14:00:00.000+0500', 'In Progress', 'Testing'),
+        _history(4, '2025-01-16T10:30:00.000+0500', 'Testing', 'Return'),
+    ]
+    issue = Issue({'server': ''}, None, raw={
+        'id': '10001', 'key': 'DEV-1',
+        'fields': {'created': '2025-01-14T09:00:00.000+0500'},
+        'changelog': {'startAt': 0, 'maxResults': 2, 'total': 4, 'histories': embedded},
+    })
+    # Bulk: eski history'lar epoch ms (UTC), bittasi embed qilinganining dublikati
+    bulk = [
+        _history(1, _epoch_ms('2025-01-14T05:00:00+00:00'), 'Open', 'In Progress'),
+        _history(2, _epoch_ms('2025-01-15T04:15:00+00:00'), 'In Progress', 'In Progress'),
+        _history(3, _epoch_ms('2025-01-15T09:00:00+00:00'), 'In Progress', 'Testing'),
+    ]
+
+    JiraChangelogFetcher(jira=None)._merge(issue, bulk)
+
+    histories = issue.raw['changelog']['histories']
+    assert [history['id'] for history in histories] == ['1', '2', '3', '4']
+    assert [history['created'] for history in histories] == [
+        '2025-01-14T10:00:00.000+0500',
+        '2025-01-15T09:15:00.000+0500',
+        '2025-01-15T14:00:00.000+0500',
+        '2025-01-16T10:30:00.000+0500',
+    ]
+
+    minutes = [change.minute for change in get_timeline(issue).status_changes]
+    assert minutes == ['2025-01-14 10:00', '2025-01-15 09:15', '2025-01-15 14:00', '2025-01-16 10:30']
+
+
+def test_merge_without_offset_hint_keeps_utc():
+    issue = Issue({'server': ''}, None, raw={
+        'id': '10002', 'key': 'DEV-2', 'fields': {},
+        'changelog': {'startAt': 0, 'maxResults': 0, 'total': 1, 'histories': []},
+    })
+    moment = datetime(2025, 1, 14, 5, 0, tzinfo=timezone.utc)
+
+    JiraChangelogFetcher(jira=None)._merge(issue, [_history(1, int(moment.timestamp() * 1000), 'Open', 'Done')])
+
+    assert issue.raw['changelog']['histories'][0]['created'] == '2025-01-14T05:00:00.000+0000'
@@ -0,0 +1,31 @@
+# tests/test_http_client.py
+"""
+AsyncHttpClient - HTTP/2 (h2 requirements.txt da) va h2 yo'q muhitda HTTP/1.1 fallback
+"""
+import importlib.util
+import logging
+
+from utils import http_client
+from utils.http_client import AsyncHttpClient
+
+
+def test_http2_enabled_by_default(monkeypatch):
+    monkeypatch.delenv('HTTP2', raising=False)
+    assert AsyncHttpClient().http2 is True
+
+
+def test_http2_env_switch(monkeypatch):
+    monkeypatch.setenv('HTTP2', '0')
+    assert AsyncHttpClient().http2 is False
+
+
+def test_missing_h2_falls_back_with_warning(monkeypatch, caplog):
+    find_spec = importlib.util.find_spec
+    monkeypatch.setattr(http_client.importlib.util, 'find_spec',
+                        lambda name, *args: None if name == 'h2' else find_spec(name, *args))
+
+    with caplog.at_level(logging.WARNING, logger=http_client.__name__):
+        client = AsyncHttpClient(http2=True)
+
+    assert client.http2 is False
+    assert 'h2' in caplog.text
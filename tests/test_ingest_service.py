@@ -0,0 +1,121 @@
+# tests/test_ingest_service.py
+"""
+IngestService - qayta yuklashda chunk cache saqlanishi (issue'lar va workbook'lar)
+
+O'zgarmagan issue'lar skip qilinadi (embed/write yo'q), shuning uchun ularning
+chunk vektorlari faqat oldingi shard'larda - ikkinchi run ularni o'chirmasligi kerak.
+"""
+import numpy as np
+
+from services.ingest_service import IngestService
+from utils.chunk_vector_cache import ChunkVectorCache
+from utils.chunking_helper import ChunkingHelper
+from utils.ingest_manifest import IngestManifest
+from utils.ingest_pipeline import IngestPipeline
+from utils.sprint_workbook_reader import build_issue
+
+DIM = 4
+
+
+class FakeEmbedding:
+    model_name = 'fake-embedding'
+
+    def encode_chunks(self, chunks, show_progress=False):
+        return [np.full(DIM, float(len(chunk['text'])), dtype=np.float32) for chunk in chunks]
+
+
+class FakeVectorDB:
+    def __init__(self):
+        self.written = []
+
+    def upsert_issues_batch_with_chunks(self, keys, **kwargs):
+        self.written.extend(keys)
+
+
+def make_issue(key, row, summary):
+    issue = build_issue({'Key': key, 'Summary': summary, 'Description': f"{key} tavsifi"}, sprint_id='1')
+    issue['row'] = row
+    return issue
+
+
+def make_service(tmp_path):
+    chunk_cache = ChunkVectorCache(str(tmp_path / 'chunks'))
+    vectordb = FakeVectorDB()
+    chunking = ChunkingHelper(max_chunk_length=1500)
+    embedding = FakeEmbedding()
+    pipeline = IngestPipeline(embedding, vectordb, chunking, chunk_cache=chunk_cache, batch_size=2)
+    service = IngestService(
+        embedding_helper=embedding, vectordb_helper=vectordb, chunking_helper=chunking,
+        chunk_cache=chunk_cache, manifest=IngestManifest(str(tmp_path / 'manifest.db')),
+        pipeline=pipeline
+    )
+    return service, vectordb
+
+
+def cached_keys(chunk_cache):
+    data = chunk_cache.load_all()
+    return set() if data is None else {str(key) for key in data['keys']}
+
+
+def test_ingest_issues_rerun_keeps_vectors_of_skipped_issues(tmp_path):
+    service, vectordb = make_service(tmp_path)
+    issues = [make_issue(f"DEV-{i}", i, f"Task {i}") for i in range(1, 6)]
+
+    service.ingest_issues(issues, source='JIRA_DEV_Sprint_1', show_progress=False)
+    assert cached_keys(service.chunk_cache) == {issue['key'] for issue in issues}
+
+    # Ikkinchi run: bitta issue o'zgargan, qolganlari skip
+    issues[2] = make_issue('DEV-3', 3, 'Task 3 (yangilangan)')
+    vectordb.written.clear()
+    result = service.ingest_issues(issues, source='JIRA_DEV_Sprint_1', show_progress=False)
+
+    assert vectordb.written == ['DEV-3']
+    assert result.skipped == 4
+    assert cached_keys(service.chunk_cache) == {issue['key'] for issue in issues}
+
+
+class FlakyVectorDB(FakeVectorDB):
+    """fail_after ta batch yozilgandan keyin xatolik (yarim qolgan fayl)"""
+
+    def __init__(self, fail_after):
+        super().__init__()
+        self.fail_after = fail_after
+        self.calls = 0
+
+    def upsert_issues_batch_with_chunks(self, keys, **kwargs):
+        self.calls += 1
+        if self.calls > self.fail_after:
+            raise RuntimeError("VectorDB yiqildi")
+        super().upsert_issues_batch_with_chunks(keys, **kwargs)
+
+
+def write_workbook(path, issues):
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(['Key', 'Summary', 'Description'])
+    for issue in issues:
+        ws.append([issue['key'], issue['summary'], issue['description']])
+    wb.save(path)
+
+
+def test_in_progress_workbook_rerun_without_resume_keeps_vectors(tmp_path):
+    service, _ = make_service(tmp_path)
+    issues = [make_issue(f"DEV-{i}", i, f"Task {i}") for i in range(1, 7)]
+    path = str(tmp_path / 'DEV_Sprint_3081.xlsx')
+    write_workbook(path, issues)
+
+    # 1-run: ikkinchi batch'dan keyin yiqiladi - fayl in_progress, 4 issue manifest'da
+    service.pipeline.vectordb_helper = FlakyVectorDB(fail_after=2)
+    report = service.ingest_workbooks([path], show_progress=False)
+    assert report.files[0].status == 'failed'
+    assert cached_keys(service.chunk_cache) == {'DEV-1', 'DEV-2', 'DEV-3', 'DEV-4'}
+
+    # 2-run (--resume siz): yuklangan 4 tasi skip, vektorlari saqlanib qolishi kerak
+    vectordb = service.pipeline.vectordb_helper = FakeVectorDB()
+    report = service.ingest_workbooks([path], show_progress=False)
+
+    assert report.files[0].state == 'in_progress'
+    assert vectordb.written == ['DEV-5', 'DEV-6']
+    assert cached_keys(service.chunk_cache) == {issue['key'] for issue in issues}
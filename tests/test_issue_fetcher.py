@@ -0,0 +1,133 @@
+# tests/test_issue_fetcher.py
+"""
+JiraIssueFetcher - JIRA Cloud (nextPageToken) va Server (startAt) sahifalash
+
+Cloud fake - haqiqiy jira.JIRA (deploymentType='Cloud'), faqat _get_json almashtirilgan:
+search/jql javobida total yo'q, qolgani nextPageToken'da; eski 'search' endpoint'i xato.
+"""
+import re
+
+import pytest
+from jira import JIRA, JIRAError
+
+from utils.jira.issue_fetcher import JiraIssueFetcher
+
+ISSUE_COUNT = 350
+
+
+def _raw(number: int):
+    return {'id': str(10000 + number), 'key': f'DEV-{number}', 'fields': {'summary': f'Issue {number}'}}
+
+
+class CloudSearch:
+    """search/jql: JQL bo'yicha natija, server sahifa hajmini cheklaydi (fields=id - 1000, aks holda 40)"""
+
+    def __init__(self, count: int):
+        self.issues = [_raw(number) for number in range(count, 0, -1)]   # ORDER BY created DESC
+        self.calls = []
+
+    def __call__(self, path, params=None, base=None, use_post=False):
+        if path == 'field':
+            return []
+        self.calls.append((path, dict(params or {})))
+        if path == 'search/approximate-count':
+            return {'count': len(self.issues)}
+        if path != 'search/jql':
+            raise JIRAError("The `search` API is deprecated in Jira Cloud.", status_code=410)
+
+        match = re.match(r'id in \((.*)\)', params['jql'])
+        if match:
+            wanted = set(match.group(1).split(', '))
+            # 'id in' natijasi ID tartibida emas - fetcher qayta tartiblashi kerak
+            matched = sorted((raw for raw in self.issues if raw['id'] in wanted), key=lambda raw: raw['id'])
+        else:
+            matched = self.issues
+
+        limit = 1000 if params['fields'] == ['id'] else 40
+        start = int(params.get('nextPageToken') or 0)
+        size = min(params['maxResults'], limit)
+        page = matched[start:start + size]
+        if params['fields'] == ['id']:
+            page = [{'id': raw['id'], 'key': raw['key']} for raw in page]
+
+        response = {'issues': page}
+        if start + size < len(matched):
+            response['nextPageToken'] = str(start + size)
+        return response
+
+
+@pytest.fixture
+def cloud():
+    jira = JIRA(server='https://smartupx.atlassian.net', get_server_info=False)
+    jira.deploymentType = 'Cloud'
+    jira._get_json = CloudSearch(ISSUE_COUNT)
+    return jira
+
+
+def test_cloud_fetches_every_page_in_jql_order(cloud):
+    fetcher = JiraIssueFetcher(cloud, page_size=100, max_workers=3, requests_per_second=0)
+
+    keys = [issue.key for issue in fetcher.iter_issues('project = DEV ORDER BY created DESC', expand=None,
+                                                       fields='summary')]
+
+    assert keys == [f'DEV-{number}' for number in range(ISSUE_COUNT, 0, -1)]
+    assert fetcher.stats['total'] == ISSUE_COUNT
+    assert fetcher.stats['pages'] == 4
+    assert all(path == 'search/jql' for path, _ in cloud._get_json.calls)
+
+
+def test_cloud_batches_follow_next_page_token(cloud):
+    """Server batch'ni 40 taga kesadi - davomi token bilan olinadi"""
+    fetcher = JiraIssueFetcher(cloud, page_size=100, max_workers=2, requests_per_second=0)
+
+    issues = fetcher.fetch_all('project = DEV', expand=None, fields='summary')
+
+    assert len(issues) == ISSUE_COUNT
+    assert issues[0].fields.summary == f'Issue {ISSUE_COUNT}'
+    id_queries = [params for _, params in cloud._get_json.calls if params['jql'].startswith('id in')]
+    assert len(id_queries) == 4 * 3 - 1      # 100, 100, 100 → 3 so'rovdan, 50 → 2
+
+
+def test_cloud_count_uses_approximate_count(cloud):
+    fetcher = JiraIssueFetcher(cloud, requests_per_second=0)
+
+    assert fetcher.count('project = DEV') == ISSUE_COUNT
+    assert [path for path, _ in cloud._get_json.calls] == ['search/approximate-count']
+
+
+class _Issue:
+    def __init__(self, raw):
+        self.raw, self.id, self.key = raw, raw['id'], raw['key']
+
+
+class ServerPage(list):
+    def __init__(self, items, total, max_results):
+        super().__init__(items)
+        self.total = total
+        self.maxResults = max_results
+
+
+class ServerJira:
+    """Server / Data Center: startAt + total"""
+    _is_cloud = False
+
+    def __init__(self, count: int, server_page_limit: int = 50):
+        self.issues = [_Issue(_raw(number)) for number in range(count, 0, -1)]
+        self.limit = server_page_limit
+
+    def search_issues(self, jql, startAt=0, maxResults=50, expand=None, fields=None, json_result=False):
+        if json_result:
+            return {'total': len(self.issues)}
+        size = min(maxResults, self.limit)
+        return ServerPage(self.issues[startAt:startAt + size], len(self.issues), size)
+
+
+def test_server_offset_pages_unchanged():
+    jira = ServerJira(ISSUE_COUNT)
+    fetcher = JiraIssueFetcher(jira, page_size=100, max_workers=3, requests_per_second=0)
+
+    keys = [issue.key for issue in fetcher.iter_issues('project = DEV', expand=None)]
+
+    assert keys == [f'DEV-{number}' for number in range(ISSUE_COUNT, 0, -1)]
+    assert fetcher.stats['total'] == ISSUE_COUNT
+    assert fetcher.count('project = DEV') == ISSUE_COUNT
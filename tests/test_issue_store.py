@@ -0,0 +1,52 @@
+# tests/test_issue_store.py
+"""JiraIssueStore.sync - to'liq bo'lmagan fetch sprintni "yuklangan" qilmaydi, watermark surilmaydi"""
+import pytest
+from jira.resources import Issue
+
+from utils.jira.issue_store import JiraIssueStore
+
+
+def _raw(number: int, sprint_id: int = 3081):
+    return {'key': f'DEV-{number}', 'fields': {'customfield_10020': [{'id': sprint_id}],
+                                               'created': f'2024-01-{number:02d}'}}
+
+
+class TruncatingFetcher:
+    """Server total'i bor, lekin faqat birinchi sahifa beriladi (eski Cloud xatosi)"""
+
+    def __init__(self, total: int, returned: int):
+        self.total, self.returned = total, returned
+        self.stats = {}
+
+    def iter_pages(self, jql, expand=None, fields=None):
+        self.stats = {'total': self.total}
+        yield [Issue({'server': ''}, None, raw=_raw(number)) for number in range(1, self.returned + 1)]
+
+    def count(self, jql):
+        return self.total
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = JiraIssueStore(db_path=str(tmp_path / 'store.db'), sprint_field='customfield_10020')
+    yield store
+    store.close()
+
+
+def test_truncated_full_sync_is_not_marked(store):
+    with pytest.raises(RuntimeError, match="to'liq emas"):
+        store.sync(None, 'DEV', sprint_ids=[3081], fetcher=TruncatingFetcher(total=20, returned=10))
+
+    assert store.synced_sprints('DEV') == []
+    assert store.get_watermark('DEV') is None
+
+
+def test_truncated_incremental_sync_keeps_watermark(store):
+    store.sync(None, 'DEV', sprint_ids=[3081], fetcher=TruncatingFetcher(total=10, returned=10))
+    watermark = store.get_watermark('DEV')
+
+    with pytest.raises(RuntimeError):
+        store.sync(None, 'DEV', sprint_ids=[3081], fetcher=TruncatingFetcher(total=20, returned=10))
+
+    assert store.synced_sprints('DEV') == [3081]
+    assert store.get_watermark('DEV') == watermark
@@ -0,0 +1,99 @@
+# tests/test_jira_client.py
+"""
+JiraClient.get_tasks_details - bulk 'key in (...)' qidiruv
+
+Cloud fake - haqiqiy jira.JIRA (deploymentType='Cloud'), _get_json almashtirilgan:
+search/jql sahifalari nextPageToken bilan, mavjud bo'lmagan key - butun so'rov 400
+(Cloud validate_query'ni qabul qilmaydi). Dev Status va details dict'i test'dan tashqarida.
+"""
+import re
+
+import pytest
+from jira import JIRA, JIRAError
+from jira.resources import Issue
+
+from utils.jira import jira_client as jira_client_module
+from utils.jira.jira_client import JiraClient
+
+EXISTING = {f'DEV-{number}' for number in range(1, 151)}
+
+
+def _raw(key: str):
+    return {'id': str(10000 + int(key.split('-')[1])), 'key': key, 'fields': {'summary': key}}
+
+
+class CloudKeySearch:
+    """search/jql 'key in (...)': server sahifani 40 taga kesadi, noma'lum key - 400"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, path, params=None, base=None, use_post=False):
+        if path == 'field':
+            return []
+        self.calls.append((path, dict(params or {})))
+        if path != 'search/jql':
+            raise JIRAError("The `search` API is deprecated in Jira Cloud.", status_code=410)
+
+        keys = re.match(r'key in \((.*)\)', params['jql']).group(1).split(', ')
+        unknown = [key for key in keys if key not in EXISTING]
+        if unknown:
+            raise JIRAError(f"An issue with key '{unknown[0]}' does not exist", status_code=400)
+
+        start = int(params.get('nextPageToken') or 0)
+        size = min(params['maxResults'], 40)
+        response = {'issues': [_raw(key) for key in keys[start:start + size]]}
+        if start + size < len(keys):
+            response['nextPageToken'] = str(start + size)
+        return response
+
+
+@pytest.fixture
+def client(monkeypatch):
+    jira = JIRA(server='https://smartupx.atlassian.net', get_server_info=False)
+    jira.deploymentType = 'Cloud'
+    jira._get_json = CloudKeySearch()
+
+    def issue(key, fields=None, expand=None):
+        if key.upper() not in EXISTING:
+            raise JIRAError("Issue does not exist", status_code=404)
+        return Issue({'server': ''}, None, raw=_raw(key.upper()))
+
+    jira.issue = issue
+
+    async def no_dev_status(self, issues):
+        return {}
+
+    monkeypatch.setattr(JiraClient, '_dev_status_many', no_dev_status)
+    monkeypatch.setattr(JiraClient, 'extract_pr_urls_dev_status', lambda self, key, issue_id=None: [])
+    monkeypatch.setattr(JiraClient, 'build_task_details', lambda self, issue, pr_urls: {'key': issue.key})
+
+    client = JiraClient()
+    client._client = jira
+    return client
+
+
+def test_bulk_search_pages_with_next_page_token(client):
+    keys = [f'dev-{number}' for number in range(1, 151)]
+
+    details = client.get_tasks_details(keys)
+
+    assert list(details) == [key.upper() for key in keys]
+    assert all(details[key.upper()] == {'key': key.upper()} for key in keys)
+
+    calls = client.client._get_json.calls
+    assert all(path == 'search/jql' for path, _ in calls)
+    # 100 + 50 key: 3 + 2 sahifa (40 tadan)
+    assert len(calls) == 5
+
+
+def test_failed_chunk_falls_back_to_single_issues(client, monkeypatch):
+    monkeypatch.setattr(jira_client_module, 'BULK_KEYS_PER_JQL', 3)
+    keys = ['DEV-1', 'DEV-2', 'DEV-999', 'DEV-4', 'DEV-5']
+
+    details = client.get_tasks_details(keys)
+
+    assert details == {
+        'DEV-1': {'key': 'DEV-1'}, 'DEV-2': {'key': 'DEV-2'}, 'DEV-999': None,
+        'DEV-4': {'key': 'DEV-4'}, 'DEV-5': {'key': 'DEV-5'},
+    }
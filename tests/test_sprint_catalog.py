@@ -0,0 +1,62 @@
+# tests/test_sprint_catalog.py
+"""
+JiraSprintCatalog - boshqa board'da yaratilgan, lekin shu board'da ko'rinadigan sprint
+
+board/{id}/sprint ro'yxatida kelgan sprint originBoardId'dan qat'i nazar select()
+va incremental refresh'ga (yopilganini aniqlash) kirishi kerak.
+"""
+from utils.jira.sprint_catalog import JiraSprintCatalog
+
+BOARD_ID = 10
+
+
+def _sprint(sprint_id, state, origin=BOARD_ID, start='2025-01-01'):
+    return {'id': sprint_id, 'name': f"Sprint {sprint_id}", 'state': state, 'originBoardId': origin,
+            'startDate': f"{start}T09:00:00.000Z", 'endDate': None}
+
+
+class FakeAgile:
+    """board/{id}/sprint (state filtri bilan) va sprint/{id}"""
+    AGILE_BASE_URL = '{server}/rest/agile/1.0/{path}'
+
+    def __init__(self, sprints):
+        self.sprints = {sprint['id']: sprint for sprint in sprints}
+        self.calls = []
+
+    def _get_json(self, path, params=None, base=None):
+        self.calls.append(path)
+        if path.startswith('sprint/'):
+            return self.sprints[int(path.split('/')[1])]
+        states = (params or {}).get('state')
+        values = [s for s in self.sprints.values() if not states or s['state'] in states.split(',')]
+        return {'values': values, 'isLast': True}
+
+
+def test_foreign_origin_sprint_on_board_is_selected_and_tracked(tmp_path):
+    jira = FakeAgile([
+        _sprint(1, 'closed', start='2025-01-01'),
+        _sprint(2, 'active', origin=77, start='2025-01-15'),      # boshqa board'da yaratilgan
+    ])
+    catalog = JiraSprintCatalog(board_id=BOARD_ID, db_path=str(tmp_path / 'catalog.db'), ttl_minutes=0)
+
+    catalog.refresh(jira)
+    assert catalog.select() == [2, 1]
+    assert catalog.select(last=1, states=['active']) == [2]
+
+    # Sprint yopildi: incremental refresh uni ochiqlar ro'yxatida topmaydi - alohida so'raydi
+    jira.sprints[2]['state'] = 'closed'
+    result = catalog.refresh(jira)
+
+    assert 'sprint/2' in jira.calls
+    assert result['refreshed'] == 1
+    assert catalog.select(states=['active']) == []
+    assert catalog.select(states=['closed']) == [2, 1]
+
+
+def test_sprint_fetched_alone_keeps_origin_board(tmp_path):
+    jira = FakeAgile([_sprint(5, 'closed', origin=77)])
+    catalog = JiraSprintCatalog(board_id=BOARD_ID, db_path=str(tmp_path / 'catalog.db'))
+
+    assert catalog.sprint_info(jira, 5)['name'] == 'Sprint 5'
+    assert catalog.select() == []
+    assert catalog.select(board_only=False) == [5]
@@ -0,0 +1,86 @@
+# tests/test_sprint_watcher.py
+"""
+SprintDirWatcher - yuklanmagan fayllar backoff bilan qayta uriniladi
+
+Xatolikdan keyin fayl pending bo'lib qoladi (freshness lag 0 emas), backoff
+tugagach on_ready'ga yana beriladi.
+"""
+import os
+import time
+
+from utils.sprint_watcher import SprintDirWatcher
+
+
+class FlakyIngest:
+    """fail_times marta hech narsa yuklamaydi, keyin hammasi muvaffaqiyatli"""
+
+    def __init__(self, fail_times):
+        self.fail_times = fail_times
+        self.calls = []
+
+    def __call__(self, paths):
+        self.calls.append([os.path.basename(path) for path in paths])
+        if len(self.calls) <= self.fail_times:
+            return []
+        return paths
+
+
+def make_watcher(tmp_path, on_ready, retry_backoff=0.1):
+    watcher = SprintDirWatcher(
+        str(tmp_path), on_ready=on_ready, debounce_seconds=0, poll_interval=3600,
+        use_watchdog=False, metrics_path=str(tmp_path / 'metrics.json'),
+        retry_backoff=retry_backoff, retry_backoff_max=1.0
+    )
+    watcher.baseline()
+    return watcher
+
+
+def test_failed_file_is_retried_with_backoff(tmp_path):
+    ingest = FlakyIngest(fail_times=2)
+    watcher = make_watcher(tmp_path, ingest)
+
+    path = tmp_path / 'DEV_Sprint_3081.xlsx'
+    path.write_bytes(b'xlsx')
+    landed = time.time() - 10
+    os.utime(path, (landed, landed))
+    watcher.scan()
+
+    assert watcher.process_ready() == []
+    metrics = watcher.metrics()
+    assert metrics['pending_files'] == 1
+    assert metrics['failed_files'] == 1
+    assert metrics['freshness_lag_seconds'] >= 10
+
+    # Backoff tugamaguncha qayta urinilmaydi
+    assert watcher.process_ready() == []
+    assert len(ingest.calls) == 1
+
+    time.sleep(0.12)
+    assert watcher.process_ready() == []            # 2-urinish ham xato, backoff 0.2
+    time.sleep(0.05)
+    assert watcher.process_ready() == []
+    assert len(ingest.calls) == 2
+
+    time.sleep(0.2)
+    succeeded = watcher.process_ready()
+    assert [os.path.basename(path) for path in succeeded] == ['DEV_Sprint_3081.xlsx']
+    assert ingest.calls == [['DEV_Sprint_3081.xlsx']] * 3
+
+    metrics = watcher.metrics()
+    assert metrics['pending_files'] == 0
+    assert metrics['freshness_lag_seconds'] == 0
+    assert metrics['files_ingested'] == 1
+    assert metrics['failed_files'] == 2
+    assert metrics['last_ingest_lag_seconds'] >= 10           # birinchi aniqlangan vaqtdan
+
+
+def test_on_ready_exception_keeps_file_pending(tmp_path):
+    def broken(paths):
+        raise RuntimeError("VectorDB yiqildi")
+
+    watcher = make_watcher(tmp_path, broken, retry_backoff=60)
+    (tmp_path / 'DEV_Sprint_3082.xlsx').write_bytes(b'xlsx')
+    watcher.scan()
+
+    assert watcher.process_ready() == []
+    assert watcher.metrics()['pending_files'] == 1
@@ -2,7 +2,6 @@
 import streamlit as st
 import plotly.express as px
 import pandas as pd
-from openpyxl import load_workbook
 import os
 from dotenv import load_dotenv
 import time
@@ -10,6 +9,10 @@ import sys
 from typing import Dict, List
 
 from ui.styles import CHART_COLORS
+from utils.sprint_snapshot import (
+    list_sprint_sources, open_sprint_reader, resolve_sprint_source, snapshot_issue_frame, SNAPSHOT_EXT
+)
+from utils.sprint_statistics import SprintStatistics
 
 load_dotenv()
 
@@ -43,10 +46,8 @@ def get_sprint_metadata(excel_dir: str) -> Dict[str, dict]:
     if not os.path.exists(excel_dir):
         return {}
 
-    excel_files = [
-        f for f in os.listdir(excel_dir)
-        if f.endswith('.xlsx') and not f.startswith('~$')
-    ]
+    # .xlsx va/yoki .parquet snapshot (bir xil nom - bitta sprint)
+    excel_files = list_sprint_sources(excel_dir)
 
     if not excel_files:
         return {}
@@ -58,7 +59,7 @@ def get_sprint_metadata(excel_dir: str) -> Dict[str, dict]:
 
         try:
             # Sprint ID ni fayldan extract qilish
-            parts = excel_file.replace('.xlsx', '').split('_')
+            parts = os.path.splitext(excel_file)[0].split('_')
             sprint_id = "Unknown"
 
             # Format: DEV_Report_PR_SPRINTID_DATE.xlsx
@@ -71,11 +72,9 @@ def get_sprint_metadata(excel_dir: str) -> Dict[str, dict]:
             file_size = os.path.getsize(file_path)
             file_size_mb = file_size / (1024 * 1024)
 
-            # Row count - faqat tez hisoblash
-            wb = load_workbook(file_path, read_only=True, data_only=True)
-            ws = wb.active
-            total_rows = ws.max_row - 1  # Minus header
-            wb.close()
+            # Row count - Parquet metadata yoki sheet dimension'dan (qatorlar o'qilmaydi)
+            with open_sprint_reader(file_path, sprint_id=sprint_id) as reader:
+                total_rows = reader.total_rows
 
             metadata[sprint_id] = {
                 'file': excel_file,
@@ -114,76 +113,56 @@ def load_single_sprint(file_path: str, sprint_id: str) -> pd.DataFrame:
     start_time = time.time()
 
     try:
-        wb = load_workbook(file_path, read_only=True, data_only=True)
-        ws = wb.active
+        # Parquet snapshot - bitta vectorized columnar read
+        source = resolve_sprint_source(file_path)
+        if source.endswith(SNAPSHOT_EXT):
+            issues = snapshot_issue_frame(source, sprint_id)
+            df = pd.DataFrame({
+                'key': issues['key'],
+                'sprint': sprint_id,
+                'summary': issues['summary'],
+                'type': issues['type'],
+                'status': issues['status'],
+                'assignee': issues['assignee'],
+                'reporter': issues['reporter'],
+                'priority': issues['priority'],
+                'story_points': issues['story_points'].fillna(0),
+                'return_count': issues['return_count'],
+                'created_date': issues['created_date'].str[:10],
+                'resolved_date': issues['resolved_date'].str[:10],
+                'components': issues['components'],
+                'labels': issues['labels'],
+                'testing_time': issues['testing_time'],
+                'pr_count': issues['pr_count'],
+            })
 
-        # Headers
-        headers = {}
-        for col in range(1, ws.max_column + 1):
-            header = ws.cell(row=1, column=col).value
-            if header:
-                headers[header] = col
+            load_time = time.time() - start_time
+            debug_log(f"✅ Sprint {sprint_id}: {len(df)} ta issue yuklandi (parquet, {load_time:.2f}s)")
+            return df
 
-        # Data extraction - OPTIMIZED
+        # Excel - streaming o'qish (iter_rows(values_only=True), ws.cell yo'q)
         data = []
 
-        # Batch processing - har 50 ta row bir batch
-        batch_size = 50
-        total_rows = ws.max_row - 1
-
-        for batch_start in range(2, ws.max_row + 1, batch_size):
-            batch_end = min(batch_start + batch_size, ws.max_row + 1)
-
-            for row_idx in range(batch_start, batch_end):
-                try:
-                    key = ws.cell(row_idx, headers.get('Key', 1)).value
-                    if not key:
-                        continue
-
-                    # Helper function
-                    def get_val(col_name, default=''):
-                        col_idx = headers.get(col_name)
-                        if col_idx:
-                            val = ws.cell(row_idx, col_idx).value
-                            return str(val) if val is not None else default
-                        return default
-
-                    # Return Count
-                    return_count = 0
-                    for col in ['Return Count', 'Return from Test Count']:
-                        col_idx = headers.get(col)
-                        if col_idx:
-                            val = ws.cell(row_idx, col_idx).value
-                            if val and str(val).isdigit():
-                                return_count = int(val)
-                                break
-
-                    # Story Points
-                    sp_col = headers.get('Story Points')
-                    sp_val = ws.cell(row_idx, sp_col).value if sp_col else 0
-                    story_points = float(sp_val) if sp_val and str(sp_val).replace('.', '').isdigit() else 0
-
-                    data.append({
-                        'key': str(key),
-                        'sprint': sprint_id,
-                        'summary': get_val('Summary', ''),
-                        'type': get_val('Type', ''),
-                        'status': get_val('Status', ''),
-                        'assignee': get_val('Assignee', 'Unassigned'),
-                        'reporter': get_val('Reporter', 'Unknown'),
-                        'priority': get_val('Priority', 'None'),
-                        'story_points': story_points,
-                        'return_count': return_count,
-                        'created_date': get_val('Created Date', '')[:10],
-                        'resolved_date': get_val('Resolved Date', '')[:10],
-                        'components': get_val('Components', ''),
-                        'labels': get_val('Labels', ''),
-                    })
-
-                except:
-                    continue
-
-        wb.close()
+        with open_sprint_reader(source, sprint_id=sprint_id) as reader:
+            for issue in reader.iter_issues():
+                data.append({
+                    'key': issue['key'],
+                    'sprint': sprint_id,
+                    'summary': issue['summary'],
+                    'type': issue['type'],
+                    'status': issue['status'],
+                    'assignee': issue['assignee'],
+                    'reporter': issue['reporter'],
+                    'priority': issue['priority'],
+                    'story_points': issue['story_points'] or 0,
+                    'return_count': issue['return_count'],
+                    'created_date': issue['created_date'][:10],
+                    'resolved_date': issue['resolved_date'][:10],
+                    'components': issue['components'],
+                    'labels': issue['labels'],
+                    'testing_time': issue['testing_time'],
+                    'pr_count': issue['pr_count'],
+                })
 
         df = pd.DataFrame(data)
 
@@ -257,53 +236,49 @@ def load_selected_sprints(metadata: Dict[str, dict], selected_sprints: List[str]
 
 
 # ============================================================================
-# VISUALIZATION FUNCTIONS - SIMPLIFIED
+# VISUALIZATION FUNCTIONS - utils/sprint_statistics.py (groupby, bir marta)
 # ============================================================================
 
-def render_overview_metrics(df):
+def _bar_layout(fig):
+    fig.update_layout(
+        paper_bgcolor=CHART_COLORS['bg'], plot_bgcolor=CHART_COLORS['bg'],
+        font_color=CHART_COLORS['text'], showlegend=False,
+        yaxis={'categoryorder': 'total ascending'}
+    )
+    return fig
+
+
+def render_overview_metrics(stats: SprintStatistics):
     """Umumiy ko'rsatkichlar"""
     st.markdown("### 📊 Umumiy Ko'rsatkichlar")
+    overview = stats.overview()
 
     col1, col2, col3, col4, col5 = st.columns(5)
 
     with col1:
-        st.metric("Jami Issue", len(df))
+        st.metric("Jami Issue", overview['total'])
 
     with col2:
-        closed_statuses = ['Closed', 'CLOSED', 'Done', 'Resolved']
-        closed_count = len(df[df['status'].isin(closed_statuses)])
-        st.metric("Closed", closed_count, f"{closed_count / len(df) * 100:.0f}%" if len(df) > 0 else "0%")
+        closed_count = overview['closed']
+        st.metric("Closed", closed_count,
+                  f"{closed_count / overview['total'] * 100:.0f}%" if overview['total'] > 0 else "0%")
 
     with col3:
-        bug_count = len(df[df['type'] == 'Bug'])
-        st.metric("Bugs", bug_count)
+        st.metric("Bugs", overview['bugs'])
 
     with col4:
-        total_sp = df['story_points'].sum()
-        st.metric("Story Points", f"{total_sp:.0f}")
+        st.metric("Story Points", f"{overview['story_points']:.0f}")
 
     with col5:
-        total_returns = int(df['return_count'].sum())
-        st.metric("Returns", total_returns)
+        st.metric("Returns", overview['returns'], f"{overview['return_rate']:.0f}% task", delta_color="inverse")
 
 
-def render_developers_tab(df):
+def render_developers_tab(stats: SprintStatistics):
     """Developers tab"""
     st.markdown("### 👥 Developer Performance")
 
-    closed_statuses = ['Closed', 'CLOSED', 'Done', 'Resolved']
-
-    dev_stats = df.groupby('assignee').agg({
-        'key': 'count',
-        'status': lambda x: sum(s in closed_statuses for s in x),
-        'type': lambda x: (x == 'Bug').sum(),
-        'return_count': 'sum',
-        'story_points': 'sum'
-    }).reset_index()
-
-    dev_stats.columns = ['Developer', 'Total Tasks', 'Closed', 'Bugs', 'Returns', 'Story Points']
-    dev_stats = dev_stats[dev_stats['Developer'] != 'Unassigned']
-    dev_stats = dev_stats.sort_values('Total Tasks', ascending=False)
+    dev_stats = stats.by_developer()
+    dev_stats = dev_stats[dev_stats['Developer'] != 'Unassigned'].rename(columns={'Issues': 'Total Tasks'})
 
     col1, col2 = st.columns(2)
 
@@ -314,15 +289,9 @@ def render_developers_tab(df):
             color_continuous_scale=[[0, CHART_COLORS['primary']], [1, CHART_COLORS['secondary']]],
             title='📊 Tasklar (Top 10)'
         )
-        fig.update_layout(
-            paper_bgcolor=CHART_COLORS['bg'], plot_bgcolor=CHART_COLORS['bg'],
-            font_color=CHART_COLORS['text'], showlegend=False,
-            yaxis={'categoryorder': 'total ascending'}
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_bar_layout(fig), use_container_width=True)
 
     with col2:
-        dev_stats['Completion Rate'] = (dev_stats['Closed'] / dev_stats['Total Tasks'] * 100).round(1)
         fig = px.bar(
             dev_stats[dev_stats['Total Tasks'] >= 3].head(10),
             x='Completion Rate', y='Developer', orientation='h',
@@ -331,20 +300,19 @@ def render_developers_tab(df):
                                     [1, CHART_COLORS['success']]],
             title='✅ Completion Rate %'
         )
-        fig.update_layout(
-            paper_bgcolor=CHART_COLORS['bg'], plot_bgcolor=CHART_COLORS['bg'],
-            font_color=CHART_COLORS['text'], showlegend=False,
-            yaxis={'categoryorder': 'total ascending'}
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_bar_layout(fig), use_container_width=True)
 
-    st.dataframe(dev_stats, use_container_width=True, hide_index=True)
+    st.dataframe(
+        dev_stats[['Developer', 'Total Tasks', 'Closed', 'Bugs', 'Returns', 'Story Points',
+                   'Completion Rate', 'Return Rate', 'Avg Testing Hours']],
+        use_container_width=True, hide_index=True
+    )
 
 
-def render_bugs_tab(df):
+def render_bugs_tab(stats: SprintStatistics):
     """Bugs tab - SIMPLIFIED"""
     st.markdown("### 🐛 Bug Analysis")
-    bugs_df = df[df['type'] == 'Bug']
+    bugs_df = stats.frame[stats.frame['bug'] == 1]
 
     if bugs_df.empty:
         st.success("✅ Bug topilmadi!")
@@ -353,46 +321,96 @@ def render_bugs_tab(df):
     col1, col2 = st.columns(2)
 
     with col1:
-        bug_status = bugs_df['status'].value_counts().reset_index()
+        bug_status = bugs_df['status'].value_counts().loc[lambda x: x > 0].reset_index()
         bug_status.columns = ['Status', 'Count']
         fig = px.pie(bug_status, values='Count', names='Status', title='🎯 Bug Status', hole=0.4)
         fig.update_layout(paper_bgcolor=CHART_COLORS['bg'], font_color=CHART_COLORS['text'])
         st.plotly_chart(fig, use_container_width=True)
 
     with col2:
-        bug_priority = bugs_df['priority'].value_counts().reset_index()
+        bug_priority = bugs_df['priority'].value_counts().loc[lambda x: x > 0].reset_index()
         bug_priority.columns = ['Priority', 'Count']
         fig = px.bar(bug_priority, x='Priority', y='Count', title='⚡ Bug Priority')
         fig.update_layout(paper_bgcolor=CHART_COLORS['bg'], font_color=CHART_COLORS['text'])
         st.plotly_chart(fig, use_container_width=True)
 
 
-def render_returns_tab(df):
+def render_returns_tab(stats: SprintStatistics):
     """Returns tab"""
     st.markdown("### 🔄 Return Analysis")
-    returns_df = df[df['return_count'] > 0]
+    overview = stats.overview()
 
-    if returns_df.empty:
+    if overview['returns'] == 0:
         st.success("✅ Return topilmadi!")
         return
 
-    col1, col2 = st.columns(2)
+    col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Jami Returns", int(returns_df['return_count'].sum()))
+        st.metric("Jami Returns", overview['returns'])
     with col2:
-        st.metric("Tasks with Returns", len(returns_df))
-
-
-def render_components_tab(df):
+        st.metric("Tasks with Returns", overview['tasks_with_returns'])
+    with col3:
+        st.metric("Return Rate", f"{overview['return_rate']:.1f}%")
+    with col4:
+        st.metric("O'rtacha Testing", f"{overview['avg_testing_hours']:.1f}h")
+
+    dev_returns = stats.by_developer()
+    dev_returns = dev_returns[(dev_returns['Returns'] > 0) & (dev_returns['Developer'] != 'Unassigned')]
+    fig = px.bar(
+        dev_returns.sort_values('Return Rate', ascending=False).head(10),
+        x='Return Rate', y='Developer', orientation='h',
+        color='Return Rate',
+        color_continuous_scale=[[0, CHART_COLORS['success']], [0.5, CHART_COLORS['warning']],
+                                [1, CHART_COLORS['danger']]],
+        title='🔄 Qaytgan tasklar % (Top 10)'
+    )
+    st.plotly_chart(_bar_layout(fig), use_container_width=True)
+
+    returned = stats.returned_issues()
+    st.dataframe(
+        returned[['key', 'assignee', 'status', 'return_count', 'testing_hours']].rename(columns={
+            'key': 'Key', 'assignee': 'Developer', 'status': 'Status',
+            'return_count': 'Returns', 'testing_hours': 'Testing Hours'
+        }),
+        use_container_width=True, hide_index=True
+    )
+
+
+def render_components_tab(stats: SprintStatistics):
     """Components tab"""
     st.markdown("### 📦 Component Analysis")
-    st.info("Component tahlili - under development")
 
+    components = stats.by_component()
+    if components.empty:
+        st.info("Component ma'lumoti yo'q (report'da Components ustuni bo'sh)")
+    else:
+        st.dataframe(components, use_container_width=True, hide_index=True)
+
+    st.markdown("#### ⚡ Priority bo'yicha")
+    st.dataframe(stats.by_priority(), use_container_width=True, hide_index=True)
+
+
+def render_timeline_tab(stats: SprintStatistics):
+    """Timeline tab - sprintlar bo'yicha"""
+    st.markdown("### 📅 Sprint bo'yicha")
+
+    sprints = stats.by_sprint().sort_values('Sprint', ignore_index=True)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        fig = px.bar(sprints, x='Sprint', y=['Issues', 'Closed'], barmode='group', title='📊 Issue / Closed')
+        fig.update_layout(paper_bgcolor=CHART_COLORS['bg'], plot_bgcolor=CHART_COLORS['bg'],
+                          font_color=CHART_COLORS['text'])
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        fig = px.line(sprints, x='Sprint', y='Return Rate', markers=True, title='🔄 Return Rate %')
+        fig.update_layout(paper_bgcolor=CHART_COLORS['bg'], plot_bgcolor=CHART_COLORS['bg'],
+                          font_color=CHART_COLORS['text'])
+        st.plotly_chart(fig, use_container_width=True)
 
-def render_timeline_tab(df):
-    """Timeline tab"""
-    st.markdown("### 📅 Timeline Analysis")
-    st.info("Timeline tahlili - under development")
+    st.dataframe(sprints, use_container_width=True, hide_index=True)
 
 
 # ============================================================================
@@ -489,8 +507,9 @@ def render_statistics():
 
     st.markdown("---")
 
-    # STEP 4: Statistics
-    render_overview_metrics(df)
+    # STEP 4: Statistics - bitta typed jadval, hamma tab'lar shundan
+    stats = SprintStatistics(df)
+    render_overview_metrics(stats)
 
     st.markdown("---")
 
@@ -504,14 +523,14 @@ def render_statistics():
     ])
 
     with tab1:
-        render_developers_tab(df)
+        render_developers_tab(stats)
     with tab2:
-        render_bugs_tab(df)
+        render_bugs_tab(stats)
     with tab3:
-        render_components_tab(df)
+        render_components_tab(stats)
     with tab4:
-        render_returns_tab(df)
+        render_returns_tab(stats)
     with tab5:
-        render_timeline_tab(df)
+        render_timeline_tab(stats)
 
     debug_log("=== STATISTICS SAHIFASI TUGADI ===")
\ No newline at end of file
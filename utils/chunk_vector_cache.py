@@ -0,0 +1,160 @@
+# utils/chunk_vector_cache.py
+import os
+import re
+import shutil
+from typing import List, Dict, Any, Sequence, Optional
+
+import numpy as np
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class ChunkVectorCache:
+    """
+    Per-chunk embedding cache
+
+    VectorDB faqat issue'ning weighted average vektorini saqlaydi. Chunk weight'larini
+    qayta sozlash (tuning) uchun esa har bir chunk vektori kerak - ularni qayta
+    encode qilmaslik uchun ingest paytida shu yerga yoziladi.
+
+    Format: har bir manba fayl uchun papka, ichida batch shard'lar (.npz):
+        {cache_dir}/{source}/batch_00000.npz
+            keys     - issue key'lar (n_issues)
+            counts   - har bir issue chunk soni (n_issues)
+            types    - chunk type (n_chunks)
+            weights  - chunk weight (n_chunks)
+            vectors  - chunk embedding, float32 (n_chunks x dim)
+    """
+
+    def __init__(self, cache_dir: str = None):
+        """
+        Args:
+            cache_dir: Cache papkasi (default: CHUNK_CACHE_DIR yoki CACHE_DIR/chunk_vectors)
+        """
+        if cache_dir is None:
+            cache_dir = os.getenv(
+                'CHUNK_CACHE_DIR',
+                os.path.join(os.getenv('CACHE_DIR', './data/cache'), 'chunk_vectors')
+            )
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def _safe_name(source: str) -> str:
+        """Fayl nomidan papka nomi"""
+        name = os.path.splitext(os.path.basename(source))[0]
+        return re.sub(r'[^\w\-. ()]', '_', name)
+
+    def source_dir(self, source: str) -> str:
+        return os.path.join(self.cache_dir, self._safe_name(source))
+
+    def clear_source(self, source: str):
+        """Manba faylning eski shard'larini o'chirish (qayta yuklashdan oldin)"""
+        path = self.source_dir(source)
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+
+    def next_batch_index(self, source: str) -> int:
+        """
+        Keyingi bo'sh shard indeksi
+
+        O'zgargan fayl qayta yuklanganda faqat o'zgargan issue'lar yoziladi - eski
+        shard'lar saqlanib, yangilari ulardan keyin qo'shiladi (load_all oxirgisini oladi).
+        """
+        path = self.source_dir(source)
+        if not os.path.isdir(path):
+            return 0
+        indices = [
+            int(name[len('batch_'):-len('.npz')])
+            for name in os.listdir(path)
+            if name.startswith('batch_') and name.endswith('.npz') and '.tmp' not in name
+        ]
+        return max(indices) + 1 if indices else 0
+
+    def write_batch(
+            self,
+            source: str,
+            batch_idx: int,
+            keys: List[str],
+            all_chunks_data: List[List[Dict[str, Any]]],
+            embeddings_flat: Sequence[Sequence[float]]
+    ) -> str:
+        """
+        Bitta batch chunk vektorlarini yozish
+
+        Returns:
+            Shard fayl yo'li
+        """
+        path = self.source_dir(source)
+        os.makedirs(path, exist_ok=True)
+
+        counts = np.array([len(c) for c in all_chunks_data], dtype=np.int32)
+        types = np.array([chunk.get('type', 'unknown') for c in all_chunks_data for chunk in c], dtype=np.str_)
+        weights = np.array([chunk.get('weight', 1.0) for c in all_chunks_data for chunk in c], dtype=np.float32)
+        vectors = np.asarray(embeddings_flat, dtype=np.float32)
+
+        shard_path = os.path.join(path, f"batch_{batch_idx:05d}.npz")
+        tmp_path = shard_path + '.tmp.npz'
+        np.savez(
+            tmp_path,
+            keys=np.array([str(k) for k in keys], dtype=np.str_),
+            counts=counts,
+            types=types,
+            weights=weights,
+            vectors=vectors
+        )
+        os.replace(tmp_path, shard_path)
+        return shard_path
+
+    def list_shards(self) -> List[str]:
+        """Barcha shard fayllar (tartiblangan)"""
+        shards = []
+        if not os.path.isdir(self.cache_dir):
+            return shards
+
+        for source in sorted(os.listdir(self.cache_dir)):
+            source_path = os.path.join(self.cache_dir, source)
+            if not os.path.isdir(source_path):
+                continue
+            for name in sorted(os.listdir(source_path)):
+                if name.startswith('batch_') and name.endswith('.npz') and '.tmp' not in name:
+                    shards.append(os.path.join(source_path, name))
+        return shards
+
+    def load_all(self) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Barcha shard'larni bitta massivga yuklash
+
+        Issue bir nechta faylda bo'lsa (sprintdan sprintga o'tgan task),
+        oxirgi yuklangani olinadi - VectorDB dagi kabi bitta yozuv.
+
+        Returns:
+            {'keys', 'counts', 'types', 'weights', 'vectors'} yoki None (cache bo'sh)
+        """
+        per_issue = {}
+
+        for shard in self.list_shards():
+            with np.load(shard) as data:
+                keys = data['keys']
+                counts = data['counts']
+                types = data['types']
+                weights = data['weights']
+                vectors = data['vectors']
+
+            offset = 0
+            for key, count in zip(keys, counts):
+                end = offset + int(count)
+                per_issue[str(key)] = (types[offset:end], weights[offset:end], vectors[offset:end])
+                offset = end
+
+        if not per_issue:
+            return None
+
+        keys = list(per_issue.keys())
+        return {
+            'keys': np.array(keys, dtype=np.str_),
+            'counts': np.array([len(per_issue[k][0]) for k in keys], dtype=np.int32),
+            'types': np.concatenate([per_issue[k][0] for k in keys]),
+            'weights': np.concatenate([per_issue[k][1] for k in keys]),
+            'vectors': np.concatenate([per_issue[k][2] for k in keys]),
+        }
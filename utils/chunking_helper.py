@@ -18,10 +18,11 @@ class ChunkingHelper:
     - Weighted semantic chunks
     """
 
-    def __init__(self, max_chunk_length=800):
+    def __init__(self, max_chunk_length=800, weights: Dict[str, float] = None):
         """
         Args:
             max_chunk_length: Har bir chunk maksimal uzunligi (character)
+            weights: Chunk type weight'larini almashtirish (masalan tune_chunk_weights.py natijasi)
         """
         self.max_chunk_length = max_chunk_length
 
@@ -38,6 +39,9 @@ class ChunkingHelper:
             'metadata': 1.0  # Context - type, priority, etc.
         }
 
+        if weights:
+            self.weights.update(weights)
+
     def create_chunks(self, issue_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Issue'ni smart semantic chunks'ga bo'lish
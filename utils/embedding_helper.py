@@ -3,7 +3,8 @@ from sentence_transformers import SentenceTransformer
 import os
 from dotenv import load_dotenv
 from typing import List, Dict, Any
-import numpy as np
+
+from utils.weighting_helper import WeightingHelper
 
 load_dotenv()
 
@@ -18,6 +19,8 @@ class EmbeddingHelper:
             root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
             models_dir = os.path.join(root_dir, models_dir)
 
+        self.model_name = model_name
+
         print(f"Embedding model yuklanmoqda...")
         print(f"Path: {models_dir}")
 
@@ -92,16 +95,7 @@ class EmbeddingHelper:
 
         # Weighted average hisoblash
         weights = [chunk.get('weight', 1.0) for chunk in chunks]
-        total_weight = sum(weights)
-
-        if total_weight > 0 and chunk_embeddings:
-            weighted_embeddings = [
-                np.array(emb) * (weight / total_weight)
-                for emb, weight in zip(chunk_embeddings, weights)
-            ]
-            weighted_average = np.sum(weighted_embeddings, axis=0).tolist()
-        else:
-            weighted_average = []
+        weighted_average = WeightingHelper.weighted_average(chunk_embeddings, weights)
 
         # Metadata
         chunks_with_embeddings = []
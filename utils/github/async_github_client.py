@@ -0,0 +1,188 @@
+# utils/github/async_github_client.py
+"""
+GitHubClient'ning asyncio varianti (httpx, HTTP/2)
+
+TZ-PR tekshiruv va test case generatsiyada har bir PR uchun info → files
+ketma-ket so'ralardi, PR'lar ham birin-ketin. AsyncGitHubClient bir xil
+dict'larni qaytaradi, get_prs esa hamma PR'larning info va files'ini
+gather bilan parallel oladi.
+
+Token, org, rate limit holati sinxron GitHubClient bilan umumiy.
+
+Search API (30 so'rov/daqiqa) ataylab ketma-ket qoladi - branch pattern'lar
+birinchi topilgunicha, GitHubClient.search_pr_by_jira_key bilan bir xil.
+
+Usage:
+    async with AsyncGitHubClient() as github:
+        prs = await github.get_prs([pr['url'] for pr in pr_urls])
+
+    prs = fetch_prs(urls, github_client)   # sync koddan
+"""
+import asyncio
+from typing import List, Dict, Optional, Tuple
+
+from utils.github.github_client import (
+    GitHubClient, PR_FILES_PER_PAGE, _endpoint,
+    pr_info_from_json, pr_file_from_json, search_item_to_pr, branch_patterns,
+)
+from utils.http_client import AsyncHttpClient, run_sync
+
+
+class AsyncGitHubClient:
+    """GitHub API - asyncio (GitHubClient bilan bir xil natijalar)"""
+
+    def __init__(self, github_client: GitHubClient = None, http: AsyncHttpClient = None):
+        """
+        Args:
+            github_client: Token, org, rate limit shundan (default: yangi GitHubClient)
+            http: Async HTTP client (default: yangi AsyncHttpClient)
+        """
+        self.sync = github_client or GitHubClient()
+        self.http = http or AsyncHttpClient()
+        self.base_url = self.sync.base_url
+
+    async def aclose(self):
+        await self.http.aclose()
+
+    async def __aenter__(self) -> 'AsyncGitHubClient':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    def parse_pr_url(self, pr_url: str) -> Tuple[Optional[str], Optional[str], Optional[int]]:
+        return self.sync.parse_pr_url(pr_url)
+
+    async def _make_request(self, url: str, accept_header: str = None, params: Dict = None):
+        """API so'rov (rate limit GitHubClient bilan umumiy)"""
+        headers = self.sync.headers.copy()
+        if accept_header:
+            headers['Accept'] = accept_header
+
+        wait_time = self.sync._rate_limit_wait()
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+        response = await self.http.get(url, endpoint=_endpoint(url), headers=headers, params=params)
+        self.sync._update_rate_limit(response.headers)
+        return response
+
+    # ------------------------------------------------------------------------
+    # PR
+    # ------------------------------------------------------------------------
+    async def get_pr_info(self, owner: str, repo: str, pr_number: int) -> Optional[Dict]:
+        """GitHubClient.get_pr_info"""
+        response = await self._make_request(f'{self.base_url}/repos/{owner}/{repo}/pulls/{pr_number}')
+
+        if response.status_code != 200:
+            print(f"❌ PR info olishda xatolik: {response.status_code}")
+            return None
+
+        return pr_info_from_json(response.json())
+
+    async def get_pr_files(self, owner: str, repo: str, pr_number: int) -> List[Dict]:
+        """GitHubClient.get_pr_files (sahifalar ketma-ket - soni oldindan noma'lum)"""
+        url = f'{self.base_url}/repos/{owner}/{repo}/pulls/{pr_number}/files'
+
+        all_files = []
+        page = 1
+        while True:
+            response = await self._make_request(url, params={'page': page, 'per_page': PR_FILES_PER_PAGE})
+
+            if response.status_code != 200:
+                print(f"❌ PR files olishda xatolik: {response.status_code}")
+                break
+
+            files = response.json()
+            if not files:
+                break
+
+            all_files.extend(pr_file_from_json(f) for f in files)
+
+            if len(files) < PR_FILES_PER_PAGE:
+                break
+            page += 1
+
+        return all_files
+
+    async def get_pr_diff(self, owner: str, repo: str, pr_number: int) -> Optional[str]:
+        """GitHubClient.get_pr_diff"""
+        url = f'{self.base_url}/repos/{owner}/{repo}/pulls/{pr_number}'
+        response = await self._make_request(url, accept_header='application/vnd.github.v3.diff')
+        return response.text if response.status_code == 200 else None
+
+    async def get_pr(self, pr_url: str) -> Optional[Dict]:
+        """
+        Bitta PR: info va files parallel
+
+        Returns:
+            {'url', 'owner', 'repo', 'pr_number', 'info', 'files'} - info None bo'lishi mumkin
+            (PR olinmadi); URL parse qilinmasa None
+        """
+        owner, repo, pr_number = self.parse_pr_url(pr_url)
+        if not all([owner, repo, pr_number]):
+            return None
+
+        info, files = await asyncio.gather(
+            self.get_pr_info(owner, repo, pr_number),
+            self.get_pr_files(owner, repo, pr_number),
+        )
+        return {
+            'url': pr_url, 'owner': owner, 'repo': repo, 'pr_number': pr_number,
+            'info': info, 'files': files if info else [],
+        }
+
+    async def get_prs(self, pr_urls: List[str]) -> List[Optional[Dict]]:
+        """Hamma PR'lar parallel (natija pr_urls tartibida, get_pr formati)"""
+        return list(await asyncio.gather(*(self.get_pr(url) for url in pr_urls)))
+
+    # ------------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------------
+    async def _search(self, query: str) -> Optional[List[Dict]]:
+        """search/issues → items (xato bo'lsa None)"""
+        response = await self._make_request(f"{self.base_url}/search/issues", params={'q': query, 'sort': 'updated'})
+        if response.status_code != 200:
+            print(f"   ⚠️ Search error: {response.status_code}")
+            return None
+        return response.json().get('items', [])
+
+    async def search_pr_by_jira_key(self, jira_key: str) -> List[Dict]:
+        """GitHubClient.search_pr_by_jira_key - title/body, keyin branch pattern'lar"""
+        found_prs = []
+
+        try:
+            items = await self._search(f'org:{self.sync.org} "{jira_key}" is:pr')
+            found_prs.extend(search_item_to_pr(item, 'GitHub (title/body)') for item in items or [])
+        except Exception as e:
+            print(f"   ⚠️ Title/body search exception: {e}")
+
+        if not found_prs:
+            for pattern in branch_patterns(jira_key):
+                try:
+                    items = await self._search(f'org:{self.sync.org} head:{pattern} is:pr')
+                except Exception as e:
+                    print(f"   ⚠️ Branch search exception ({pattern}): {e}")
+                    continue
+
+                for item in items or []:
+                    if not any(pr['url'] == item.get('html_url') for pr in found_prs):
+                        found_prs.append(search_item_to_pr(item, f'GitHub (branch:{pattern})'))
+                if items:
+                    break
+
+        if found_prs:
+            print(f"   ✅ JAMI: {len(found_prs)} ta PR topildi!")
+        else:
+            print(f"   ❌ Hech qanday PR topilmadi")
+
+        return found_prs
+
+
+def fetch_prs(pr_urls: List[str], github_client: GitHubClient = None) -> List[Optional[Dict]]:
+    """Sync koddan: hamma PR'larning info + files'i parallel (AsyncGitHubClient.get_prs)"""
+    async def run():
+        async with AsyncGitHubClient(github_client) as github:
+            return await github.get_prs(pr_urls)
+
+    return run_sync(run())
@@ -7,9 +7,86 @@ YANGI: Branch name bilan ham PR qidirish!
 import requests
 import base64
 import re
+from urllib.parse import urlparse
 from typing import List, Dict, Optional, Tuple
 import time
 
+from utils.http_client import get_http_client
+
+# pulls/{n}/files sahifa hajmi (GitHub maksimumi)
+PR_FILES_PER_PAGE = 100
+
+# API path'dan latency histogram nomi: /repos/{owner}/{repo}/pulls/{n}/files
+_ENDPOINT_PATTERNS = [
+    (re.compile(r'/repos/[^/]+/[^/]+'), '/repos/{owner}/{repo}'),
+    (re.compile(r'/contents/.*$'), '/contents/{path}'),
+    (re.compile(r'/\d+(?=/|$)'), '/{n}'),
+]
+
+
+def _endpoint(url: str) -> str:
+    path = urlparse(url).path
+    for pattern, replacement in _ENDPOINT_PATTERNS:
+        path = pattern.sub(replacement, path)
+    return f'github:{path}'
+
+
+# ============================================================================
+# JSON → dict (GitHubClient va AsyncGitHubClient uchun umumiy)
+# ============================================================================
+def pr_info_from_json(data: Dict) -> Dict:
+    return {
+        'title': data.get('title', ''),
+        'state': data.get('state', ''),
+        'merged': data.get('merged', False),
+        'user': data.get('user', {}).get('login', ''),
+        'created_at': data.get('created_at', ''),
+        'merged_at': data.get('merged_at', ''),
+        'base': data.get('base', {}).get('ref', ''),
+        'head': data.get('head', {}).get('ref', ''),
+        'commits': data.get('commits', 0),
+        'additions': data.get('additions', 0),
+        'deletions': data.get('deletions', 0),
+        'changed_files': data.get('changed_files', 0),
+        'body': data.get('body', '')
+    }
+
+
+def pr_file_from_json(f: Dict) -> Dict:
+    return {
+        'filename': f.get('filename', ''),
+        'status': f.get('status', ''),
+        'additions': f.get('additions', 0),
+        'deletions': f.get('deletions', 0),
+        'changes': f.get('changes', 0),
+        'patch': f.get('patch', ''),
+        'blob_url': f.get('blob_url', ''),
+        'raw_url': f.get('raw_url', ''),
+        'sha': f.get('sha', ''),
+        'previous_filename': f.get('previous_filename', '')
+    }
+
+
+def search_item_to_pr(item: Dict, source: str) -> Dict:
+    return {
+        'url': item.get('html_url'),
+        'title': item.get('title'),
+        'status': item.get('state'),
+        'source': source
+    }
+
+
+def branch_patterns(jira_key: str) -> List[str]:
+    """Common branch patterns"""
+    return [
+        jira_key,  # DEV-6959
+        jira_key.lower(),  # dev-6959
+        jira_key.replace('-', '_'),  # DEV_6959
+        f"feature/{jira_key}",  # feature/DEV-6959
+        f"bugfix/{jira_key}",  # bugfix/DEV-6959
+        f"fix/{jira_key}",  # fix/DEV-6959
+    ]
+
 
 class GitHubClient:
     """GitHub API bilan ishlash"""
@@ -44,19 +121,28 @@ class GitHubClient:
             headers['Accept'] = accept_header
 
         # Rate limit tekshirish
+        wait_time = self._rate_limit_wait()
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+        # Umumiy pool (keep-alive) + 429/5xx retry
+        response = get_http_client().get(url, endpoint=_endpoint(url), headers=headers, params=params, timeout=30)
+        self._update_rate_limit(response.headers)
+
+        return response
+
+    def _rate_limit_wait(self) -> float:
+        """Limit tugay deb qolgan bo'lsa - reset'gacha kutish (soniya), aks holda 0"""
         if self.rate_limit_remaining < 10:
             wait_time = self.rate_limit_reset - time.time()
             if wait_time > 0:
                 print(f"⏳ Rate limit kutish: {wait_time:.0f} sekund")
-                time.sleep(wait_time + 1)
-
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+                return wait_time + 1
+        return 0
 
-        # Rate limit yangilash
-        self.rate_limit_remaining = int(response.headers.get('X-RateLimit-Remaining', 5000))
-        self.rate_limit_reset = int(response.headers.get('X-RateLimit-Reset', 0))
-
-        return response
+    def _update_rate_limit(self, headers):
+        self.rate_limit_remaining = int(headers.get('X-RateLimit-Remaining', 5000))
+        self.rate_limit_reset = int(headers.get('X-RateLimit-Reset', 0))
 
     def parse_pr_url(self, pr_url: str) -> Tuple[Optional[str], Optional[str], Optional[int]]:
         """
@@ -91,23 +177,7 @@ class GitHubClient:
             print(f"❌ PR info olishda xatolik: {response.status_code}")
             return None
 
-        data = response.json()
-
-        return {
-            'title': data.get('title', ''),
-            'state': data.get('state', ''),
-            'merged': data.get('merged', False),
-            'user': data.get('user', {}).get('login', ''),
-            'created_at': data.get('created_at', ''),
-            'merged_at': data.get('merged_at', ''),
-            'base': data.get('base', {}).get('ref', ''),
-            'head': data.get('head', {}).get('ref', ''),
-            'commits': data.get('commits', 0),
-            'additions': data.get('additions', 0),
-            'deletions': data.get('deletions', 0),
-            'changed_files': data.get('changed_files', 0),
-            'body': data.get('body', '')
-        }
+        return pr_info_from_json(response.json())
 
     def get_pr_files(self, owner: str, repo: str, pr_number: int) -> List[Dict]:
         """PR da o'zgargan fayllar ro'yxatini olish"""
@@ -115,7 +185,7 @@ class GitHubClient:
 
         all_files = []
         page = 1
-        per_page = 100
+        per_page = PR_FILES_PER_PAGE
 
         while True:
             paginated_url = f'{url}?page={page}&per_page={per_page}'
@@ -129,19 +199,7 @@ class GitHubClient:
             if not files:
                 break
 
-            for f in files:
-                all_files.append({
-                    'filename': f.get('filename', ''),
-                    'status': f.get('status', ''),
-                    'additions': f.get('additions', 0),
-                    'deletions': f.get('deletions', 0),
-                    'changes': f.get('changes', 0),
-                    'patch': f.get('patch', ''),
-                    'blob_url': f.get('blob_url', ''),
-                    'raw_url': f.get('raw_url', ''),
-                    'sha': f.get('sha', ''),
-                    'previous_filename': f.get('previous_filename', '')
-                })
+            all_files.extend(pr_file_from_json(f) for f in files)
 
             if len(files) < per_page:
                 break
@@ -252,12 +310,7 @@ class GitHubClient:
             if response1.status_code == 200:
                 items = response1.json().get('items', [])
                 for item in items:
-                    found_prs.append({
-                        'url': item.get('html_url'),
-                        'title': item.get('title'),
-                        'status': item.get('state'),
-                        'source': 'GitHub (title/body)'
-                    })
+                    found_prs.append(search_item_to_pr(item, 'GitHub (title/body)'))
 
                 if items:
                     print(f"   ✅ Title/body search: {len(items)} ta topildi!")
@@ -270,17 +323,7 @@ class GitHubClient:
         if not found_prs:
             print(f"   🔍 Branch name search...")
 
-            # Common branch patterns
-            branch_patterns = [
-                jira_key,  # DEV-6959
-                jira_key.lower(),  # dev-6959
-                jira_key.replace('-', '_'),  # DEV_6959
-                f"feature/{jira_key}",  # feature/DEV-6959
-                f"bugfix/{jira_key}",  # bugfix/DEV-6959
-                f"fix/{jira_key}",  # fix/DEV-6959
-            ]
-
-            for pattern in branch_patterns:
+            for pattern in branch_patterns(jira_key):
                 query2 = f'org:{self.org} head:{pattern} is:pr'
 
                 try:
@@ -292,12 +335,7 @@ class GitHubClient:
                             pr_url = item.get('html_url')
                             # Avoid duplicates
                             if not any(pr['url'] == pr_url for pr in found_prs):
-                                found_prs.append({
-                                    'url': pr_url,
-                                    'title': item.get('title'),
-                                    'status': item.get('state'),
-                                    'source': f'GitHub (branch:{pattern})'
-                                })
+                                found_prs.append(search_item_to_pr(item, f'GitHub (branch:{pattern})'))
 
                         # If found, break
                         if items:
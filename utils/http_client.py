@@ -0,0 +1,355 @@
+# utils/http_client.py
+"""
+Umumiy HTTP qatlam - host bo'yicha keep-alive pool, retry, latency histogram
+
+Oldin GitHubClient._make_request va JIRA Dev Status API har bir so'rovda
+bare requests.get chaqirardi - har safar yangi TCP+TLS ulanish (get_pr_files
+sahifalari, search'ning branch pattern'lari - hammasi alohida handshake).
+
+HttpClient:
+    - host bo'yicha bitta requests.Session (HTTPAdapter pool) - ulanishlar qayta ishlatiladi
+    - 429 / 5xx va ulanish xatolarida retry: exponential backoff + jitter
+      (Retry-After header bo'lsa - shuncha kutiladi)
+    - endpoint bo'yicha latency histogram (ms bucket'lar, p50/p95, max)
+
+Sozlamalar (.env):
+    HTTP_MAX_RETRIES   - qayta urinishlar (default 3)
+    HTTP_BACKOFF_BASE  - birinchi kutish, soniya (default 0.5)
+    HTTP_BACKOFF_MAX   - eng uzun kutish, soniya (default 10)
+    HTTP_POOL_SIZE     - host bo'yicha ulanishlar (default 10)
+
+AsyncHttpClient - xuddi shu retry/backoff, httpx.AsyncClient ustida (HTTP/2 -
+h2 requirements.txt da, HTTP2=0 bilan o'chiriladi); latency umumiy histogram'larga yoziladi.
+
+Usage:
+    http = get_http_client()
+    response = http.get(url, params=..., endpoint='github:/repos/{owner}/{repo}/pulls/{n}')
+    http.log_summary(logger)
+
+    async with AsyncHttpClient() as http:
+        response = await http.get(url, endpoint=...)
+"""
+import asyncio
+import importlib.util
+import logging
+import os
+import random
+import re
+import threading
+import time
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse
+
+import httpx
+import requests
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Latency bucket'lari (ms) - oxirgisi cheksiz
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_NUMBER_RE = re.compile(r'/\d+(?=/|$)')
+
+
+def default_endpoint(url: str) -> str:
+    """'https://host/a/123/b' → 'host/a/{id}/b' (label berilmasa)"""
+    parsed = urlparse(url)
+    return parsed.netloc + _NUMBER_RE.sub('/{id}', parsed.path)
+
+
+class LatencyHistogram:
+    """Bitta endpoint latency'si (bucket'lar bo'yicha)"""
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.requests = 0
+        self.retries = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, elapsed_ms: float):
+        index = next((i for i, bound in enumerate(LATENCY_BUCKETS_MS) if elapsed_ms <= bound),
+                     len(LATENCY_BUCKETS_MS))
+        self.counts[index] += 1
+        self.requests += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def percentile(self, p: float) -> float:
+        """Bucket yuqori chegarasi bo'yicha taxminiy percentile (ms)"""
+        if not self.requests:
+            return 0.0
+        target = p / 100 * self.requests
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return float(LATENCY_BUCKETS_MS[i]) if i < len(LATENCY_BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        return {
+            'requests': self.requests,
+            'retries': self.retries,
+            'errors': self.errors,
+            'avg_ms': round(self.total_ms / self.requests, 1) if self.requests else 0.0,
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'max_ms': round(self.max_ms, 1),
+            'buckets': dict(zip(labels, self.counts)),
+        }
+
+
+class HttpClient:
+    """Host bo'yicha pool'langan session'lar + retry + latency (thread-safe)"""
+
+    def __init__(self, max_retries: int = None, backoff_base: float = None, backoff_max: float = None,
+                 pool_size: int = None):
+        self.max_retries = max(0, int(max_retries if max_retries is not None else os.getenv('HTTP_MAX_RETRIES', 3)))
+        self.backoff_base = float(backoff_base if backoff_base is not None else os.getenv('HTTP_BACKOFF_BASE', 0.5))
+        self.backoff_max = float(backoff_max if backoff_max is not None else os.getenv('HTTP_BACKOFF_MAX', 10))
+        self.pool_size = int(pool_size or os.getenv('HTTP_POOL_SIZE', 10))
+
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, requests.Session] = {}
+        self._histograms: Dict[str, LatencyHistogram] = {}
+
+    # ------------------------------------------------------------------------
+    # Sessions
+    # ------------------------------------------------------------------------
+    def session(self, url: str) -> requests.Session:
+        """URL host'i uchun session (keep-alive pool)"""
+        parsed = urlparse(url)
+        host = f"{parsed.scheme}://{parsed.netloc}"
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                session.mount(host, adapter)
+                self._sessions[host] = session
+            return session
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    # ------------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------------
+    def _histogram(self, endpoint: str) -> LatencyHistogram:
+        histogram = self._histograms.get(endpoint)
+        if histogram is None:
+            histogram = self._histograms.setdefault(endpoint, LatencyHistogram())
+        return histogram
+
+    def _record(self, endpoint: str, started: float, attempt: int, error, response) -> bool:
+        """Latency'ni yozish → qayta urinish kerakmi (AsyncHttpClient ham ishlatadi)"""
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        failed = error is not None or response.status_code in RETRY_STATUSES
+        retry = failed and attempt < self.max_retries
+        with self._lock:
+            histogram = self._histogram(endpoint)
+            histogram.record(elapsed_ms)
+            if retry:
+                histogram.retries += 1
+            elif failed:
+                histogram.errors += 1
+        return retry
+
+    @staticmethod
+    def _log_retry(method: str, endpoint: str, attempt: int, error, response, delay: float):
+        reason = error if error is not None else response.status_code
+        logger.debug(f"HTTP {method} {endpoint}: {reason} - {delay:.1f}s dan keyin qayta ({attempt + 1})")
+
+    def _backoff(self, attempt: int, response) -> float:
+        """Retry-After bo'lsa - o'shancha, bo'lmasa exponential + jitter (0.5x..1.5x)"""
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max * 6)
+            except ValueError:
+                pass
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return delay * random.uniform(0.5, 1.5)
+
+    def request(self, method: str, url: str, endpoint: str = None, **kwargs) -> requests.Response:
+        """
+        HTTP so'rov (retry bilan)
+
+        Args:
+            endpoint: Latency histogram nomi (default: host + path, raqamlar {id})
+            **kwargs: requests parametrlari (params, headers, auth, timeout, ...)
+
+        Returns:
+            Oxirgi javob (retry'lardan keyin ham 5xx/429 bo'lsa - o'sha javob)
+
+        Raises:
+            requests.RequestException: Hamma urinishlarda ulanish xatosi
+        """
+        kwargs.setdefault('timeout', 30)
+        endpoint = endpoint or default_endpoint(url)
+        session = self.session(url)
+
+        attempt = 0
+        while True:
+            started = time.perf_counter()
+            response = None
+            try:
+                response = session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            else:
+                error = None
+
+            retry = self._record(endpoint, started, attempt, error, response)
+            if not retry:
+                if error is not None:
+                    raise error
+                return response
+
+            delay = self._backoff(attempt, response)
+            self._log_retry(method, endpoint, attempt, error, response, delay)
+            time.sleep(delay)
+            attempt += 1
+
+    def get(self, url: str, endpoint: str = None, **kwargs) -> requests.Response:
+        return self.request('GET', url, endpoint=endpoint, **kwargs)
+
+    def post(self, url: str, endpoint: str = None, **kwargs) -> requests.Response:
+        return self.request('POST', url, endpoint=endpoint, **kwargs)
+
+    # ------------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------------
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Endpoint → latency histogram (dict)"""
+        with self._lock:
+            return {name: histogram.to_dict() for name, histogram in self._histograms.items()}
+
+    def log_summary(self, log: logging.Logger = None):
+        """Endpoint bo'yicha latency (eng sekini birinchi)"""
+        log = log or logger
+        stats = self.stats()
+        if not stats:
+            return
+
+        total = sum(entry['requests'] for entry in stats.values())
+        log.info(f"🌐 HTTP: {total} so'rov, {len(stats)} endpoint")
+        for name, entry in sorted(stats.items(), key=lambda x: x[1]['p95_ms'], reverse=True):
+            log.info(f"   {name}: {entry['requests']} ta, avg {entry['avg_ms']}ms, p50 {entry['p50_ms']:.0f}ms, "
+                     f"p95 {entry['p95_ms']:.0f}ms, max {entry['max_ms']}ms"
+                     + (f", retry {entry['retries']}" if entry['retries'] else '')
+                     + (f", xato {entry['errors']}" if entry['errors'] else ''))
+
+
+class AsyncHttpClient:
+    """
+    asyncio varianti: bitta httpx.AsyncClient (host bo'yicha keep-alive, HTTP/2)
+
+    Event loop'ga bog'langan - har bir asyncio.run() ichida yangisi yaratiladi
+    (async with yoki aclose()). Retry sozlamalari va latency histogram'lari
+    metrics client'dan (default: get_http_client()).
+    """
+
+    def __init__(self, metrics: HttpClient = None, http2: bool = None):
+        self.metrics = metrics or get_http_client()
+        if http2 is None:
+            http2 = os.getenv('HTTP2', '1') != '0'
+        self.http2 = http2 and importlib.util.find_spec('h2') is not None
+        if http2 and not self.http2:
+            # h2 requirements.txt da bor - yo'q bo'lsa eski muhit, HTTP/1.1 bilan ishlaydi
+            logger.warning("HTTP/2 o'chiq: h2 o'rnatilmagan (pip install -r requirements.txt)")
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            pool_size = self.metrics.pool_size
+            self._client = httpx.AsyncClient(
+                http2=self.http2,
+                limits=httpx.Limits(max_connections=pool_size * 4, max_keepalive_connections=pool_size),
+                timeout=30,
+            )
+        return self._client
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> 'AsyncHttpClient':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def request(self, method: str, url: str, endpoint: str = None, **kwargs) -> httpx.Response:
+        """HttpClient.request bilan bir xil (retry, Retry-After, histogram) - httpx.Response qaytadi"""
+        endpoint = endpoint or default_endpoint(url)
+        metrics = self.metrics
+
+        attempt = 0
+        while True:
+            started = time.perf_counter()
+            response = None
+            try:
+                response = await self.client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                error = e
+            else:
+                error = None
+
+            retry = metrics._record(endpoint, started, attempt, error, response)
+            if not retry:
+                if error is not None:
+                    raise error
+                return response
+
+            delay = metrics._backoff(attempt, response)
+            metrics._log_retry(method, endpoint, attempt, error, response, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def get(self, url: str, endpoint: str = None, **kwargs) -> httpx.Response:
+        return await self.request('GET', url, endpoint=endpoint, **kwargs)
+
+
+def run_sync(coro):
+    """
+    Coroutine'ni sync koddan ishga tushirish
+
+    Joriy thread'da event loop ishlayotgan bo'lsa (masalan FastAPI handler'idan
+    sync service chaqirilsa) - alohida thread'da asyncio.run().
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+_shared_client: Optional[HttpClient] = None
+_shared_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Process bo'yicha umumiy HttpClient (JIRA va GitHub client'lari shuni ishlatadi)"""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = HttpClient()
+        return _shared_client
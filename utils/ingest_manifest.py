@@ -0,0 +1,358 @@
+# utils/ingest_manifest.py
+"""
+Ingest manifest - SQLite (loaded_files.json o'rniga)
+
+Nima saqlanadi:
+    files        - fayl content hash (sha256), model, pipeline signature, status,
+                   qator/issue/chunk soni
+    issues       - har bir fayldagi issue hash'i (chunks + metadata + full text)
+    checkpoints  - yarim qolgan fayl: oxirgi yozilgan qator, batch, hisoblagichlar
+
+Nega SQLite:
+    - Har bir yangilanish tranzaksiya (BEGIN IMMEDIATE) - bir nechta ingest
+      worker bitta manifest'ni xavfsiz ishlatadi (WAL + busy_timeout).
+    - Butun JSON'ni qayta o'qish/yozish yo'q - faqat o'zgargan qatorlar.
+    - Issue hash bo'yicha indeksli qidiruv (o'zgarmagan issue'lar qayta embed qilinmaydi).
+
+Fayl o'zgarganini size_mtime emas, kontent sha256 bilan aniqlaymiz: bir xil
+hajm/vaqtli tahrirlar ham ko'rinadi, oddiy nusxa (copy) esa qayta yuklanmaydi.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# File status
+STATUS_IN_PROGRESS = 'in_progress'
+STATUS_DONE = 'done'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    name          TEXT PRIMARY KEY,
+    content_hash  TEXT NOT NULL,
+    size          INTEGER,
+    model         TEXT,
+    signature     TEXT,
+    status        TEXT NOT NULL,
+    rows_count    INTEGER DEFAULT 0,
+    issues_count  INTEGER DEFAULT 0,
+    chunks_count  INTEGER DEFAULT 0,
+    loaded_at     TEXT,
+    updated_at    TEXT
+);
+
+CREATE TABLE IF NOT EXISTS issues (
+    file        TEXT NOT NULL,
+    issue_key   TEXT NOT NULL,
+    issue_hash  TEXT NOT NULL,
+    row         INTEGER,
+    signature   TEXT,
+    updated_at  TEXT,
+    PRIMARY KEY (file, issue_key)
+);
+CREATE INDEX IF NOT EXISTS idx_issues_key ON issues (issue_key);
+
+CREATE TABLE IF NOT EXISTS checkpoints (
+    file          TEXT PRIMARY KEY,
+    content_hash  TEXT NOT NULL,
+    signature     TEXT,
+    last_row      INTEGER DEFAULT 1,
+    batches       INTEGER DEFAULT 0,
+    issues        INTEGER DEFAULT 0,
+    chunks        INTEGER DEFAULT 0,
+    updated_at    TEXT
+);
+"""
+
+
+def file_content_hash(path: str, block_size: int = 1 << 20) -> str:
+    """Fayl kontenti sha256 (streaming)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class IngestManifest:
+    """
+    Ingest manifest (SQLite)
+
+    Usage:
+        manifest = IngestManifest()
+        state = manifest.file_state(name, content_hash, signature)   # 'new' | 'changed' | ...
+        manifest.begin_file(name, content_hash, signature, model)
+        manifest.save_batch(name, last_row=..., batches=..., issues=[(key, hash, row), ...], ...)
+        manifest.complete_file(name, rows_count=...)
+    """
+
+    def __init__(self, db_path: str = None):
+        """
+        Args:
+            db_path: SQLite fayl (default: INGEST_MANIFEST_PATH yoki DATA_DIR/ingest_manifest.db)
+        """
+        if db_path is None:
+            db_path = os.getenv(
+                'INGEST_MANIFEST_PATH',
+                os.path.join(os.getenv('DATA_DIR', './data'), 'ingest_manifest.db')
+            )
+        self.db_path = db_path
+
+        db_dir = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(db_dir, exist_ok=True)
+
+        # isolation_level=None - tranzaksiyalarni o'zimiz boshqaramiz (BEGIN IMMEDIATE)
+        self._conn = sqlite3.connect(db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=30000")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @contextmanager
+    def _transaction(self):
+        """Yozish tranzaksiyasi - lock darhol olinadi, boshqa worker kutadi"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now().isoformat()
+
+    # ========================================================================
+    # FILES
+    # ========================================================================
+    def get_file(self, name: str) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute("SELECT * FROM files WHERE name = ?", (name,)).fetchone()
+        return dict(row) if row else None
+
+    def list_files(self) -> List[Dict[str, Any]]:
+        return [dict(r) for r in self._conn.execute("SELECT * FROM files ORDER BY name")]
+
+    def file_state(self, name: str, content_hash: str, signature: str = None) -> str:
+        """
+        Fayl holati
+
+        Returns:
+            'new'          - manifest'da yo'q
+            'changed'      - kontent o'zgargan
+            'stale'        - kontent bir xil, lekin model/chunking sozlamalari boshqa
+            'in_progress'  - yarim qolgan (checkpoint bor)
+            'done'         - yuklangan, o'zgarmagan
+        """
+        entry = self.get_file(name)
+        if entry is None:
+            return 'new'
+        if entry['content_hash'] != content_hash:
+            return 'changed'
+        if entry['status'] == STATUS_IN_PROGRESS:
+            return STATUS_IN_PROGRESS
+        # signature NULL - legacy (loaded_files.json) yozuvi, qayta yuklash shart emas
+        if signature and entry['signature'] and entry['signature'] != signature:
+            return 'stale'
+        return STATUS_DONE
+
+    def begin_file(self, name: str, content_hash: str, signature: str = None,
+                   model: str = None, size: int = None, reset: bool = True):
+        """
+        Faylni yuklashni boshlash
+
+        Args:
+            reset: True - eski checkpoint va issue yozuvlari o'chiriladi (boshidan yuklash)
+        """
+        with self._transaction() as conn:
+            if reset:
+                conn.execute("DELETE FROM checkpoints WHERE file = ?", (name,))
+                conn.execute("DELETE FROM issues WHERE file = ?", (name,))
+            conn.execute(
+                """
+                INSERT INTO files (name, content_hash, size, model, signature, status, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    content_hash = excluded.content_hash,
+                    size = excluded.size,
+                    model = excluded.model,
+                    signature = excluded.signature,
+                    status = excluded.status,
+                    updated_at = excluded.updated_at
+                """,
+                (name, content_hash, size, model, signature, STATUS_IN_PROGRESS, self._now())
+            )
+            conn.execute(
+                """
+                INSERT OR IGNORE INTO checkpoints (file, content_hash, signature, updated_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (name, content_hash, signature, self._now())
+            )
+
+    def complete_file(self, name: str, rows_count: int = 0):
+        """
+        Fayl to'liq yuklandi - checkpoint o'chadi, hisoblagichlar files'ga o'tadi
+
+        Bitta tranzaksiya: oxirgi batch checkpoint'i va yakuniy holat birga yoziladi.
+        """
+        with self._transaction() as conn:
+            counts = conn.execute(
+                "SELECT COUNT(*) AS issues FROM issues WHERE file = ?", (name,)
+            ).fetchone()
+            checkpoint = conn.execute(
+                "SELECT chunks FROM checkpoints WHERE file = ?", (name,)
+            ).fetchone()
+            now = self._now()
+            conn.execute(
+                """
+                UPDATE files SET status = ?, rows_count = ?, issues_count = ?, chunks_count = ?,
+                                 loaded_at = ?, updated_at = ?
+                WHERE name = ?
+                """,
+                (STATUS_DONE, rows_count, counts['issues'],
+                 checkpoint['chunks'] if checkpoint else 0, now, now, name)
+            )
+            conn.execute("DELETE FROM checkpoints WHERE file = ?", (name,))
+
+    def forget_file(self, name: str):
+        """Faylni manifest'dan o'chirish (majburiy qayta yuklash uchun)"""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM checkpoints WHERE file = ?", (name,))
+            conn.execute("DELETE FROM issues WHERE file = ?", (name,))
+            conn.execute("DELETE FROM files WHERE name = ?", (name,))
+
+    # ========================================================================
+    # CHECKPOINTS
+    # ========================================================================
+    def get_checkpoint(self, name: str) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute("SELECT * FROM checkpoints WHERE file = ?", (name,)).fetchone()
+        return dict(row) if row else None
+
+    def save_batch(
+            self,
+            name: str,
+            last_row: int,
+            batches: int,
+            issues: Iterable[Tuple[str, str, int]],
+            chunks: int = 0,
+            signature: str = None
+    ):
+        """
+        Batch yozilgandan keyin: issue hash'lari + checkpoint bitta tranzaksiyada
+
+        Args:
+            issues: (issue_key, issue_hash, row) - yozilgan va o'tkazib yuborilgan (o'zgarmagan) issue'lar
+            chunks: Shu batch'da yozilgan chunk soni
+        """
+        issues = list(issues)
+        now = self._now()
+        with self._transaction() as conn:
+            conn.executemany(
+                """
+                INSERT INTO issues (file, issue_key, issue_hash, row, signature, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(file, issue_key) DO UPDATE SET
+                    issue_hash = excluded.issue_hash,
+                    row = excluded.row,
+                    signature = excluded.signature,
+                    updated_at = excluded.updated_at
+                """,
+                [(name, key, issue_hash, row, signature, now) for key, issue_hash, row in issues]
+            )
+            conn.execute(
+                """
+                UPDATE checkpoints SET last_row = MAX(last_row, ?), batches = ?,
+                                       issues = issues + ?, chunks = chunks + ?, updated_at = ?
+                WHERE file = ?
+                """,
+                (last_row, batches, len(issues), chunks, now, name)
+            )
+
+    # ========================================================================
+    # ISSUES
+    # ========================================================================
+    def issue_hashes(self, signature: str = None) -> Dict[str, str]:
+        """
+        Issue key → oxirgi yozilgan hash (shu signature bilan)
+
+        Bir issue bir nechta faylda bo'lsa eng oxirgi yangilangani olinadi -
+        VectorDB'da ham oxirgi upsert turadi.
+        """
+        query = "SELECT issue_key, issue_hash FROM issues"
+        params: Tuple = ()
+        if signature:
+            query += " WHERE signature = ?"
+            params = (signature,)
+        query += " ORDER BY updated_at"
+        return {row['issue_key']: row['issue_hash'] for row in self._conn.execute(query, params)}
+
+    def file_issue_count(self, name: str) -> int:
+        row = self._conn.execute("SELECT COUNT(*) AS n FROM issues WHERE file = ?", (name,)).fetchone()
+        return row['n']
+
+    # ========================================================================
+    # LEGACY
+    # ========================================================================
+    def import_legacy_log(self, log_path: str, excel_dir: str) -> int:
+        """
+        Eski loaded_files.json'ni ko'chirish
+
+        Faqat size_mtime hali mos kelgan (yuklangandan beri o'zgarmagan) fayllar
+        'done' sifatida yoziladi - kontent hash'i hozir hisoblanadi. Qolganlari
+        manifest'ga tushmaydi va keyingi run'da yangi deb yuklanadi.
+
+        Returns:
+            Ko'chirilgan fayllar soni
+        """
+        if not os.path.exists(log_path):
+            return 0
+        try:
+            with open(log_path, 'r', encoding='utf-8') as f:
+                legacy = json.load(f)
+        except (OSError, ValueError):
+            return 0
+
+        imported = 0
+        for name, info in legacy.items():
+            path = os.path.join(excel_dir, name)
+            if not os.path.exists(path) or info.get('status', STATUS_DONE) != STATUS_DONE:
+                continue
+            stat = os.stat(path)
+            if info.get('hash') != f"{stat.st_size}_{int(stat.st_mtime)}":
+                continue
+            if self.get_file(name) is not None:
+                continue
+
+            now = self._now()
+            with self._transaction() as conn:
+                conn.execute(
+                    """
+                    INSERT INTO files (name, content_hash, size, status, issues_count, chunks_count,
+                                       loaded_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (name, file_content_hash(path), stat.st_size, STATUS_DONE,
+                     info.get('issues_count', 0), info.get('chunks_count', 0),
+                     info.get('loaded_at', now), now)
+                )
+            imported += 1
+
+        return imported
@@ -0,0 +1,680 @@
+# utils/ingest_pipeline.py
+"""
+Overlapped ingest pipeline: read → chunk → embed → write
+
+Oldin 2_load_sprints.py har bir faylni 4 ta ketma-ket bosqichda yuklardi (hamma
+qatorni o'qish → hamma chunk'ni embed → weight → write): xotira butun sprint
+hajmiga yetardi, I/O paytida CPU/GPU bo'sh turardi.
+
+Endi bosqichlar alohida thread'larda, orasida chegaralangan (bounded) queue:
+
+    reader ──► chunker ──► embedder (micro-batch + weighting) ──► writer
+         q_issues     q_chunked                        q_embedded
+
+- Queue to'lsa oldingi bosqich kutadi (backpressure) - xotirada eng ko'pi
+  (queue_size + 1) * batch_size issue bo'ladi, workbook hajmiga bog'liq emas.
+- Har bir bosqich uchun busy/wait/blocked vaqt va throughput yig'iladi.
+- Writer chaqiruvchi thread'da ishlaydi (ChromaDB yozuvlari bitta thread'dan).
+- Yozuv upsert bilan (idempotent): har bir batch yozilgach on_batch callback
+  checkpoint saqlaydi, yiqilgan yuklash oxirgi batch'dan davom etadi.
+- skip_issue callback: hash'i o'zgarmagan issue'lar embed/write qilinmaydi.
+- run_many(): bir nechta fayl bir vaqtda o'qiladi/chunk qilinadi (har biriga
+  reader + chunker), hammasi bitta embedder va writer'ga tushadi:
+
+    reader A ──► chunker A ──┐
+    reader B ──► chunker B ──┼──► embedder ──► writer
+    reader C ──► chunker C ──┘
+
+Usage:
+    pipeline = IngestPipeline(embedding_helper, vectordb_helper, chunking_helper)
+    with SprintWorkbookReader(path) as reader:
+        result = pipeline.run(path, reader.iter_issues(), total=reader.total_rows)
+    result.print_summary()
+
+    total = pipeline.run_many([IngestSource(name, issues, total=n) for name, issues, n in files])
+    total.print_summary()   # total.sources[name] - har bir fayl
+"""
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Iterable, Optional, Callable, Tuple
+
+from dotenv import load_dotenv
+from tqdm import tqdm
+
+from utils.weighting_helper import WeightingHelper
+
+load_dotenv()
+
+# Queue oxiri belgisi
+_DONE = object()
+
+# Stop event tekshiruvi oralig'i (sekund)
+_POLL_INTERVAL = 0.1
+
+
+class _SourceDone:
+    """Manba oxiri belgisi (q_chunked → writer): shu manbaning hamma batch'lari o'tdi"""
+    __slots__ = ('name', 'error', 'started')
+
+    def __init__(self, name: str, error: Optional[BaseException], started: float):
+        self.name = name
+        self.error = error
+        self.started = started
+
+
+class _AnyEvent:
+    """Bir nechta Event'dan birortasi set bo'lsa - set (manba + butun pipeline stop)"""
+
+    def __init__(self, *events: threading.Event):
+        self.events = events
+
+    def is_set(self) -> bool:
+        return any(event.is_set() for event in self.events)
+
+
+def build_issue_metadata(issue_data: Dict[str, Any]) -> Dict[str, Any]:
+    """VectorDB metadata (2_load_sprints.py formatida)"""
+    return {
+        'type': issue_data['type'],
+        'status': issue_data['status'],
+        'sprint_id': issue_data['sprint_id'],
+        'assignee': issue_data['assignee'],
+        'reporter': issue_data['reporter'],
+        'priority': issue_data['priority'],
+        'story_points': str(issue_data['story_points']),
+        'created_date': issue_data['created_date'],
+        'resolved_date': issue_data['resolved_date'],
+        'has_comments': 'yes' if issue_data['comments'] else 'no',
+        'return_count': str(issue_data['return_count']),
+        'labels': issue_data['labels'] or 'none',
+        'components': issue_data['components'] or 'none',
+        'has_pr': 'yes' if issue_data['pr_status'] else 'no',
+        'pr_status': issue_data['pr_status'] or 'none',
+    }
+
+
+def hash_issue(chunks: List[Dict[str, Any]], metadata: Dict[str, Any], full_text: str) -> str:
+    """
+    Issue hash'i - VectorDB'ga yoziladigan hamma narsa (chunks, metadata, full text)
+
+    Hash bir xil bo'lsa, issue qayta embed qilinmaydi.
+    """
+    payload = json.dumps(
+        {
+            'chunks': [[c.get('type'), c.get('weight'), c.get('text')] for c in chunks],
+            'metadata': metadata,
+            'text': full_text,
+        },
+        ensure_ascii=False, sort_keys=True, separators=(',', ':')
+    )
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+# ============================================================================
+# DATA CLASSES
+# ============================================================================
+@dataclass
+class StageStats:
+    """Bitta bosqich statistikasi"""
+    name: str
+    unit: str = 'issue'
+    items: int = 0
+    busy_seconds: float = 0.0      # o'z ishi
+    wait_seconds: float = 0.0      # input kutish (oldingi bosqich sekin)
+    blocked_seconds: float = 0.0   # output queue to'la (backpressure)
+
+    @property
+    def throughput(self) -> Optional[float]:
+        return self.items / self.busy_seconds if self.busy_seconds > 0 else None
+
+    def merge(self, other: 'StageStats'):
+        """Boshqa manbaning shu bosqich statistikasini qo'shish"""
+        self.items += other.items
+        self.busy_seconds += other.busy_seconds
+        self.wait_seconds += other.wait_seconds
+        self.blocked_seconds += other.blocked_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'unit': self.unit,
+            'items': self.items,
+            'busy_seconds': round(self.busy_seconds, 4),
+            'wait_seconds': round(self.wait_seconds, 4),
+            'blocked_seconds': round(self.blocked_seconds, 4),
+            'throughput_per_s': round(self.throughput, 2) if self.throughput else None,
+        }
+
+
+@dataclass
+class IngestBatch:
+    """Pipeline bo'ylab o'tadigan micro-batch"""
+    index: int
+    source: str = ''
+    keys: List[str] = field(default_factory=list)
+    full_texts: List[str] = field(default_factory=list)
+    metadatas: List[Dict[str, Any]] = field(default_factory=list)
+    chunks: List[List[Dict[str, Any]]] = field(default_factory=list)
+    issue_hashes: List[str] = field(default_factory=list)
+    rows: List[int] = field(default_factory=list)
+    embeddings_flat: List[List[float]] = field(default_factory=list)
+    weighted_embeddings: List[List[float]] = field(default_factory=list)
+    last_row: int = 0              # batch'dagi oxirgi Excel qatori (checkpoint)
+    skipped: List[Tuple[str, str, int]] = field(default_factory=list)  # o'zgarmagan: (key, hash, row)
+
+    @property
+    def chunk_count(self) -> int:
+        return sum(len(c) for c in self.chunks)
+
+    @property
+    def size(self) -> int:
+        return len(self.keys) + len(self.skipped)
+
+
+@dataclass
+class IngestResult:
+    """Bitta manba (fayl) ingest natijasi"""
+    source: str
+    issues: int = 0
+    chunks: int = 0
+    batches: int = 0
+    skipped: int = 0
+    root_causes: int = 0
+    solutions: int = 0
+    seconds: float = 0.0
+    stages: Dict[str, StageStats] = field(default_factory=dict)
+    error: Optional[BaseException] = None                             # manba o'qish/chunk xatoligi
+    sources: Dict[str, 'IngestResult'] = field(default_factory=dict)  # run_many(): manbalar bo'yicha
+
+    @classmethod
+    def aggregate(cls, results: Iterable['IngestResult'], source: str = '*') -> 'IngestResult':
+        """Manbalar natijalari yig'indisi (stages va seconds - chaqiruvchi to'ldiradi)"""
+        total = cls(source=source)
+        for result in results:
+            total.issues += result.issues
+            total.chunks += result.chunks
+            total.batches += result.batches
+            total.skipped += result.skipped
+            total.root_causes += result.root_causes
+            total.solutions += result.solutions
+        return total
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            'source': self.source,
+            'issues': self.issues,
+            'chunks': self.chunks,
+            'batches': self.batches,
+            'skipped': self.skipped,
+            'root_causes': self.root_causes,
+            'solutions': self.solutions,
+            'seconds': round(self.seconds, 4),
+            'stages': {name: s.to_dict() for name, s in self.stages.items()},
+            'error': str(self.error) if self.error is not None else None,
+        }
+        if self.sources:
+            data['sources'] = {name: r.to_dict() for name, r in self.sources.items()}
+        return data
+
+    def print_summary(self):
+        """Bosqichlar bo'yicha jadval"""
+        rate = self.issues / self.seconds if self.seconds > 0 else 0
+        print(f"   ⏱️  {self.issues} issue, {self.chunks} chunk, {self.batches} batch, "
+              f"{self.skipped} o'zgarmagan - {self.seconds:.1f}s ({rate:.1f} issue/s)")
+        print(f"   {'stage':<10}{'items':>9}{'busy s':>10}{'wait s':>10}{'blocked s':>11}{'per s':>10}")
+        for stage in self.stages.values():
+            print(f"   {stage.name:<10}{stage.items:>9}{stage.busy_seconds:>10.2f}"
+                  f"{stage.wait_seconds:>10.2f}{stage.blocked_seconds:>11.2f}"
+                  f"{stage.throughput or 0:>10.1f}")
+
+
+@dataclass
+class IngestSource:
+    """run_many() uchun bitta manba (fayl yoki JIRA sprint)"""
+    name: str                                                                  # chunk cache / manifest nomi
+    issues: Iterable[Dict[str, Any]]                                           # build_issue() formatida
+    total: Optional[int] = None                                                # progress bar uchun
+    start_batch: int = 0                                                       # resume
+    on_batch: Optional[Callable[[IngestBatch, IngestResult], None]] = None     # batch yozilgach
+    skip_issue: Optional[Callable[[str, str], bool]] = None                    # (key, hash) → o'zgarmagan
+    on_done: Optional[Callable[[IngestResult], None]] = None                   # manba tugagach (xatolik bilan ham)
+
+
+# ============================================================================
+# PIPELINE
+# ============================================================================
+class IngestPipeline:
+    """
+    Streaming ingest: issue dict'lar → VectorDB
+
+    Manba - issue dict'lar iterable'i (SprintWorkbookReader.iter_issues() yoki
+    boshqa generator). Pipeline hech narsani to'plab qo'ymaydi: har bir
+    micro-batch yozilgach xotiradan chiqadi.
+    """
+
+    def __init__(
+            self,
+            embedding_helper,
+            vectordb_helper,
+            chunking_helper,
+            chunk_cache=None,
+            batch_size: int = None,
+            queue_size: int = None,
+            parallel_files: int = None
+    ):
+        """
+        Args:
+            embedding_helper: EmbeddingHelper
+            vectordb_helper: VectorDBHelper
+            chunking_helper: ChunkingHelper
+            chunk_cache: ChunkVectorCache (None - chunk vektorlar saqlanmaydi)
+            batch_size: Micro-batch hajmi, issue (default: INGEST_BATCH_SIZE yoki 64)
+            queue_size: Bosqichlar orasidagi queue sig'imi, batch (default: INGEST_QUEUE_SIZE yoki 4)
+            parallel_files: run_many() da bir vaqtda o'qiladigan fayllar (default: INGEST_PARALLEL_FILES yoki 3)
+        """
+        self.embedding_helper = embedding_helper
+        self.vectordb_helper = vectordb_helper
+        self.chunking_helper = chunking_helper
+        self.chunk_cache = chunk_cache
+        self.batch_size = max(1, batch_size or int(os.getenv('INGEST_BATCH_SIZE', 64)))
+        self.queue_size = max(1, queue_size or int(os.getenv('INGEST_QUEUE_SIZE', 4)))
+        self.parallel_files = max(1, parallel_files or int(os.getenv('INGEST_PARALLEL_FILES', 3)))
+
+    def signature(self) -> str:
+        """
+        Embedding model + chunking sozlamalari hash'i
+
+        Checkpoint shu bilan saqlanadi: model yoki weight'lar o'zgargan bo'lsa,
+        yarim yuklangan faylni davom ettirib bo'lmaydi (vektorlar aralashib ketadi).
+        """
+        payload = json.dumps({
+            'model': getattr(self.embedding_helper, 'model_name', None),
+            'max_chunk_length': getattr(self.chunking_helper, 'max_chunk_length', None),
+            'weights': getattr(self.chunking_helper, 'weights', None),
+        }, sort_keys=True)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+    # ------------------------------------------------------------------------
+    # Queue helpers - stop event bilan (bitta bosqich yiqilsa qolganlari osilib qolmasin)
+    # ------------------------------------------------------------------------
+    @staticmethod
+    def _put(q: queue.Queue, item, stats: StageStats, stop: threading.Event) -> bool:
+        start = time.perf_counter()
+        try:
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=_POLL_INTERVAL)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        finally:
+            stats.blocked_seconds += time.perf_counter() - start
+
+    @staticmethod
+    def _get(q: queue.Queue, stats: StageStats, stop: threading.Event):
+        start = time.perf_counter()
+        try:
+            while not stop.is_set():
+                try:
+                    return q.get(timeout=_POLL_INTERVAL)
+                except queue.Empty:
+                    continue
+            return _DONE
+        finally:
+            stats.wait_seconds += time.perf_counter() - start
+
+    def _run_stage(self, target, errors: List[BaseException], stop: threading.Event, *args):
+        """Thread wrapper: xatolik bo'lsa saqlab, butun pipeline'ni to'xtatish"""
+        try:
+            target(*args)
+        except BaseException as e:
+            errors.append(e)
+            stop.set()
+
+
+    # ------------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------------
+    def _read_stage(self, issues: Iterable[Dict[str, Any]], out_q: queue.Queue,
+                    stats: StageStats, stop):
+        iterator = iter(issues)
+        while not stop.is_set():
+            start = time.perf_counter()
+            issue = next(iterator, _DONE)
+            stats.busy_seconds += time.perf_counter() - start
+
+            if issue is _DONE:
+                break
+            stats.items += 1
+            if not self._put(out_q, issue, stats, stop):
+                return
+
+        self._put(out_q, _DONE, stats, stop)
+
+    def _chunk_stage(self, source: IngestSource, in_q: queue.Queue, out_q: queue.Queue,
+                     stats: StageStats, stop):
+        batch_index = source.start_batch
+        batch = IngestBatch(index=batch_index, source=source.name)
+
+        while True:
+            issue_data = self._get(in_q, stats, stop)
+            if issue_data is _DONE:
+                break
+
+            start = time.perf_counter()
+            key = issue_data['key']
+            row = issue_data.get('row', 0)
+            chunks = self.chunking_helper.create_chunks(issue_data)
+            full_text = self.chunking_helper.create_full_text_for_backward_compatibility(issue_data)
+            metadata = build_issue_metadata(issue_data)
+            issue_hash = hash_issue(chunks, metadata, full_text)
+
+            if source.skip_issue is not None and source.skip_issue(key, issue_hash):
+                batch.skipped.append((key, issue_hash, row))
+            else:
+                batch.keys.append(key)
+                batch.chunks.append(chunks)
+                batch.full_texts.append(full_text)
+                batch.metadatas.append(metadata)
+                batch.issue_hashes.append(issue_hash)
+                batch.rows.append(row)
+            batch.last_row = max(batch.last_row, row)
+            stats.items += 1
+            stats.busy_seconds += time.perf_counter() - start
+
+            if batch.size >= self.batch_size:
+                if not self._put(out_q, batch, stats, stop):
+                    return
+                batch_index += 1
+                batch = IngestBatch(index=batch_index, source=source.name)
+
+        if batch.size and not stop.is_set():
+            self._put(out_q, batch, stats, stop)
+
+    def _produce_source(self, source: IngestSource, out_q: queue.Queue,
+                        result: IngestResult, stop: threading.Event):
+        """
+        Bitta manba: reader thread + chunker (shu thread) → umumiy q_chunked
+
+        Manba xatoligi (buzilgan workbook va h.k.) faqat shu manbani to'xtatadi -
+        xatolik _SourceDone orqali writer'ga yetadi, qolgan fayllar yuklanaveradi.
+        """
+        started = time.perf_counter()
+        errors: List[BaseException] = []
+        source_stop = threading.Event()
+        stop_any = _AnyEvent(stop, source_stop)
+
+        try:
+            if self.chunk_cache is not None and source.start_batch == 0:
+                self.chunk_cache.clear_source(source.name)
+
+            q_issues = queue.Queue(maxsize=self.batch_size * self.queue_size)
+            reader = threading.Thread(
+                target=self._run_stage, name=f"ingest-read-{source.name}", daemon=True,
+                args=(self._read_stage, errors, source_stop, source.issues, q_issues,
+                      result.stages['read'], stop_any)
+            )
+            reader.start()
+            try:
+                self._chunk_stage(source, q_issues, out_q, result.stages['chunk'], stop_any)
+            except BaseException:
+                source_stop.set()
+                raise
+            finally:
+                reader.join()
+        except BaseException as e:
+            errors.append(e)
+            source_stop.set()
+
+        self._put(out_q, _SourceDone(source.name, errors[0] if errors else None, started),
+                  result.stages['chunk'], stop)
+
+    def _source_stage(self, sources: List[IngestSource], out_q: queue.Queue,
+                      results: Dict[str, IngestResult], stop: threading.Event, parallel: int):
+        """parallel ta manba bir vaqtda o'qiladi/chunk qilinadi, oxirida _DONE"""
+        pending = queue.Queue()
+        for source in sources:
+            pending.put(source)
+
+        def worker():
+            while not stop.is_set():
+                try:
+                    source = pending.get_nowait()
+                except queue.Empty:
+                    return
+                self._produce_source(source, out_q, results[source.name], stop)
+
+        workers = [
+            threading.Thread(target=worker, name=f"ingest-source-{i}", daemon=True)
+            for i in range(max(1, min(parallel, len(sources))))
+        ]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+
+        self._put(out_q, _DONE, StageStats('source'), stop)
+
+    def _embed_stage(self, in_q: queue.Queue, out_q: queue.Queue,
+                     results: Dict[str, IngestResult], stats: StageStats, stop: threading.Event):
+        while True:
+            batch = self._get(in_q, stats, stop)
+            if batch is _DONE:
+                break
+
+            if not isinstance(batch, _SourceDone):
+                start = time.perf_counter()
+                chunks_flat = [chunk for issue_chunks in batch.chunks for chunk in issue_chunks]
+                if chunks_flat:
+                    batch.embeddings_flat = self.embedding_helper.encode_chunks(
+                        chunks_flat, show_progress=False
+                    )
+                batch.weighted_embeddings = WeightingHelper.weight_issues(
+                    batch.chunks, batch.embeddings_flat
+                )
+                elapsed = time.perf_counter() - start
+                stats.items += len(chunks_flat)
+                stats.busy_seconds += elapsed
+
+                source_stats = results[batch.source].stages['embed']
+                source_stats.items += len(chunks_flat)
+                source_stats.busy_seconds += elapsed
+
+            if not self._put(out_q, batch, stats, stop):
+                return
+
+        self._put(out_q, _DONE, stats, stop)
+
+    def _write_batch(self, batch: IngestBatch):
+        if not batch.keys:
+            return
+        self.vectordb_helper.upsert_issues_batch_with_chunks(
+            keys=batch.keys,
+            weighted_embeddings=batch.weighted_embeddings,
+            full_texts=batch.full_texts,
+            metadatas=batch.metadatas,
+            all_chunks_data=batch.chunks
+        )
+        if self.chunk_cache is not None and batch.embeddings_flat:
+            self.chunk_cache.write_batch(
+                batch.source, batch.index, batch.keys, batch.chunks, batch.embeddings_flat
+            )
+
+    # ------------------------------------------------------------------------
+    # Run
+    # ------------------------------------------------------------------------
+    def run(
+            self,
+            source: str,
+            issues: Iterable[Dict[str, Any]],
+            total: int = None,
+            show_progress: bool = True,
+            start_batch: int = 0,
+            on_batch: Callable[[IngestBatch, IngestResult], None] = None,
+            skip_issue: Callable[[str, str], bool] = None
+    ) -> IngestResult:
+        """
+        Bitta manbani to'liq yuklash
+
+        Args:
+            source: Manba nomi (Excel fayl nomi) - chunk cache shu nom bilan
+            issues: Issue dict'lar (build_issue() formatida)
+            total: Progress bar uchun taxminiy issue soni
+            show_progress: tqdm progress bar
+            start_batch: Birinchi batch indeksi (resume - chunk cache shard'lari ustiga yozilmasin)
+            on_batch: Har bir batch yozilgandan keyin (checkpoint uchun)
+            skip_issue: (key, issue_hash) → True bo'lsa issue o'zgarmagan, embed/write qilinmaydi
+
+        Returns:
+            IngestResult
+
+        Raises:
+            Bosqichlardan birida chiqqan birinchi xatolik (qolganlari to'xtatiladi)
+        """
+        total_result = self.run_many(
+            [IngestSource(source, issues, total=total, start_batch=start_batch,
+                          on_batch=on_batch, skip_issue=skip_issue)],
+            show_progress=show_progress, parallel=1
+        )
+        result = total_result.sources[source]
+        if result.error is not None:
+            raise result.error
+
+        result.stages = total_result.stages
+        return result
+
+    def run_many(
+            self,
+            sources: List[IngestSource],
+            show_progress: bool = True,
+            parallel: int = None
+    ) -> IngestResult:
+        """
+        Bir nechta manbani bitta embedder/writer orqali yuklash
+
+        parallel ta fayl bir vaqtda o'qiladi va chunk qilinadi; batch'lar umumiy
+        queue orqali bitta embedder'ga tushadi - model fayllar orasida bo'sh
+        turmaydi, kichik fayllar alohida "ishga tushish" narxini to'lamaydi.
+        Har bir manbaning batch'lari o'z tartibida yoziladi (checkpoint to'g'ri).
+
+        Args:
+            sources: IngestSource'lar (nomlar takrorlanmasin)
+            show_progress: tqdm progress bar (hamma manbalar uchun bitta)
+            parallel: Bir vaqtda o'qiladigan fayllar (default: self.parallel_files)
+
+        Returns:
+            Umumiy IngestResult (source='*'): hisoblagichlar yig'indisi, stages -
+            read/chunk manbalar bo'yicha yig'indi, embed/write umumiy bosqich.
+            Har bir manba natijasi - result.sources[name] (xatolik - .error).
+
+        Raises:
+            Embed/write yoki callback xatoligi (hamma manbalar to'xtatiladi)
+        """
+        names = [s.name for s in sources]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Manba nomlari takrorlangan: {names}")
+
+        results = {s.name: IngestResult(source=s.name, stages=_new_stages()) for s in sources}
+        by_name = {s.name: s for s in sources}
+        stages = _new_stages()
+
+        stop = threading.Event()
+        errors: List[BaseException] = []
+        q_chunked = queue.Queue(maxsize=self.queue_size)
+        q_embedded = queue.Queue(maxsize=self.queue_size)
+
+        threads = [
+            threading.Thread(
+                target=self._run_stage, name="ingest-sources", daemon=True,
+                args=(self._source_stage, errors, stop, sources, q_chunked, results, stop,
+                      parallel or self.parallel_files)
+            ),
+            threading.Thread(
+                target=self._run_stage, name="ingest-embed", daemon=True,
+                args=(self._embed_stage, errors, stop, q_chunked, q_embedded, results,
+                      stages['embed'], stop)
+            ),
+        ]
+
+        totals = [s.total for s in sources]
+        pbar_total = sum(totals) if None not in totals else None
+
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+
+        finished = 0
+        pbar = tqdm(total=pbar_total, desc="   💾 Ingest", unit="issue", disable=not show_progress,
+                    bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]{postfix}")
+        try:
+            while True:
+                batch = self._get(q_embedded, stages['write'], stop)
+                if batch is _DONE:
+                    break
+
+                if isinstance(batch, _SourceDone):
+                    result = results[batch.name]
+                    result.error = batch.error
+                    result.seconds = time.perf_counter() - batch.started
+                    if by_name[batch.name].on_done is not None:
+                        by_name[batch.name].on_done(result)
+                    finished += 1
+                    if len(sources) > 1:
+                        pbar.set_postfix_str(f"{finished}/{len(sources)} fayl")
+                    continue
+
+                result = results[batch.source]
+                start = time.perf_counter()
+                self._write_batch(batch)
+                elapsed = time.perf_counter() - start
+                for write_stats in (stages['write'], result.stages['write']):
+                    write_stats.busy_seconds += elapsed
+                    write_stats.items += len(batch.keys)
+
+                result.issues += len(batch.keys)
+                result.chunks += batch.chunk_count
+                result.batches += 1
+                result.skipped += len(batch.skipped)
+                for issue_chunks in batch.chunks:
+                    for chunk in issue_chunks:
+                        if chunk['type'] == 'root_cause':
+                            result.root_causes += 1
+                        elif chunk['type'] == 'solution':
+                            result.solutions += 1
+
+                if by_name[batch.source].on_batch is not None:
+                    by_name[batch.source].on_batch(batch, result)
+                pbar.update(batch.size)
+        except BaseException:
+            stop.set()
+            raise
+        finally:
+            pbar.close()
+            for thread in threads:
+                thread.join()
+
+        if errors:
+            raise errors[0]
+
+        total_result = IngestResult.aggregate(results.values())
+        total_result.seconds = time.perf_counter() - started
+        for name in ('read', 'chunk'):
+            for result in results.values():
+                stages[name].merge(result.stages[name])
+        total_result.stages = stages
+        total_result.sources = results
+        return total_result
+
+
+def _new_stages() -> Dict[str, StageStats]:
+    return {
+        'read': StageStats('read'),
+        'chunk': StageStats('chunk'),
+        'embed': StageStats('embed', unit='chunk'),
+        'write': StageStats('write'),
+    }
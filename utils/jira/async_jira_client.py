@@ -0,0 +1,133 @@
+# utils/jira/async_jira_client.py
+"""
+JiraClient'ning asyncio varianti (httpx, HTTP/2)
+
+JiraClient jira kutubxonasi orqali sinxron ishlaydi: task details → Dev Status
+→ (har bir task uchun) ketma-ket round-trip'lar. AsyncJiraClient xuddi shu
+natijalarni (get_task_details dict'i, PR ro'yxati) qaytaradi, lekin bir nechta
+task'ni gather bilan parallel so'rash mumkin.
+
+Sozlamalar, TTL kesh va dict formati sinxron JiraClient bilan umumiy
+(build_task_details, _cache) - ikkalasi aralash ishlatilsa ham qayta so'ralmaydi.
+
+Usage:
+    async with AsyncJiraClient() as jira:
+        details = await jira.get_task_details('DEV-1234')
+        many = await asyncio.gather(*(jira.get_task_details(k) for k in keys))
+"""
+import copy
+import logging
+from typing import Dict, List, Optional, Any
+
+from utils.http_client import AsyncHttpClient
+from utils.jira.field_sets import FieldSet, TASK_DETAILS, ISSUE_ID
+from utils.jira.jira_client import JiraClient, DEV_STATUS_PATH, dev_status_params, parse_dev_status_prs
+
+logger = logging.getLogger(__name__)
+
+# jira kutubxonasi default'i bilan bir xil (description - wiki matn)
+REST_API_PATH = '/rest/api/2'
+
+
+def issue_from_json(raw: Dict[str, Any]):
+    """REST JSON → jira Issue obyekti (extractor'lar va build_task_details o'zgarishsiz ishlaydi)"""
+    from jira.resources import Issue
+
+    return Issue({'server': ''}, None, raw=raw)
+
+
+class AsyncJiraClient:
+    """JIRA REST API - asyncio (JiraClient bilan bir xil natijalar)"""
+
+    def __init__(self, jira_client: JiraClient = None, http: AsyncHttpClient = None):
+        """
+        Args:
+            jira_client: Sozlamalar, kesh va dict formati shundan (default: yangi JiraClient)
+            http: Async HTTP client (default: yangi AsyncHttpClient)
+        """
+        self.sync = jira_client or JiraClient()
+        self.http = http or AsyncHttpClient()
+        self.server = self.sync.server
+
+    async def aclose(self):
+        await self.http.aclose()
+
+    async def __aenter__(self) -> 'AsyncJiraClient':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def _get(self, path: str, endpoint: str, params: Dict[str, Any] = None):
+        return await self.http.get(
+            f"{self.server}{path}",
+            endpoint=endpoint,
+            params=params,
+            auth=(self.sync.email, self.sync.token),
+            headers={'Accept': 'application/json'},
+        )
+
+    async def get_issue(self, issue_key: str, field_set: FieldSet = None, expand: str = None,
+                        fields: str = None) -> Optional[Any]:
+        """JiraClient.get_issue - kesh umumiy (kalit + fields + expand)"""
+        if field_set is not None:
+            expand, fields = field_set.expand, field_set.fields_param
+
+        cache_key = ('issue', issue_key.upper(), fields, expand)
+        issue = self.sync._cache.get(cache_key)
+        if issue is not None:
+            return issue
+
+        params = {key: value for key, value in (('fields', fields), ('expand', expand)) if value}
+        try:
+            response = await self._get(f"{REST_API_PATH}/issue/{issue_key}", 'jira:issue/{key}', params)
+            if response.status_code != 200:
+                print(f"❌ Issue olishda xatolik: {issue_key} - HTTP {response.status_code}")
+                return None
+            issue = issue_from_json(response.json())
+        except Exception as e:
+            print(f"❌ Issue olishda xatolik: {e}")
+            return None
+
+        self.sync._cache.set(cache_key, issue)
+        return issue
+
+    async def extract_pr_urls_dev_status(self, issue_key: str, issue_id: str = None) -> List[Dict]:
+        """JiraClient.extract_pr_urls_dev_status - Dev Status API dan PR URL'lar"""
+        try:
+            if issue_id is None:
+                issue = await self.get_issue(issue_key, field_set=ISSUE_ID)
+                if issue is None:
+                    return []
+                issue_id = issue.id
+
+            response = await self._get(DEV_STATUS_PATH, 'jira:dev-status/issue/detail', dev_status_params(issue_id))
+            if response.status_code != 200:
+                return []
+
+            pr_urls = parse_dev_status_prs(response.json())
+            if pr_urls:
+                print(f"   ✅ Dev Status API: {len(pr_urls)} ta PR topildi!")
+            return pr_urls
+
+        except Exception as e:
+            print(f"   ⚠️ Dev Status API error: {e}")
+            return []
+
+    async def get_task_details(self, issue_key: str) -> Optional[Dict]:
+        """JiraClient.get_task_details - bir xil dict (kesh umumiy, har chaqiruvga nusxa)"""
+        cache_key = ('details', issue_key.upper())
+        details = self.sync._cache.get(cache_key)
+        if details is not None:
+            return copy.deepcopy(details)
+
+        issue = await self.get_issue(issue_key, field_set=TASK_DETAILS)
+        if not issue:
+            return None
+
+        # Dev Status issue ID kutadi - issue'dan keyin (zanjir), legacy fallback build_task_details'da
+        pr_urls = await self.extract_pr_urls_dev_status(issue_key, issue_id=issue.id)
+
+        details = self.sync.build_task_details(issue, pr_urls)
+        self.sync._cache.set(cache_key, details)
+        return copy.deepcopy(details)
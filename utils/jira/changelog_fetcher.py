@@ -0,0 +1,224 @@
+# utils/jira/changelog_fetcher.py
+"""
+Kesilgan changelog'larni to'ldirish
+
+search_issues(expand='changelog') har bir issue uchun ko'pi bilan 100 ta history
+qaytaradi (changelog.total > len(histories)). Uzoq yashagan task'larda
+Return Count va Time in Each Status shu sababli kam chiqardi.
+
+JiraChangelogFetcher:
+    - sahifadagi kesilgan issue'larni aniqlaydi (changelog.total bo'yicha)
+    - bulk endpoint (POST changelog/bulkfetch, Cloud) - bir so'rovda ko'p issue,
+      nextPageToken bilan sahifalab
+    - bulk yo'q bo'lsa (Server/DC - 404) - issue/{key}/changelog sahifalab,
+      issue'lar parallel
+    - to'liq tarix issue.raw ga yoziladi (id bo'yicha dublikatsiz, created bo'yicha
+      tartiblangan), issue obyekti qayta parse qilinadi va keshlangan timeline
+      tashlanadi - ustunlar to'liq tarixdan hisoblanadi
+    - bulk created (epoch ms / boshqa offset) embed qilingan history'lar offset'iga
+      keltiriladi - ustunlar created[:16] ni ko'rsatadi, UTC va lokal aralashmasin
+
+Usage:
+    changelogs = JiraChangelogFetcher(jira)
+    changelogs.complete(page)
+"""
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional
+
+from dotenv import load_dotenv
+
+from utils.jira.issue_timeline import parse_jira_datetime
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Bulk endpoint cheklovlari (Atlassian: 1000 issue / so'rov)
+BULK_MAX_ISSUES = 1000
+BULK_PAGE_SIZE = 1000
+ISSUE_PAGE_SIZE = 100
+
+# Bulk endpoint yo'qligini bildiruvchi status'lar
+BULK_UNSUPPORTED_STATUSES = {404, 405, 501}
+
+
+def is_truncated(issue) -> bool:
+    """Embed qilingan changelog to'liq emasmi"""
+    changelog = (getattr(issue, 'raw', None) or {}).get('changelog') or {}
+    total = changelog.get('total')
+    return total is not None and len(changelog.get('histories') or []) < total
+
+
+def _site_timezone(raw: Dict[str, Any]) -> timezone:
+    """Embed qilingan history'lar (yoki issue created) offset'i - JIRA sayt/foydalanuvchi vaqt zonasi"""
+    histories = (raw.get('changelog') or {}).get('histories') or []
+    candidates = [history.get('created') for history in histories]
+    candidates.append((raw.get('fields') or {}).get('created'))
+    for value in candidates:
+        moment = parse_jira_datetime(value) if isinstance(value, str) else None
+        if moment is not None and moment.utcoffset() is not None:
+            return timezone(moment.utcoffset())
+    return timezone.utc
+
+
+def _history_created(value, tz: timezone = timezone.utc) -> str:
+    """
+    History created → search formati ('2024-01-15T10:30:00.000+0500'), tz offset'ida
+
+    Bulk javobda created epoch ms bo'lishi mumkin. tz offset'idagi satr o'zgarmaydi.
+    """
+    if isinstance(value, (int, float)):
+        moment = datetime.fromtimestamp(value / 1000, tz=tz)
+    else:
+        moment = parse_jira_datetime(value)
+        if moment is None or moment.utcoffset() is None or moment.utcoffset() == tz.utcoffset(None):
+            return value or ''
+        moment = moment.astimezone(tz)
+    return moment.strftime('%Y-%m-%dT%H:%M:%S.') + f"{moment.microsecond // 1000:03d}" + moment.strftime('%z')
+
+
+class JiraChangelogFetcher:
+    """Kesilgan changelog'lar → to'liq tarix (bulk yoki parallel per-issue)"""
+
+    def __init__(self, jira, max_workers: int = None, limiter=None):
+        """
+        Args:
+            jira: jira.JIRA client
+            max_workers: Per-issue fallback uchun parallel so'rovlar (default: JIRA_FETCH_WORKERS yoki 4)
+            limiter: Umumiy RateLimiter (JiraIssueFetcher bilan bir xil)
+        """
+        self.jira = jira
+        self.max_workers = max(1, max_workers or int(os.getenv('JIRA_FETCH_WORKERS', 4)))
+        self.limiter = limiter
+        self.bulk_supported: Optional[bool] = None
+        self._stats_lock = threading.Lock()
+        self.stats = {'truncated': 0, 'completed': 0, 'requests': 0, 'histories_added': 0, 'failed': 0}
+
+    def _acquire(self):
+        if self.limiter is not None:
+            self.limiter.acquire()
+
+    # ------------------------------------------------------------------------
+    # Bulk (Cloud)
+    # ------------------------------------------------------------------------
+    def _bulk_fetch(self, issue_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """issueId → histories (hamma sahifalar)"""
+        url = self.jira._get_url('changelog/bulkfetch')
+        histories: Dict[str, List[Dict[str, Any]]] = {issue_id: [] for issue_id in issue_ids}
+        token = None
+
+        while True:
+            body = {'issueIdsOrKeys': issue_ids, 'maxResults': BULK_PAGE_SIZE}
+            if token:
+                body['nextPageToken'] = token
+
+            self._acquire()
+            response = self.jira._session.post(url, data=json.dumps(body))
+            self.stats['requests'] += 1
+            data = response.json()
+
+            for entry in data.get('issueChangeLogs') or []:
+                histories.setdefault(str(entry.get('issueId')), []).extend(entry.get('changeHistories') or [])
+
+            token = data.get('nextPageToken')
+            if not token:
+                return histories
+
+    # ------------------------------------------------------------------------
+    # Per-issue (Server/DC)
+    # ------------------------------------------------------------------------
+    def _issue_fetch(self, issue_key: str) -> List[Dict[str, Any]]:
+        """issue/{key}/changelog - hamma sahifalar"""
+        histories = []
+        start_at = 0
+        while True:
+            self._acquire()
+            data = self.jira._get_json(
+                f'issue/{issue_key}/changelog', params={'startAt': start_at, 'maxResults': ISSUE_PAGE_SIZE}
+            )
+            with self._stats_lock:
+                self.stats['requests'] += 1
+            values = data.get('values') or []
+            histories.extend(values)
+            start_at += len(values)
+            if data.get('isLast', True) or not values or start_at >= data.get('total', 0):
+                return histories
+
+    # ------------------------------------------------------------------------
+    # Merge
+    # ------------------------------------------------------------------------
+    def _merge(self, issue, histories: List[Dict[str, Any]]):
+        """To'liq tarix → issue.raw, issue qayta parse, timeline keshi tashlanadi"""
+        raw = issue.raw
+        changelog = raw.setdefault('changelog', {})
+        existing = changelog.get('histories') or []
+
+        # Embed qilinganlari ustun (asl format), bulk'dan faqat yetishmaganlari - hammasi bitta offset'da
+        tz = _site_timezone(raw)
+        merged = {}
+        for history in existing + histories:
+            history = dict(history, created=_history_created(history.get('created'), tz))
+            key = history.get('id') or (history['created'], json.dumps(history.get('items'), sort_keys=True))
+            merged.setdefault(key, history)
+
+        oldest = datetime.min.replace(tzinfo=timezone.utc)
+        ordered = sorted(merged.values(), key=lambda h: parse_jira_datetime(h.get('created')) or oldest)
+        self.stats['histories_added'] += max(0, len(ordered) - len(existing))
+
+        changelog.update(histories=ordered, startAt=0, maxResults=len(ordered), total=len(ordered))
+        issue._parse_raw(raw)
+        vars(issue).pop('_timeline', None)
+
+    def complete(self, issues: List[Any]) -> int:
+        """
+        Kesilgan changelog'larni to'ldirish (joyida)
+
+        Xatolik bo'lsa issue kesilgan holida qoladi (ogohlantirish log'da) -
+        report to'xtamaydi.
+
+        Returns:
+            To'ldirilgan issue'lar soni
+        """
+        truncated = [issue for issue in issues if is_truncated(issue)]
+        if not truncated:
+            return 0
+        self.stats['truncated'] += len(truncated)
+
+        completed = 0
+        if self.bulk_supported is not False:
+            try:
+                for start in range(0, len(truncated), BULK_MAX_ISSUES):
+                    chunk = truncated[start:start + BULK_MAX_ISSUES]
+                    histories = self._bulk_fetch([str(issue.id) for issue in chunk])
+                    for issue in chunk:
+                        self._merge(issue, histories.get(str(issue.id), []))
+                        completed += 1
+                self.bulk_supported = True
+                self.stats['completed'] += completed
+                return completed
+            except Exception as e:
+                if getattr(e, 'status_code', None) not in BULK_UNSUPPORTED_STATUSES:
+                    logger.warning(f"⚠️ Changelog bulk xatolik: {e}")
+                    self.stats['failed'] += len(truncated) - completed
+                    self.stats['completed'] += completed
+                    return completed
+                logger.info("ℹ️ Changelog bulk endpoint yo'q - issue bo'yicha parallel olinadi")
+                self.bulk_supported = False
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='jira-changelog') as pool:
+            futures = [(issue, pool.submit(self._issue_fetch, issue.key)) for issue in truncated]
+            for issue, future in futures:
+                try:
+                    self._merge(issue, future.result())
+                    completed += 1
+                except Exception as e:
+                    logger.warning(f"⚠️ {issue.key} changelog olinmadi: {e}")
+                    self.stats['failed'] += 1
+
+        self.stats['completed'] += completed
+        return completed
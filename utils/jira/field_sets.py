@@ -0,0 +1,64 @@
+# utils/jira/field_sets.py
+"""
+JIRA so'rovlari uchun aniq maydonlar (fields=) va expand
+
+Oldin fetch_issues hamma maydonlarni + renderedFields'ni olardi (extractor'lar
+renderedFields'ni umuman o'qimaydi), JiraClient.get_issue esa summary/description/
+comment kerak bo'lgan joyda ham changelog,renderedFields'ni expand qilardi.
+Har bir use case - o'z FieldSet'i: faqat kerakli maydonlar uzatiladi va parse qilinadi.
+
+Yangi ustun/kalit qo'shilsa - shu yerdagi ro'yxatga ham qo'shing
+(so'ralmagan maydon issue.fields'da bo'lmaydi).
+"""
+from dataclasses import dataclass
+from typing import Tuple, Optional
+
+from config.settings import settings
+
+
+@dataclass(frozen=True)
+class FieldSet:
+    """search_issues / issue() uchun fields + expand"""
+    name: str
+    fields: Tuple[str, ...]
+    expand: Optional[str] = None
+
+    @property
+    def fields_param(self) -> str:
+        """'summary,status,...' - JIRA API formatida"""
+        return ','.join(self.fields)
+
+
+# Sprint report ustunlari (download_file.ACTIVE_COLUMNS) - ingest_from_jira va issue store ham
+# changelog - Status History, Time in Each Status, Return'lar, Added to Sprint
+REPORT = FieldSet(
+    name='report',
+    fields=(
+        'summary', 'description', 'issuetype', 'status', 'priority',
+        'assignee', 'reporter', 'created', 'updated', 'resolutiondate',
+        'comment', 'issuelinks',
+        settings.STORY_POINTS_FIELD, settings.SPRINT_FIELD, settings.PR_FIELD,
+    ),
+    expand='changelog',
+)
+
+# JiraClient.get_task_details - TZ-PR tekshiruv va test case generatsiya
+# (ikkalasi ham bir xil task details dict'ini ishlatadi), changelog kerak emas
+TASK_DETAILS = FieldSet(
+    name='task_details',
+    fields=(
+        'summary', 'description', 'issuetype', 'status', 'priority',
+        'assignee', 'reporter', 'created', 'resolutiondate',
+        'comment', 'labels', 'components',
+        settings.STORY_POINTS_FIELD, settings.PR_FIELD,
+    ),
+)
+
+# JiraClient.search_issues natijasi (key, summary, status, type, assignee)
+SEARCH_SUMMARY = FieldSet(
+    name='search_summary',
+    fields=('summary', 'status', 'issuetype', 'assignee'),
+)
+
+# Faqat issue ID kerak (Dev Status API) - id/key har doim qaytadi
+ISSUE_ID = FieldSet(name='issue_id', fields=('summary',))
@@ -0,0 +1,189 @@
+# utils/jira/issue_archive.py
+"""
+Raw issue JSON arxivi - report'larni JIRA'siz qayta yaratish
+
+ACTIVE_COLUMNS'ni o'zgartirish yoki extractor'ni tuzatish uchun oldin har bir
+sprintni JIRA'dan qayta yuklash kerak edi. Endi download skriptlar olgan raw
+JSON'ni arxivga yozadi, --from-archive esa Excel/Parquet'ni tarmoqsiz qayta
+yaratadi (soniyalar, har safar bir xil natija).
+
+Tuzilma (JIRA_ARCHIVE_DIR, default DATA_DIR/jira_archive):
+    objects/ab/abcdef....json.gz      - issue versiyasi (kanonik JSON sha256 bo'yicha)
+    manifests/<nom>/<YYYYmmdd_HHMMSS>.json
+                                      - bitta run: issue key → object hash (tartib
+                                        saqlanadi) + sprint ma'lumotlari
+
+Object'lar kontent bo'yicha manzillanadi: o'zgarmagan issue qayta yozilmaydi,
+o'zgargani yangi object bo'ladi - eski manifest'lar eski versiyalarni ko'rsatib
+qoladi (run'ni aynan qayta yaratish mumkin).
+
+Usage:
+    archive = JiraIssueArchive()
+    run = archive.begin('DEV_sprint_3081', sprint_info_map={3081: info})
+    run.add(issue.raw)
+    run.save()
+
+    manifest = archive.load_manifest('DEV_sprint_3081')
+    for issue in archive.iter_issues(manifest):
+        ...
+"""
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Iterator
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def canonical_json(raw: Dict[str, Any]) -> bytes:
+    """Kalitlar tartiblangan, bo'sh joysiz JSON - bir xil issue → bir xil bayt"""
+    return json.dumps(raw, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _write_atomic(path: str, data: bytes):
+    """tmp fayl + os.replace - parallel sprintlar bir object'ni yozsa ham buzilmaydi"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class ArchiveRun:
+    """Bitta run'ning manifest'i (issue'lar qo'shiladi, oxirida save())"""
+
+    def __init__(self, archive: 'JiraIssueArchive', name: str, meta: Dict[str, Any]):
+        self.archive = archive
+        self.name = name
+        self.meta = meta
+        self.created_at = datetime.now()
+        self.issues: List[Dict[str, Any]] = []
+
+    def add(self, raw: Dict[str, Any]) -> str:
+        """Issue raw JSON → object (kerak bo'lsa yoziladi), manifest'ga qo'shiladi"""
+        digest = self.archive.put(raw)
+        self.issues.append({
+            'key': raw.get('key'),
+            'updated': (raw.get('fields') or {}).get('updated'),
+            'sha': digest,
+        })
+        return digest
+
+    def save(self) -> str:
+        """Manifest faylini yozish → fayl yo'li"""
+        manifest = {
+            'name': self.name,
+            'created_at': self.created_at.isoformat(timespec='seconds'),
+            'meta': self.meta,
+            'issues': self.issues,
+        }
+        path = os.path.join(self.archive.manifest_dir(self.name),
+                            f"{self.created_at.strftime('%Y%m%d_%H%M%S')}.json")
+        _write_atomic(path, json.dumps(manifest, ensure_ascii=False, indent=1).encode('utf-8'))
+        return path
+
+
+class JiraIssueArchive:
+    """Kontent bo'yicha manzillangan raw issue arxivi (gzip JSON)"""
+
+    def __init__(self, root: str = None):
+        """
+        Args:
+            root: Arxiv papkasi (default: JIRA_ARCHIVE_DIR yoki DATA_DIR/jira_archive)
+        """
+        self.root = root or os.getenv(
+            'JIRA_ARCHIVE_DIR', os.path.join(os.getenv('DATA_DIR', './data'), 'jira_archive')
+        )
+        self._stats_lock = threading.Lock()
+        self.stats = {'written': 0, 'reused': 0, 'bytes': 0}
+
+    # ------------------------------------------------------------------------
+    # Objects
+    # ------------------------------------------------------------------------
+    def object_path(self, digest: str) -> str:
+        return os.path.join(self.root, 'objects', digest[:2], f"{digest}.json.gz")
+
+    def put(self, raw: Dict[str, Any]) -> str:
+        """Raw JSON → sha256 (object allaqachon bo'lsa yozilmaydi)"""
+        data = canonical_json(raw)
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.object_path(digest)
+
+        if os.path.exists(path):
+            with self._stats_lock:
+                self.stats['reused'] += 1
+            return digest
+
+        # mtime=0 - bir xil kontent → bir xil .gz bayt
+        compressed = gzip.compress(data, compresslevel=6, mtime=0)
+        _write_atomic(path, compressed)
+        with self._stats_lock:
+            self.stats['written'] += 1
+            self.stats['bytes'] += len(compressed)
+        return digest
+
+    def get(self, digest: str) -> Dict[str, Any]:
+        """sha256 → raw JSON"""
+        with open(self.object_path(digest), 'rb') as f:
+            return json.loads(gzip.decompress(f.read()))
+
+    # ------------------------------------------------------------------------
+    # Manifests
+    # ------------------------------------------------------------------------
+    def manifest_dir(self, name: str) -> str:
+        return os.path.join(self.root, 'manifests', name)
+
+    def begin(self, name: str, **meta) -> ArchiveRun:
+        """Yangi run manifest'i (meta - JSON'ga yoziladigan qo'shimcha ma'lumot)"""
+        return ArchiveRun(self, name, meta)
+
+    def versions(self, name: str) -> List[str]:
+        """Manifest versiyalari (eskisidan yangisiga): ['20250101_120000', ...]"""
+        directory = self.manifest_dir(name)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(f[:-len('.json')] for f in os.listdir(directory) if f.endswith('.json'))
+
+    def load_manifest(self, name: str, version: str = None) -> Optional[Dict[str, Any]]:
+        """
+        Manifest (default - eng oxirgisi)
+
+        Args:
+            version: To'liq versiya yoki prefiks ('20250101') - mos kelganlarning oxirgisi
+
+        Returns:
+            Manifest dict yoki None (arxivda yo'q)
+        """
+        versions = self.versions(name)
+        if version:
+            versions = [v for v in versions if v.startswith(version)]
+        if not versions:
+            return None
+
+        with open(os.path.join(self.manifest_dir(name), f"{versions[-1]}.json"), encoding='utf-8') as f:
+            manifest = json.load(f)
+        manifest['version'] = versions[-1]
+        return manifest
+
+    def iter_raw(self, manifest: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Manifest'dagi issue'lar raw JSON (yuklangan tartibda)"""
+        for entry in manifest['issues']:
+            yield self.get(entry['sha'])
+
+    def iter_issues(self, manifest: Dict[str, Any]) -> Iterator[Any]:
+        """Offline jira Issue obyektlari (extractor'lar o'zgarishsiz ishlaydi)"""
+        from jira.resources import Issue
+
+        for raw in self.iter_raw(manifest):
+            yield Issue({'server': ''}, None, raw=raw)
@@ -0,0 +1,344 @@
+# utils/jira/issue_fetcher.py
+"""
+JQL natijasini parallel sahifalab olish
+
+Oldin download skriptlar avval count so'rovi, keyin
+search_issues(maxResults=False, expand='changelog,renderedFields') chaqirardi:
+sahifalar ketma-ket olinadi va hamma Issue obyektlari xotirada turadi.
+
+JiraIssueFetcher:
+    - birinchi sahifa oddiy so'rov - total va server qo'llagan sahifa hajmi
+      (Cloud changelog bilan maxResults'ni kamaytirishi mumkin) shundan olinadi,
+      alohida count so'rovi yo'q
+    - qolgan offset'lar oldindan hisoblanadi va cheklangan worker pool'da
+      parallel olinadi (bir vaqtda eng ko'pi max_workers * 2 sahifa xotirada)
+    - sahifalar JQL tartibida, kelishi bilan yield qilinadi (streaming)
+    - rate limit: so'rovlar orasida minimal interval (JIRA_MAX_RPS), 429/5xx
+      bo'lsa Retry-After (yoki exponential backoff) bo'yicha kutib qayta urinish -
+      pauza hamma worker'larga taalluqli
+    - sahifa siljishi (fetch paytida issue o'zgardi) - key bo'yicha dublikatlar tashlanadi
+    - JIRA Cloud: startAt'li search o'chirilgan (jira kutubxonasi startAt > 0 da
+      JIRAError beradi, startAt=0 esa search/jql'ga o'tadi - total = sahifa hajmi,
+      qolgani nextPageToken'da). Cloud'da avval nextPageToken bilan faqat ID'lar
+      olinadi (fields=id, arzon), keyin to'liq issue'lar 'id in (...)' batch'lari
+      bilan parallel - tartib ID ro'yxati bo'yicha
+    - expand=changelog bo'lsa, 100 tadan ko'p history'li issue'larning changelog'i
+      sahifa berilishidan oldin to'ldiriladi (JiraChangelogFetcher - bulk)
+
+Usage:
+    fetcher = JiraIssueFetcher(jira)
+    for issue in fetcher.iter_issues(jql):
+        ...
+"""
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Iterator, Iterable, Any, Dict, Tuple
+
+from dotenv import load_dotenv
+
+from utils.jira.changelog_fetcher import JiraChangelogFetcher
+
+load_dotenv()
+
+# Default: faqat changelog (renderedFields'ni hech kim o'qimaydi) - aniq maydonlar
+# uchun utils/jira/field_sets.py dagi FieldSet'ni fields=/expand= bilan bering
+DEFAULT_EXPAND = 'changelog'
+
+# Qayta urinish mumkin bo'lgan HTTP status'lar
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Cloud: search/jql fields=id sahifasi (API maksimumi 5000)
+ID_PAGE_SIZE = 5000
+
+
+class RateLimiter:
+    """
+    So'rovlar orasida minimal interval + umumiy pauza (429 dan keyin)
+
+    Bir nechta fetcher bir vaqtda ishlasa (masalan, sprintlar parallel) -
+    bitta RateLimiter berilsa JIRA_MAX_RPS hammasiga umumiy bo'ladi.
+    """
+
+    def __init__(self, requests_per_second: float = None):
+        """
+        Args:
+            requests_per_second: So'rovlar limiti (default: JIRA_MAX_RPS yoki 10, 0 - cheklovsiz)
+        """
+        if requests_per_second is None:
+            requests_per_second = float(os.getenv('JIRA_MAX_RPS', 10))
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Hamma worker'lar kamida shuncha kutadi"""
+        with self._lock:
+            self._next_at = max(self._next_at, time.monotonic() + seconds)
+
+
+class JiraIssueFetcher:
+    """JQL → Issue'lar, sahifalar parallel"""
+
+    def __init__(
+            self,
+            jira,
+            page_size: int = None,
+            max_workers: int = None,
+            requests_per_second: float = None,
+            max_retries: int = 5,
+            limiter: RateLimiter = None,
+            token_paging: bool = None
+    ):
+        """
+        Args:
+            jira: jira.JIRA client
+            page_size: Sahifa hajmi (default: JIRA_PAGE_SIZE yoki 100)
+            max_workers: Parallel so'rovlar (default: JIRA_FETCH_WORKERS yoki 4)
+            requests_per_second: So'rovlar limiti (default: JIRA_MAX_RPS yoki 10, 0 - cheklovsiz)
+            max_retries: 429/5xx uchun qayta urinishlar
+            limiter: Umumiy RateLimiter (default: shu fetcher uchun yangi)
+            token_paging: nextPageToken bilan sahifalash (default: jira._is_cloud)
+        """
+        self.jira = jira
+        self.page_size = max(1, page_size or int(os.getenv('JIRA_PAGE_SIZE', 100)))
+        self.max_workers = max(1, max_workers or int(os.getenv('JIRA_FETCH_WORKERS', 4)))
+        self.max_retries = max_retries
+        self._limiter = limiter or RateLimiter(requests_per_second)
+        self._token_paging = token_paging
+        self.changelogs = JiraChangelogFetcher(jira, max_workers=self.max_workers, limiter=self._limiter)
+        self._stats_lock = threading.Lock()
+        self.stats: Dict[str, Any] = self._new_stats()
+
+    @staticmethod
+    def _new_stats() -> Dict[str, Any]:
+        return {'requests': 0, 'retries': 0, 'pages': 0, 'issues': 0, 'total': None, 'seconds': None,
+                'changelogs_completed': 0}
+
+    # ------------------------------------------------------------------------
+    # Single request
+    # ------------------------------------------------------------------------
+    @staticmethod
+    def _retry_after(error) -> Optional[float]:
+        response = getattr(error, 'response', None)
+        headers = getattr(response, 'headers', None) or {}
+        try:
+            return float(headers.get('Retry-After'))
+        except (TypeError, ValueError):
+            return None
+
+    def _call(self, method, *args, **kwargs):
+        """Bitta so'rov (rate limit + retry)"""
+        attempt = 0
+        while True:
+            self._limiter.acquire()
+            try:
+                result = method(*args, **kwargs)
+                with self._stats_lock:
+                    self.stats['requests'] += 1
+                return result
+            except Exception as e:
+                status = getattr(e, 'status_code', None)
+                if status not in RETRY_STATUSES or attempt >= self.max_retries:
+                    raise
+                delay = self._retry_after(e) or min(2 ** attempt, 30)
+                attempt += 1
+                with self._stats_lock:
+                    self.stats['retries'] += 1
+                self._limiter.pause(delay)
+
+    def _search(self, jql: str, start_at: int, max_results: int,
+                expand: Optional[str], fields: Optional[str]):
+        """Bitta sahifa - startAt bo'yicha (Server / Data Center)"""
+        return self._call(
+            self.jira.search_issues, jql, startAt=start_at, maxResults=max_results, expand=expand, fields=fields
+        )
+
+    def _token_pages(self, jql: str, max_results: int, expand: Optional[str],
+                     fields: Optional[str]) -> Iterator[List[Any]]:
+        """search/jql - nextPageToken bo'yicha hamma sahifalar (Cloud, ketma-ket)"""
+        token = None
+        while True:
+            page = self._call(
+                self.jira.enhanced_search_issues, jql, nextPageToken=token, maxResults=max_results,
+                expand=expand, fields=fields
+            )
+            yield page
+            token = getattr(page, 'nextPageToken', None)
+            if not token or not page:
+                return
+
+    @property
+    def token_paging(self) -> bool:
+        """Cloud - nextPageToken (startAt'li search ishlamaydi)"""
+        if self._token_paging is None:
+            self._token_paging = bool(getattr(self.jira, '_is_cloud', False))
+        return self._token_paging
+
+    # ------------------------------------------------------------------------
+    # Pages / issues
+    # ------------------------------------------------------------------------
+    def count(self, jql: str) -> int:
+        """JQL natijasidagi issue soni (0 - aniqlab bo'lmadi; Cloud'da taxminiy)"""
+        try:
+            if self.token_paging:
+                return int(self._call(self.jira.approximate_issue_count, jql) or 0)
+            data = self._call(self.jira.search_issues, jql, maxResults=1, fields='id', json_result=True)
+            return int(data.get('total') or 0)
+        except Exception:
+            return 0
+
+    def collect_ids(self, jql: str) -> List[str]:
+        """Cloud: JQL natijasidagi issue ID'lar, JQL tartibida (fields=id - arzon sahifalar)"""
+        ids = []
+        for page in self._token_pages(jql, ID_PAGE_SIZE, None, 'id'):
+            ids.extend(issue.id for issue in page)
+        return list(dict.fromkeys(ids))
+
+    def _fetch_ids(self, ids: List[str], expand: Optional[str], fields: Optional[str]) -> List[Any]:
+        """'id in (...)' batch → issue'lar ids tartibida (server sahifani kessa - token bilan davomi)"""
+        jql = f"id in ({', '.join(ids)})"
+        issues = [issue for page in self._token_pages(jql, len(ids), expand, fields) for issue in page]
+        order = {issue_id: index for index, issue_id in enumerate(ids)}
+        issues.sort(key=lambda issue: order.get(issue.id, len(order)))
+        return issues
+
+    def _ready(self, page, expand: Optional[str]) -> List[Any]:
+        """Sahifa → ro'yxat, kesilgan changelog'lar to'ldirilgan"""
+        page = list(page)
+        if expand and 'changelog' in expand.split(','):
+            self.stats['changelogs_completed'] += self.changelogs.complete(page)
+        return page
+
+    def _ordered(self, items: Iterable[Any], fetch, head: Any = None) -> Iterator[Tuple[Any, Any]]:
+        """
+        fetch(item) worker pool'da, natijalar items tartibida (eng ko'pi max_workers * 2 kutilmoqda)
+
+        Args:
+            head: Allaqachon olingan natija - so'rovlar yuborilgach birinchi bo'lib (None, head) beriladi
+        """
+        items = iter(items)
+        pending = deque()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='jira-page') as pool:
+            def submit_next():
+                item = next(items, None)
+                if item is not None:
+                    pending.append((item, pool.submit(fetch, item)))
+
+            for _ in range(self.max_workers * 2):
+                submit_next()
+
+            try:
+                if head is not None:
+                    yield None, head
+                while pending:
+                    item, future = pending.popleft()
+                    result = future.result()
+                    submit_next()
+                    yield item, result
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+    def iter_pages(self, jql: str, expand: Optional[str] = DEFAULT_EXPAND,
+                   fields: Optional[str] = None) -> Iterator[List[Any]]:
+        """
+        Sahifalar JQL tartibida (parallel olinadi, tartib saqlanadi)
+
+        Args:
+            jql: JQL
+            expand: search_issues expand (default: changelog)
+            fields: Faqat shu maydonlar (None - hammasi)
+
+        stats['total'] - server bo'yicha jami (Cloud'da - olingan ID'lar soni)
+        """
+        self.stats = self._new_stats()
+        started = time.perf_counter()
+
+        pages = self._id_batches(jql, expand, fields) if self.token_paging else self._offset_pages(jql, expand, fields)
+        yield from pages
+
+        self.stats['seconds'] = round(time.perf_counter() - started, 3)
+
+    def _id_batches(self, jql: str, expand: Optional[str], fields: Optional[str]) -> Iterator[List[Any]]:
+        """Cloud: ID'lar (token sahifalar) → page_size'lik 'id in (...)' batch'lar parallel"""
+        ids = self.collect_ids(jql)
+        self.stats['total'] = len(ids)
+
+        batches = (ids[i:i + self.page_size] for i in range(0, len(ids), self.page_size))
+        for _, page in self._ordered(batches, lambda batch: self._fetch_ids(batch, expand, fields)):
+            self.stats['pages'] += 1
+            yield self._ready(page, expand)
+
+    def _offset_pages(self, jql: str, expand: Optional[str], fields: Optional[str]) -> Iterator[List[Any]]:
+        """Server / Data Center: birinchi sahifadan total, qolgan offset'lar parallel"""
+        first = self._search(jql, 0, self.page_size, expand, fields)
+        total = getattr(first, 'total', None)
+        self.stats['total'] = total
+        self.stats['pages'] += 1
+
+        # Server qo'llagan sahifa hajmi (page_size'dan kichik bo'lishi mumkin)
+        step = min(self.page_size, getattr(first, 'maxResults', None) or self.page_size)
+        if len(first) < step and (total is None or len(first) < total):
+            step = max(len(first), 1)
+
+        if total is None:
+            # total yo'q - ketma-ket, qisqa sahifagacha
+            yield self._ready(first, expand)
+            start, page = len(first), first
+            while len(page) >= step:
+                page = self._search(jql, start, step, expand, fields)
+                if not page:
+                    break
+                self.stats['pages'] += 1
+                start += len(page)
+                yield self._ready(page, expand)
+            return
+
+        # Birinchi sahifa iste'molchiga berilguncha keyingilari yuklanadi
+        offsets = range(len(first), total, step)
+        pages = self._ordered(offsets, lambda offset: list(self._search(jql, offset, step, expand, fields)),
+                              head=first)
+        for offset, page in pages:
+            if offset is None:
+                yield self._ready(page, expand)
+                continue
+
+            # Qisqa sahifa (server kamroq qaytardi) - qolganini shu yerda olish
+            expected = min(step, total - offset)
+            while page and len(page) < expected:
+                extra = self._search(jql, offset + len(page), expected - len(page), expand, fields)
+                if not extra:
+                    break
+                page.extend(extra)
+
+            self.stats['pages'] += 1
+            yield self._ready(page, expand)
+
+    def iter_issues(self, jql: str, expand: Optional[str] = DEFAULT_EXPAND,
+                    fields: Optional[str] = None) -> Iterator[Any]:
+        """Issue'lar JQL tartibida, sahifalar kelishi bilan (dublikatsiz)"""
+        seen = set()
+        for page in self.iter_pages(jql, expand=expand, fields=fields):
+            for issue in page:
+                if issue.key in seen:
+                    continue
+                seen.add(issue.key)
+                self.stats['issues'] += 1
+                yield issue
+
+    def fetch_all(self, jql: str, expand: Optional[str] = DEFAULT_EXPAND,
+                  fields: Optional[str] = None) -> List[Any]:
+        """Hammasi ro'yxat sifatida (kichik natijalar uchun)"""
+        return list(self.iter_issues(jql, expand=expand, fields=fields))
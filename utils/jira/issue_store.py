@@ -0,0 +1,383 @@
+# utils/jira/issue_store.py
+"""
+Lokal JIRA issue store - SQLite + watermark (incremental sync)
+
+Oldin har bir download butun sprintni to'liq changelog bilan qayta yuklardi,
+hatto bir nechta issue o'zgargan bo'lsa ham. Endi:
+
+    1. Hali yuklanmagan sprintlar - bir marta to'liq (sprint IN (...))
+    2. Keyingi sync'lar - faqat o'zgarganlar: project = X AND updated >= -Nm
+       (N - oxirgi sync'dan beri o'tgan daqiqalar + zaxira)
+    3. Excel / Parquet / VectorDB - store'dan (JIRA'ga so'rov yo'q)
+
+Nima saqlanadi:
+    issues         - issue raw JSON (field_sets.REPORT maydonlari + changelog), zlib
+    issue_sprints  - issue → sprint ID'lar (sprint bo'yicha o'qish uchun)
+    sprints        - to'liq yuklangan sprintlar
+    watermarks     - loyiha bo'yicha oxirgi muvaffaqiyatli sync vaqti (UTC)
+
+Watermark - nisbiy JQL (-Nm): JQL sana literal'lari JIRA user timezone'ida
+talqin qilinadi, nisbiy vaqt esa timezone'ga bog'liq emas.
+
+O'chirilgan issue'lar incremental sync'da aniqlanmaydi (JIRA'dan "o'chirildi"
+event'i kelmaydi) - full sync sprintdan JIRA'da endi yo'q issue'larni ajratadi.
+"""
+import json
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Iterable, Iterator
+
+from dotenv import load_dotenv
+
+from utils.jira.field_sets import FieldSet, REPORT
+from utils.jira.issue_fetcher import JiraIssueFetcher
+
+load_dotenv()
+
+# Incremental oyna zaxirasi (daqiqa) - soat farqi va JIRA indekslash kechikishi uchun
+WATERMARK_MARGIN_MINUTES = 5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    key         TEXT PRIMARY KEY,
+    project     TEXT NOT NULL,
+    updated     TEXT,
+    raw         BLOB NOT NULL,
+    fetched_at  TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_issues_project ON issues (project);
+
+CREATE TABLE IF NOT EXISTS issue_sprints (
+    key        TEXT NOT NULL,
+    sprint_id  INTEGER NOT NULL,
+    PRIMARY KEY (key, sprint_id)
+);
+CREATE INDEX IF NOT EXISTS idx_issue_sprints_sprint ON issue_sprints (sprint_id);
+
+CREATE TABLE IF NOT EXISTS sprints (
+    sprint_id  INTEGER PRIMARY KEY,
+    project    TEXT NOT NULL,
+    synced_at  TEXT
+);
+
+CREATE TABLE IF NOT EXISTS watermarks (
+    project    TEXT PRIMARY KEY,
+    synced_at  REAL NOT NULL,
+    issues     INTEGER DEFAULT 0,
+    updated_at TEXT
+);
+"""
+
+_SPRINT_ID_RE = re.compile(r'\bid=(\d+)')
+
+
+def sprint_ids_from_raw(raw: Dict[str, Any], sprint_field: str) -> List[int]:
+    """
+    Issue raw JSON → sprint ID'lar
+
+    Cloud: [{'id': 3081, 'name': ...}], eski Server: ['com.atlassian...[id=3081,...]']
+    """
+    ids = []
+    for sprint in (raw.get('fields') or {}).get(sprint_field) or []:
+        if isinstance(sprint, dict) and sprint.get('id') is not None:
+            ids.append(int(sprint['id']))
+        elif isinstance(sprint, str):
+            match = _SPRINT_ID_RE.search(sprint)
+            if match:
+                ids.append(int(match.group(1)))
+    return ids
+
+
+class JiraIssueStore:
+    """
+    Issue store (SQLite)
+
+    Usage:
+        store = JiraIssueStore()
+        store.sync(jira, 'DEV', sprint_ids=[3081, 3014])
+        for issue in store.iter_issues(sprint_id=3081):
+            ...
+    """
+
+    def __init__(self, db_path: str = None, sprint_field: str = None):
+        """
+        Args:
+            db_path: SQLite fayl (default: JIRA_ISSUE_STORE_PATH yoki DATA_DIR/jira_issue_store.db)
+            sprint_field: Sprint custom field (default: SPRINT_FIELD yoki customfield_10020)
+        """
+        if db_path is None:
+            db_path = os.getenv(
+                'JIRA_ISSUE_STORE_PATH',
+                os.path.join(os.getenv('DATA_DIR', './data'), 'jira_issue_store.db')
+            )
+        self.db_path = db_path
+        self.sprint_field = sprint_field or os.getenv('SPRINT_FIELD', 'customfield_10020')
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=30000")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now().isoformat(timespec='seconds')
+
+    # ------------------------------------------------------------------------
+    # Issues
+    # ------------------------------------------------------------------------
+    def upsert_issues(self, issues: Iterable[Any], project: str) -> int:
+        """
+        Issue'larni saqlash (bor bo'lsa almashtiriladi, sprint bog'lanishlari yangilanadi)
+
+        Args:
+            issues: jira Issue obyektlari yoki raw dict'lar
+            project: Loyiha kaliti
+
+        Returns:
+            Saqlangan issue'lar soni
+        """
+        count = 0
+        now = self._now()
+        with self._transaction() as conn:
+            for issue in issues:
+                raw = issue if isinstance(issue, dict) else issue.raw
+                key = raw['key']
+                blob = zlib.compress(json.dumps(raw, ensure_ascii=False).encode('utf-8'))
+                conn.execute(
+                    "INSERT OR REPLACE INTO issues (key, project, updated, raw, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, project, (raw.get('fields') or {}).get('updated'), blob, now)
+                )
+                conn.execute("DELETE FROM issue_sprints WHERE key = ?", (key,))
+                conn.executemany(
+                    "INSERT OR IGNORE INTO issue_sprints (key, sprint_id) VALUES (?, ?)",
+                    [(key, sprint_id) for sprint_id in sprint_ids_from_raw(raw, self.sprint_field)]
+                )
+                count += 1
+        return count
+
+    @staticmethod
+    def _sprint_filter(sprint_id) -> List[int]:
+        return list(sprint_id) if isinstance(sprint_id, (list, tuple, set)) else [sprint_id]
+
+    def iter_raw(self, sprint_id=None, project: str = None) -> Iterator[Dict[str, Any]]:
+        """
+        Raw issue JSON'lar (created DESC - download skriptlar tartibi)
+
+        Args:
+            sprint_id: Faqat shu sprint (yoki sprintlar ro'yxati)
+            project: Faqat shu loyiha
+        """
+        query = "SELECT i.raw FROM issues i"
+        params = []
+        where = []
+        if sprint_id is not None:
+            sprint_ids = self._sprint_filter(sprint_id)
+            query += " WHERE i.key IN (SELECT key FROM issue_sprints WHERE sprint_id IN (%s))" \
+                     % ", ".join("?" * len(sprint_ids))
+            params.extend(sprint_ids)
+        if project is not None:
+            where.append("i.project = ?")
+            params.append(project)
+        if where:
+            query += (" AND " if sprint_id is not None else " WHERE ") + " AND ".join(where)
+
+        with self._lock:
+            blobs = [row['raw'] for row in self._conn.execute(query, params)]
+
+        raws = [json.loads(zlib.decompress(blob)) for blob in blobs]
+        raws.sort(key=lambda r: (r.get('fields') or {}).get('created') or '', reverse=True)
+        return iter(raws)
+
+    def iter_issues(self, sprint_id=None, project: str = None, jira=None) -> Iterator[Any]:
+        """
+        jira Issue obyektlari (extractor'lar o'zgarishsiz ishlaydi)
+
+        Args:
+            jira: JIRA client (None - offline, issue.update() va h.k. ishlamaydi)
+        """
+        from jira.resources import Issue
+
+        options = jira._options if jira is not None else {'server': ''}
+        session = jira._session if jira is not None else None
+        for raw in self.iter_raw(sprint_id=sprint_id, project=project):
+            yield Issue(options, session, raw=raw)
+
+    def count(self, sprint_id=None) -> int:
+        """Issue'lar soni (sprint_id - bitta sprint yoki ro'yxat)"""
+        with self._lock:
+            if sprint_id is None:
+                return self._conn.execute("SELECT COUNT(*) FROM issues").fetchone()[0]
+            sprint_ids = self._sprint_filter(sprint_id)
+            return self._conn.execute(
+                "SELECT COUNT(DISTINCT key) FROM issue_sprints WHERE sprint_id IN (%s)"
+                % ", ".join("?" * len(sprint_ids)), sprint_ids
+            ).fetchone()[0]
+
+    # ------------------------------------------------------------------------
+    # Sprints / watermarks
+    # ------------------------------------------------------------------------
+    def synced_sprints(self, project: str) -> List[int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT sprint_id FROM sprints WHERE project = ?", (project,)
+            ).fetchall()
+        return [row['sprint_id'] for row in rows]
+
+    def mark_sprints_synced(self, project: str, sprint_ids: Iterable[int]):
+        now = self._now()
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO sprints (sprint_id, project, synced_at) VALUES (?, ?, ?)",
+                [(sprint_id, project, now) for sprint_id in sprint_ids]
+            )
+
+    def get_watermark(self, project: str) -> Optional[float]:
+        """Oxirgi muvaffaqiyatli sync boshlangan vaqt (UTC epoch) yoki None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT synced_at FROM watermarks WHERE project = ?", (project,)
+            ).fetchone()
+        return row['synced_at'] if row else None
+
+    def set_watermark(self, project: str, synced_at: float, issues: int = 0):
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO watermarks (project, synced_at, issues, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (project, synced_at, issues, self._now())
+            )
+
+    # ------------------------------------------------------------------------
+    # Sync
+    # ------------------------------------------------------------------------
+    def prune_sprints(self, sprint_ids: List[int], keep_keys: Iterable[str]) -> int:
+        """
+        To'liq yuklangan sprintlardan JIRA'da endi yo'q issue'larni ajratish
+        (o'chirilgan yoki boshqa loyihaga ko'chirilgan)
+
+        Returns:
+            Olib tashlangan bog'lanishlar soni
+        """
+        keep = set(keep_keys)
+        placeholders = ", ".join("?" * len(sprint_ids))
+        with self._transaction() as conn:
+            rows = conn.execute(
+                f"SELECT key, sprint_id FROM issue_sprints WHERE sprint_id IN ({placeholders})",
+                list(sprint_ids)
+            ).fetchall()
+            stale = [(row['key'], row['sprint_id']) for row in rows if row['key'] not in keep]
+            conn.executemany("DELETE FROM issue_sprints WHERE key = ? AND sprint_id = ?", stale)
+        return len(stale)
+
+    def _fetch_into(self, fetcher: JiraIssueFetcher, jql: str, project: str,
+                    field_set: FieldSet, page_callback=None) -> List[str]:
+        """
+        JQL → store, sahifa-sahifa (har bir sahifa - bitta tranzaksiya)
+
+        Raises:
+            RuntimeError: Olingan issue'lar server aytgan sonidan kam - sprint "yuklangan"
+                deb belgilanmaydi, watermark surilmaydi (keyingi sync qayta oladi)
+        """
+        keys = []
+        for page in fetcher.iter_pages(jql, expand=field_set.expand, fields=field_set.fields_param):
+            self.upsert_issues(page, project)
+            keys.extend(issue.key for issue in page)
+            if page_callback is not None:
+                page_callback(len(page), fetcher.stats.get('total'))
+
+        expected = fetcher.stats.get('total')
+        if expected is None:
+            expected = fetcher.count(jql)
+        fetched = len(set(keys))
+        if fetched < expected:
+            raise RuntimeError(f"JIRA sync to'liq emas: {fetched} / {expected} ta issue olindi ({jql})")
+        return keys
+
+    def sync(
+            self,
+            jira,
+            project: str,
+            sprint_ids: List[int] = None,
+            fetcher: JiraIssueFetcher = None,
+            full: bool = False,
+            field_set: FieldSet = REPORT,
+            page_callback=None
+    ) -> Dict[str, Any]:
+        """
+        Store'ni JIRA bilan sinxronlash
+
+        Args:
+            jira: JIRA client
+            project: Loyiha kaliti
+            sprint_ids: Kerakli sprintlar - store'da yo'qlari to'liq yuklanadi
+            fetcher: JiraIssueFetcher (default: yangi)
+            full: Watermark'ga qaramay sprintlarni to'liq qayta yuklash
+            field_set: Saqlanadigan maydonlar (default: report ustunlari + changelog)
+            page_callback: (sahifa hajmi, jami) - progress uchun
+
+        Returns:
+            {'full_sprints': [...], 'full_issues': n, 'changed_issues': n, 'pruned': n,
+             'window_minutes': n | None, 'seconds': s}
+        """
+        fetcher = fetcher or JiraIssueFetcher(jira)
+        started = time.time()
+        watermark = None if full else self.get_watermark(project)
+        result = {'full_sprints': [], 'full_issues': 0, 'changed_issues': 0, 'pruned': 0,
+                  'window_minutes': None}
+
+        # _fetch_into to'liq bo'lmasa xato beradi - sprintlar belgilanmaydi, watermark surilmaydi
+        # 1. Yangi sprintlar - to'liq
+        known = set() if full else set(self.synced_sprints(project))
+        missing = [sprint_id for sprint_id in (sprint_ids or []) if sprint_id not in known]
+        if missing:
+            jql = (f'project = "{project}" AND sprint IN ({", ".join(map(str, missing))}) '
+                   f'ORDER BY created DESC')
+            keys = self._fetch_into(fetcher, jql, project, field_set, page_callback)
+            result['full_issues'] = len(keys)
+            result['pruned'] = self.prune_sprints(missing, keys)
+            self.mark_sprints_synced(project, missing)
+            result['full_sprints'] = missing
+
+        # 2. Oxirgi sync'dan beri o'zgarganlar (sprintdan chiqarilganlari ham)
+        if watermark is not None:
+            minutes = math.ceil((started - watermark) / 60) + WATERMARK_MARGIN_MINUTES
+            jql = f'project = "{project}" AND updated >= -{minutes}m ORDER BY updated DESC'
+            result['changed_issues'] = len(self._fetch_into(fetcher, jql, project, field_set, page_callback))
+            result['window_minutes'] = minutes
+
+        # 3. Watermark - faqat hammasi muvaffaqiyatli bo'lsa, sync boshlangan vaqt
+        if watermark is not None or missing or full:
+            self.set_watermark(project, started, result['full_issues'] + result['changed_issues'])
+
+        result['seconds'] = round(time.time() - started, 3)
+        return result
@@ -0,0 +1,169 @@
+# utils/jira/issue_timeline.py
+"""
+Issue changelog → bitta parse qilingan timeline
+
+Oldin report ustunlari (Status History, Time in Each Status, Testing Time,
+Return Count, Return Reasons, Testing Return Who/When, Added to Sprint) har biri
+issue.changelog.histories ni qaytadan aylanib chiqardi va sanalarni qayta
+parse qilardi - uzoq yashagan task'larda bitta issue uchun ~8 marta.
+
+Endi changelog bir marta o'qiladi: status o'tishlari (datetime + author),
+sprint'ga qo'shilgan sana, status segmentlari. Timeline issue obyektiga
+keshlanadi - hamma ustunlar shundan olinadi.
+
+Usage:
+    timeline = get_timeline(issue)
+    timeline.returns(testing_statuses, return_status)
+    timeline.time_in_status()
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Dict, Optional, Iterable, Tuple, Any
+
+
+def parse_jira_datetime(value: Optional[str]) -> Optional[datetime]:
+    """JIRA sana ('2024-01-15T10:30:00.000+0500' / '...Z') → datetime yoki None"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class StatusChange:
+    """Bitta status o'tishi"""
+    created: str                    # JIRA'dagi asl qiymat (ustunlar formatlash uchun)
+    at: Optional[datetime]
+    from_status: str
+    to_status: str
+    author: str
+
+    @property
+    def minute(self) -> str:
+        """'2024-01-15 10:30'"""
+        return self.created[:16].replace('T', ' ')
+
+
+@dataclass
+class IssueTimeline:
+    """Issue changelog'idan bir marta hisoblangan ma'lumotlar"""
+    created: Optional[datetime]
+    resolved: Optional[datetime]
+    status_changes: List[StatusChange] = field(default_factory=list)
+    sprint_added: str = ''          # Birinchi Sprint o'zgarishi (YYYY-MM-DD), bo'lmasa ''
+    has_changelog: bool = False
+    _segments: Optional[List[Tuple[str, float]]] = field(default=None, repr=False)
+
+    # ------------------------------------------------------------------------
+    # Segments
+    # ------------------------------------------------------------------------
+    def segments(self) -> Optional[List[Tuple[str, float]]]:
+        """
+        (status, soat) - har bir o'tishdan keyingisigacha (oxirgisi - resolution
+        yoki hozirgacha). Sana parse bo'lmasa None.
+        """
+        if self._segments is not None or not self.status_changes:
+            return self._segments
+
+        if any(change.at is None for change in self.status_changes):
+            return None
+
+        segments = []
+        now = None
+        for i, change in enumerate(self.status_changes):
+            if i + 1 < len(self.status_changes):
+                end = self.status_changes[i + 1].at
+            elif self.resolved is not None:
+                end = self.resolved
+            else:
+                now = now or datetime.now(change.at.tzinfo)
+                end = now
+            segments.append((change.to_status, (end - change.at).total_seconds() / 3600))
+
+        self._segments = segments
+        return segments
+
+    # ------------------------------------------------------------------------
+    # Derived values
+    # ------------------------------------------------------------------------
+    def time_in_status(self) -> Dict[str, float]:
+        """
+        Status → soat (yaratilgandan birinchi o'tishgacha - boshlang'ich status)
+
+        Returns:
+            {} - o'tishlar yo'q yoki sana parse bo'lmadi
+        """
+        segments = self.segments()
+        if not segments or self.created is None:
+            return {}
+
+        first = self.status_changes[0]
+        durations = {first.from_status: (first.at - self.created).total_seconds() / 3600}
+        for status, hours in segments:
+            durations[status] = durations.get(status, 0) + hours
+        return durations
+
+    def testing_hours(self, testing_statuses: Iterable[str]) -> float:
+        """Testing status'larida o'tgan jami soat"""
+        testing_statuses = set(testing_statuses)
+        return sum(hours for status, hours in self.segments() or [] if status in testing_statuses)
+
+    def returns(self, testing_statuses: Iterable[str], return_status: str) -> List[StatusChange]:
+        """Testing'dan qaytarilgan o'tishlar (testing → return status)"""
+        testing_statuses = set(testing_statuses)
+        return [
+            change for change in self.status_changes
+            if change.from_status in testing_statuses and change.to_status == return_status
+        ]
+
+
+def _author_name(history) -> str:
+    author = getattr(history, 'author', None)
+    name = getattr(author, 'displayName', None) if author is not None else None
+    return name if name is not None else 'Unknown'
+
+
+def parse_timeline(issue) -> IssueTimeline:
+    """Issue → IssueTimeline (changelog bir marta aylanib chiqiladi)"""
+    fields = getattr(issue, 'fields', None)
+    timeline = IssueTimeline(
+        created=parse_jira_datetime(getattr(fields, 'created', None)),
+        resolved=parse_jira_datetime(getattr(fields, 'resolutiondate', None)),
+    )
+
+    changelog = getattr(issue, 'changelog', None)
+    if not changelog:
+        return timeline
+    timeline.has_changelog = True
+
+    for history in getattr(changelog, 'histories', None) or []:
+        created = getattr(history, 'created', '') or ''
+        at = None
+        author = None
+        for item in history.items:
+            if item.field == 'status':
+                if at is None:
+                    at = parse_jira_datetime(created)
+                    author = _author_name(history)
+                timeline.status_changes.append(StatusChange(
+                    created=created,
+                    at=at,
+                    from_status=item.fromString or 'None',
+                    to_status=item.toString or 'None',
+                    author=author,
+                ))
+            elif item.field == 'Sprint' and not timeline.sprint_added:
+                timeline.sprint_added = created[:10]
+
+    return timeline
+
+
+def get_timeline(issue: Any) -> IssueTimeline:
+    """Keshlangan timeline (issue obyektida - bir issue uchun bir marta parse)"""
+    timeline = vars(issue).get('_timeline')
+    if timeline is None:
+        timeline = parse_timeline(issue)
+        issue._timeline = timeline
+    return timeline
@@ -5,9 +5,89 @@ JIRA API Client - Task va PR ma'lumotlarini olish
 YANGI: Development Status API dan PR URL olish!
 """
 from jira import JIRA
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+import asyncio
+import copy
 import json
-import requests
+import logging
+import os
+import threading
+import time
+
+from utils.http_client import get_http_client, run_sync
+from utils.jira.field_sets import FieldSet, TASK_DETAILS, SEARCH_SUMMARY, ISSUE_ID
+from utils.jira.payload_log import attach_payload_stats, JiraPayloadStats
+
+logger = logging.getLogger(__name__)
+
+# get_tasks_details: bitta JQL'dagi key'lar (JQL uzunligi chegarasi) va sahifa hajmi
+BULK_KEYS_PER_JQL = 100
+BULK_PAGE_SIZE = 100
+
+# Development Status API (PR linklar) - issue ID (key emas!) kutadi
+DEV_STATUS_PATH = '/rest/dev-status/1.0/issue/detail'
+
+
+def dev_status_params(issue_id: str) -> Dict[str, str]:
+    return {
+        'issueId': issue_id,  # Use ID, not KEY!
+        'applicationType': 'GitHub',
+        'dataType': 'pullrequest'
+    }
+
+
+def parse_dev_status_prs(data: Dict) -> List[Dict]:
+    """Dev Status javobi → [{'url', 'title', 'status', 'source'}]"""
+    pr_urls = []
+    for item in data.get('detail', []):
+        for pr in item.get('pullRequests', []):
+            pr_url = pr.get('url', '')
+            if pr_url:
+                pr_urls.append({
+                    'url': pr_url,
+                    'title': pr.get('name', pr.get('title', '')),
+                    'status': pr.get('status', ''),
+                    'source': 'JIRA (Dev Status API)'
+                })
+    return pr_urls
+
+
+class _TTLCache:
+    """Qisqa muddatli kesh (thread-safe) - hit/miss hisoblagichlari bilan"""
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._items: Dict[Tuple, Tuple[float, Any]] = {}
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None and item[0] > time.monotonic():
+                self.stats['hits'] += 1
+                return item[1]
+            if item is not None:
+                del self._items[key]
+            self.stats['misses'] += 1
+            return None
+
+    def set(self, key: Tuple, value: Any):
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            # Eskirganlarni tozalash (kesh kichik - faqat shu client so'ragan task'lar)
+            for stale in [k for k, (expires, _) in self._items.items() if expires <= now]:
+                del self._items[stale]
+            self._items[key] = (now + self.ttl_seconds, value)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self):
+        return len(self._items)
 
 
 class JiraClient:
@@ -27,6 +107,10 @@ class JiraClient:
 
         self._client = None
 
+        # TZ-PR tekshiruv bitta task'ni bir necha marta so'raydi (details, issue ID,
+        # TZ matni) - JIRA_ISSUE_CACHE_TTL soniya ichida qayta fetch qilinmaydi
+        self._cache = _TTLCache(float(os.getenv('JIRA_ISSUE_CACHE_TTL', 60)))
+
     @property
     def client(self) -> JIRA:
         """Lazy connection"""
@@ -35,8 +119,28 @@ class JiraClient:
                 server=self.server,
                 basic_auth=(self.email, self.token)
             )
+            attach_payload_stats(self._client, logger)
         return self._client
 
+    @property
+    def payload_stats(self) -> JiraPayloadStats:
+        """JIRA javob hajmlari (endpoint bo'yicha)"""
+        return attach_payload_stats(self.client, logger)
+
+    @property
+    def cache_stats(self) -> Dict[str, Any]:
+        """Issue kesh: {'hits', 'misses', 'size', 'ttl'}"""
+        return {**self._cache.stats, 'size': len(self._cache), 'ttl': self._cache.ttl_seconds}
+
+    @property
+    def http_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Dev Status API latency (umumiy HTTP client, endpoint bo'yicha)"""
+        return get_http_client().stats()
+
+    def clear_cache(self):
+        """Keshni tozalash (masalan, task JIRA'da o'zgartirilgandan keyin)"""
+        self._cache.clear()
+
     def test_connection(self) -> bool:
         """JIRA ulanishini tekshirish"""
         try:
@@ -47,21 +151,181 @@ class JiraClient:
             print(f"❌ JIRA ulanish xatosi: {e}")
             return False
 
-    def get_issue(self, issue_key: str, expand: str = 'changelog,renderedFields') -> Optional[Any]:
-        """Bitta issue ni olish"""
+    def get_issue(self, issue_key: str, field_set: FieldSet = None, expand: str = None,
+                  fields: str = None) -> Optional[Any]:
+        """
+        Bitta issue ni olish
+
+        Args:
+            field_set: Use case maydonlari (utils/jira/field_sets.py) - expand/fields o'rniga
+            expand: JIRA expand (masalan, 'changelog') - default: yo'q
+            fields: 'summary,status,...' - default: hamma maydonlar
+
+        Natija JIRA_ISSUE_CACHE_TTL soniya keshlanadi (kalit + fields + expand bo'yicha)
+        """
+        if field_set is not None:
+            expand, fields = field_set.expand, field_set.fields_param
+
+        cache_key = ('issue', issue_key.upper(), fields, expand)
+        issue = self._cache.get(cache_key)
+        if issue is not None:
+            return issue
+
         try:
-            issue = self.client.issue(issue_key, expand=expand)
+            issue = self.client.issue(issue_key, fields=fields, expand=expand)
+            self._cache.set(cache_key, issue)
             return issue
         except Exception as e:
             print(f"❌ Issue olishda xatolik: {e}")
             return None
 
     def get_task_details(self, issue_key: str) -> Optional[Dict]:
-        """Task ning asosiy ma'lumotlarini olish (TZ uchun)"""
-        issue = self.get_issue(issue_key)
+        """
+        Task ning asosiy ma'lumotlarini olish (TZ uchun)
+
+        Keshlanadi - get_task_tz va takroriy tekshiruvlar qayta so'ramaydi
+        (bitta issue fetch + Dev Status). Har chaqiruvga alohida nusxa qaytadi.
+        """
+        cache_key = ('details', issue_key.upper())
+        details = self._cache.get(cache_key)
+        if details is not None:
+            return copy.deepcopy(details)
+
+        issue = self.get_issue(issue_key, field_set=TASK_DETAILS)
         if not issue:
             return None
 
+        # PR URLs olish (YANGI METHOD!) - issue ID allaqachon bor, qayta so'ralmaydi
+        pr_urls = self.extract_pr_urls_dev_status(issue_key, issue_id=issue.id)
+
+        details = self.build_task_details(issue, pr_urls)
+        self._cache.set(cache_key, details)
+        return copy.deepcopy(details)
+
+    def get_tasks_details(self, issue_keys: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Ko'p task'ning details'i bir nechta so'rovda (get_task_details × N o'rniga)
+
+        1. Keshda yo'q key'lar 'key in (...)' JQL bilan (BULK_KEYS_PER_JQL tadan,
+           sahifalab) - TASK_DETAILS maydonlari, comment'lar bilan. Chunk so'rovi
+           yiqilsa (masalan, Cloud'da mavjud bo'lmagan key) - shu chunk get_task_details bilan
+        2. Dev Status PR linklar parallel (AsyncJiraClient, HTTP_POOL_SIZE tadan)
+        3. Har biri get_task_details bilan bir xil dict - keshga ham yoziladi
+
+        Returns:
+            {KEY: details} - kirish tartibida (key'lar katta harfda);
+            topilmagan yoki access yo'q task → None
+        """
+        keys = list(dict.fromkeys(key.strip().upper() for key in issue_keys if key and key.strip()))
+        results: Dict[str, Optional[Dict]] = {}
+
+        missing = []
+        for key in keys:
+            details = self._cache.get(('details', key))
+            if details is not None:
+                results[key] = copy.deepcopy(details)
+            else:
+                missing.append(key)
+
+        if missing:
+            issues, failed = self._search_task_issues(missing)
+            pr_urls = run_sync(self._dev_status_many(issues))
+
+            for issue in issues:
+                details = self.build_task_details(issue, pr_urls.get(issue.key, []))
+                self._cache.set(('issue', issue.key.upper(), TASK_DETAILS.fields_param, TASK_DETAILS.expand), issue)
+                self._cache.set(('details', issue.key.upper()), details)
+                results[issue.key.upper()] = copy.deepcopy(details)
+
+            # Bulk so'rovi yiqilgan chunk'lar - bittalab (topilmagan key faqat o'zi None bo'ladi)
+            for key in failed:
+                results[key] = self.get_task_details(key)
+
+        return {key: results.get(key) for key in keys}
+
+    def _search_pages(self, jql: str, fields: str = None, expand: str = None) -> List[Any]:
+        """
+        JQL'ning hamma sahifalari
+
+        Cloud - search/jql, nextPageToken bo'yicha (startAt>0 xato, total yo'q).
+        Server / Data Center - startAt; validate_query=False - mavjud bo'lmagan key
+        butun so'rovni 400 qilmaydi (Cloud'da bu parametr yo'q - jira uni tashlab yuboradi).
+        """
+        issues = []
+        if getattr(self.client, '_is_cloud', False):
+            token = None
+            while True:
+                page = self.client.enhanced_search_issues(
+                    jql, nextPageToken=token, maxResults=BULK_PAGE_SIZE, fields=fields, expand=expand
+                )
+                issues.extend(page)
+                token = getattr(page, 'nextPageToken', None)
+                if not token or not page:
+                    return issues
+
+        start_at = 0
+        while True:
+            page = self.client.search_issues(
+                jql, startAt=start_at, maxResults=BULK_PAGE_SIZE, validate_query=False,
+                fields=fields, expand=expand
+            )
+            issues.extend(page)
+            start_at += len(page)
+            if not page or start_at >= (getattr(page, 'total', None) or 0):
+                return issues
+
+    def _search_task_issues(self, keys: List[str]) -> Tuple[List[Any], List[str]]:
+        """
+        'key in (...)' JQL - TASK_DETAILS maydonlari bilan, hamma sahifalar
+
+        Returns:
+            (issue'lar, so'rovi yiqilgan chunk'lardagi key'lar - bittalab olinadi)
+        """
+        issues = []
+        failed = []
+        for i in range(0, len(keys), BULK_KEYS_PER_JQL):
+            chunk = keys[i:i + BULK_KEYS_PER_JQL]
+            try:
+                issues.extend(self._search_pages(
+                    f"key in ({', '.join(chunk)})", fields=TASK_DETAILS.fields_param, expand=TASK_DETAILS.expand
+                ))
+            except Exception as e:
+                print(f"⚠️ Bulk search xatolik ({len(chunk)} ta key) - bittalab olinadi: {e}")
+                failed.extend(chunk)
+
+        # Search comment'larni kesishi mumkin - bunday issue'lar alohida olinadi
+        for index, issue in enumerate(issues):
+            comment = getattr(issue.fields, 'comment', None)
+            total = getattr(comment, 'total', None)
+            if comment is not None and total is not None and total > len(comment.comments):
+                full = self.get_issue(issue.key, field_set=TASK_DETAILS)
+                if full is not None:
+                    issues[index] = full
+        return issues, failed
+
+    async def _dev_status_many(self, issues: List[Any]) -> Dict[str, List[Dict]]:
+        """Issue'lar Dev Status PR'lari parallel → {issue.key: pr_urls}"""
+        from utils.jira.async_jira_client import AsyncJiraClient
+
+        if not issues:
+            return {}
+
+        semaphore = asyncio.Semaphore(get_http_client().pool_size)
+
+        async with AsyncJiraClient(self) as jira:
+            async def one(issue):
+                async with semaphore:
+                    return await jira.extract_pr_urls_dev_status(issue.key, issue_id=issue.id)
+
+            pr_lists = await asyncio.gather(*(one(issue) for issue in issues))
+        return {issue.key: pr_urls for issue, pr_urls in zip(issues, pr_lists)}
+
+    def build_task_details(self, issue, pr_urls: List[Dict]) -> Dict:
+        """
+        Issue (TASK_DETAILS maydonlari) + Dev Status PR'lar → task details dict
+
+        get_task_details, get_tasks_details va AsyncJiraClient - hammasi shu formatni qaytaradi.
+        """
         fields = issue.fields
 
         # Comments olish
@@ -74,9 +338,6 @@ class JiraClient:
                     'created': c.created[:16].replace('T', ' ')
                 })
 
-        # PR URLs olish (YANGI METHOD!)
-        pr_urls = self.extract_pr_urls_dev_status(issue_key)
-
         # Agar Dev Status API ishlamasa, eski methoddan harakat qilish
         if not pr_urls:
             pr_urls = self.extract_pr_urls_legacy(issue)
@@ -99,30 +360,33 @@ class JiraClient:
             'components': [c.name for c in fields.components] if fields.components else []
         }
 
-    def extract_pr_urls_dev_status(self, issue_key: str) -> List[Dict]:
+    def extract_pr_urls_dev_status(self, issue_key: str, issue_id: str = None) -> List[Dict]:
         """
         YANGI METHOD: Development Status API dan PR URL olish
 
         API: /rest/dev-status/1.0/issue/detail
+
+        Args:
+            issue_id: Issue ID (allaqachon olingan issue'dan) - berilmasa so'raladi (keshlangan)
         """
         pr_urls = []
 
         try:
-            # First, get issue ID (not key!)
-            issue = self.client.issue(issue_key)
-            issue_id = issue.id
+            # Dev Status API issue ID (key emas!) kutadi
+            if issue_id is None:
+                issue = self.get_issue(issue_key, field_set=ISSUE_ID)
+                if issue is None:
+                    return pr_urls
+                issue_id = issue.id
 
             # Development Status API endpoint
-            url = f"{self.server}/rest/dev-status/1.0/issue/detail"
-
-            params = {
-                'issueId': issue_id,  # Use ID, not KEY!
-                'applicationType': 'GitHub',
-                'dataType': 'pullrequest'
-            }
+            url = f"{self.server}{DEV_STATUS_PATH}"
+            params = dev_status_params(issue_id)
 
-            response = requests.get(
+            # Umumiy pool (keep-alive) + 429/5xx retry
+            response = get_http_client().get(
                 url,
+                endpoint='jira:dev-status/issue/detail',
                 params=params,
                 auth=(self.email, self.token),
                 headers={'Accept': 'application/json'},
@@ -130,21 +394,7 @@ class JiraClient:
             )
 
             if response.status_code == 200:
-                data = response.json()
-
-                # Parse response
-                detail = data.get('detail', [])
-                for item in detail:
-                    pull_requests = item.get('pullRequests', [])
-                    for pr in pull_requests:
-                        pr_url = pr.get('url', '')
-                        if pr_url:
-                            pr_urls.append({
-                                'url': pr_url,
-                                'title': pr.get('name', pr.get('title', '')),
-                                'status': pr.get('status', ''),
-                                'source': 'JIRA (Dev Status API)'
-                            })
+                pr_urls = parse_dev_status_prs(response.json())
 
                 if pr_urls:
                     print(f"   ✅ Dev Status API: {len(pr_urls)} ta PR topildi!")
@@ -287,7 +537,7 @@ class JiraClient:
             issues = self.client.search_issues(
                 jql,
                 maxResults=max_results,
-                expand='changelog'
+                fields=SEARCH_SUMMARY.fields_param
             )
 
             results = []
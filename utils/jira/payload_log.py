@@ -0,0 +1,105 @@
+# utils/jira/payload_log.py
+"""
+JIRA javob hajmlarini o'lchash (endpoint bo'yicha)
+
+JIRA client'ning requests session'iga response hook qo'shiladi - har bir javob
+hajmi (bayt) va soni endpoint bo'yicha yig'iladi. fields=/expand= o'zgarishlari
+qancha trafik tejaganini shu bilan ko'rish mumkin.
+
+Usage:
+    payload = attach_payload_stats(jira)
+    ...
+    payload.log_summary(logger)
+"""
+import logging
+import re
+import threading
+from typing import Dict, Any
+from urllib.parse import urlparse
+
+_NUMBER_RE = re.compile(r'(?<!/api)/\d+(?=/|$)')
+_ISSUE_KEY_RE = re.compile(r'/[A-Z][A-Z0-9_]+-\d+(?=/|$)')
+
+
+def _endpoint(url: str) -> str:
+    """'/rest/api/2/issue/DEV-123' → '/rest/api/2/issue/{key}'"""
+    path = urlparse(url).path
+    path = _ISSUE_KEY_RE.sub('/{key}', path)
+    return _NUMBER_RE.sub('/{id}', path)
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+class JiraPayloadStats:
+    """Endpoint → {'requests', 'bytes'} (thread-safe)"""
+
+    def __init__(self, logger: logging.Logger = None):
+        self.logger = logger or logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self.endpoints: Dict[str, Dict[str, int]] = {}
+
+    def record(self, response, *args, **kwargs):
+        """requests response hook"""
+        size = len(response.content or b'')
+        endpoint = _endpoint(response.url)
+        with self._lock:
+            entry = self.endpoints.setdefault(endpoint, {'requests': 0, 'bytes': 0})
+            entry['requests'] += 1
+            entry['bytes'] += size
+        self.logger.debug(f"JIRA {response.request.method} {endpoint}: {_format_bytes(size)}")
+        return response
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(entry['bytes'] for entry in self.endpoints.values())
+
+    @property
+    def total_requests(self) -> int:
+        with self._lock:
+            return sum(entry['requests'] for entry in self.endpoints.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            endpoints = {name: dict(entry) for name, entry in self.endpoints.items()}
+        return {
+            'requests': sum(entry['requests'] for entry in endpoints.values()),
+            'bytes': sum(entry['bytes'] for entry in endpoints.values()),
+            'endpoints': endpoints,
+        }
+
+    def log_summary(self, logger: logging.Logger = None):
+        """Jami va endpoint bo'yicha (eng kattasi birinchi)"""
+        logger = logger or self.logger
+        stats = self.to_dict()
+        if not stats['requests']:
+            return
+
+        logger.info(f"📦 JIRA payload: {_format_bytes(stats['bytes'])} ({stats['requests']} javob)")
+        for name, entry in sorted(stats['endpoints'].items(), key=lambda x: x[1]['bytes'], reverse=True):
+            average = entry['bytes'] / entry['requests']
+            logger.info(f"   {name}: {_format_bytes(entry['bytes'])} / {entry['requests']} "
+                        f"(o'rtacha {_format_bytes(average)})")
+
+
+def attach_payload_stats(jira, logger: logging.Logger = None) -> JiraPayloadStats:
+    """
+    jira.JIRA client'iga payload hook qo'shish (bir marta - qayta chaqirilsa o'sha obyekt)
+
+    Returns:
+        JiraPayloadStats
+    """
+    existing = getattr(jira, '_payload_stats', None)
+    if existing is not None:
+        return existing
+
+    stats = JiraPayloadStats(logger)
+    jira._session.hooks.setdefault('response', []).append(stats.record)
+    jira._payload_stats = stats
+    return stats
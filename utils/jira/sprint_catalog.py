@@ -0,0 +1,329 @@
+# utils/jira/sprint_catalog.py
+"""
+Lokal sprint katalogi - board bo'yicha topish + SQLite
+
+Oldin get_sprint_info lru_cache bilan o'ralgan edi (kalit - JIRA client
+obyekti): kesh faqat bitta process ichida ishlardi, har bir run har bir sprint
+uchun ketma-ket jira.sprint() chaqirardi, sprint ID'lar esa Config.SPRINT_IDS
+da qo'lda yozilardi.
+
+Endi:
+    1. Board sprintlari sahifalab olinadi (agile board/{id}/sprint) - nomi,
+       state, sanalari lokal saqlanadi
+    2. Keyingi refresh'lar - faqat yopilmagan sprintlar (state=active,future);
+       katalogda ochiq bo'lib, javobda yo'q sprintlar yopilgan - faqat ular
+       alohida so'raladi. Yopilgan sprint qayta so'ralmaydi.
+    3. Refresh JIRA_SPRINT_CATALOG_TTL (daqiqa) ichida takrorlanmaydi
+    4. Board'da yo'q sprint (boshqa board) - bir marta jira.sprint(), keyin katalogdan
+
+board_id - sprint yaratilgan board (originBoardId). Board ro'yxatida kelgan
+sprintlar board_sprints'da ham bog'lanadi: boshqa board'da yaratilgan, lekin
+shu board'da ko'rinadigan sprint ham select() va incremental refresh'ga kiradi.
+
+Sprintlarni tanlash (Config.SPRINT_IDS o'rniga): select(last=N, states=[...])
+
+Usage:
+    catalog = JiraSprintCatalog(board_id=10)
+    catalog.refresh(jira)
+    catalog.select(last=6, states=['closed'])   # oxirgi 6 ta yopilgan sprint
+    catalog.sprint_info(jira, 3081)            # {'id', 'name', 'state', 'startDate', 'endDate'}
+"""
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Iterable
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+AGILE_PAGE_SIZE = 50
+OPEN_STATES = ('active', 'future')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sprints (
+    sprint_id      INTEGER PRIMARY KEY,
+    board_id       INTEGER,
+    name           TEXT NOT NULL,
+    state          TEXT NOT NULL,
+    start_date     TEXT,
+    end_date       TEXT,
+    complete_date  TEXT,
+    updated_at     REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sprints_board ON sprints (board_id, state);
+
+CREATE TABLE IF NOT EXISTS board_sprints (
+    board_id   INTEGER NOT NULL,
+    sprint_id  INTEGER NOT NULL,
+    PRIMARY KEY (board_id, sprint_id)
+);
+
+CREATE TABLE IF NOT EXISTS boards (
+    board_id      INTEGER PRIMARY KEY,
+    refreshed_at  REAL NOT NULL
+);
+"""
+
+
+def _date(value: Optional[str]) -> Optional[str]:
+    """'2024-01-15T10:30:00.000Z' → '2024-01-15'"""
+    return value[:10] if value else None
+
+
+class JiraSprintCatalog:
+    """Sprint katalogi (SQLite, thread-safe)"""
+
+    # Shu board sprinti: shu yerda yaratilgan yoki board ro'yxatida kelgan (params: board_id × 2)
+    _ON_BOARD = (
+        "(board_id = ? OR sprint_id IN (SELECT sprint_id FROM board_sprints WHERE board_id = ?))"
+    )
+
+    def __init__(self, board_id: int = None, db_path: str = None, ttl_minutes: float = None):
+        """
+        Args:
+            board_id: Agile board (default: JIRA_BOARD_ID yoki 10)
+            db_path: SQLite fayl (default: JIRA_SPRINT_CATALOG_PATH yoki DATA_DIR/jira_sprint_catalog.db)
+            ttl_minutes: Ochiq sprintlar shu vaqt ichida qayta so'ralmaydi
+                (default: JIRA_SPRINT_CATALOG_TTL yoki 10)
+        """
+        if db_path is None:
+            db_path = os.getenv(
+                'JIRA_SPRINT_CATALOG_PATH',
+                os.path.join(os.getenv('DATA_DIR', './data'), 'jira_sprint_catalog.db')
+            )
+        self.db_path = db_path
+        self.board_id = int(board_id or os.getenv('JIRA_BOARD_ID', 10))
+        self.ttl_seconds = 60 * float(
+            ttl_minutes if ttl_minutes is not None else os.getenv('JIRA_SPRINT_CATALOG_TTL', 10)
+        )
+        self.stats = {'requests': 0, 'discovered': 0, 'refreshed': 0}
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA busy_timeout=30000")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    # ------------------------------------------------------------------------
+    # JIRA (agile API)
+    # ------------------------------------------------------------------------
+    def _agile_json(self, jira, path: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        self.stats['requests'] += 1
+        return jira._get_json(path, params=params, base=jira.AGILE_BASE_URL)
+
+    def _fetch_board(self, jira, states: Iterable[str] = None) -> List[Dict[str, Any]]:
+        """board/{id}/sprint - hamma sahifalar"""
+        sprints = []
+        start_at = 0
+        while True:
+            params = {'startAt': start_at, 'maxResults': AGILE_PAGE_SIZE}
+            if states:
+                params['state'] = ','.join(states)
+            data = self._agile_json(jira, f'board/{self.board_id}/sprint', params)
+            values = data.get('values') or []
+            sprints.extend(values)
+            start_at += len(values)
+            if data.get('isLast', True) or not values:
+                return sprints
+
+    def _fetch_sprint(self, jira, sprint_id: int) -> Dict[str, Any]:
+        return self._agile_json(jira, f'sprint/{sprint_id}')
+
+    # ------------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------------
+    def _upsert(self, sprints: Iterable[Dict[str, Any]], on_board: bool = False) -> int:
+        """
+        Args:
+            on_board: Sprintlar shu board ro'yxatidan - board_sprints'ga ham bog'lanadi
+        """
+        now = time.time()
+        rows = [
+            (
+                int(sprint['id']), sprint.get('originBoardId', self.board_id),
+                sprint.get('name') or f"Sprint {sprint['id']}", (sprint.get('state') or 'unknown').lower(),
+                _date(sprint.get('startDate')), _date(sprint.get('endDate')), _date(sprint.get('completeDate')),
+                now,
+            )
+            for sprint in sprints
+        ]
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO sprints "
+                "(sprint_id, board_id, name, state, start_date, end_date, complete_date, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            if on_board:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO board_sprints (board_id, sprint_id) VALUES (?, ?)",
+                    [(self.board_id, row[0]) for row in rows]
+                )
+        return len(rows)
+
+    def _row(self, sprint_id: int) -> Optional[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute("SELECT * FROM sprints WHERE sprint_id = ?", (sprint_id,)).fetchone()
+
+    def refreshed_at(self) -> Optional[float]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT refreshed_at FROM boards WHERE board_id = ?", (self.board_id,)
+            ).fetchone()
+        return row['refreshed_at'] if row else None
+
+    # ------------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------------
+    def refresh(self, jira, full: bool = False, force: bool = False) -> Dict[str, Any]:
+        """
+        Board sprintlarini yangilash
+
+        Birinchi marta (yoki full=True) - hamma sprintlar; keyin faqat ochiqlari
+        (active, future) + katalogda ochiq bo'lib endi ro'yxatda yo'qlari (yopilgan).
+
+        Args:
+            full: Hamma sprintlarni qayta olish
+            force: TTL'ga qaramay yangilash
+
+        Returns:
+            {'skipped', 'discovered', 'refreshed', 'requests', 'seconds'}
+        """
+        started = time.perf_counter()
+        requests_before = self.stats['requests']
+
+        with self._refresh_lock:
+            refreshed_at = self.refreshed_at()
+            if not (full or force) and refreshed_at is not None and time.time() - refreshed_at < self.ttl_seconds:
+                return {'skipped': True, 'discovered': 0, 'refreshed': 0, 'requests': 0, 'seconds': 0.0}
+
+            incremental = refreshed_at is not None and not full
+            fetched = self._fetch_board(jira, OPEN_STATES if incremental else None)
+
+            with self._lock:
+                known_open = {
+                    row['sprint_id'] for row in self._conn.execute(
+                        f"SELECT sprint_id FROM sprints WHERE {self._ON_BOARD} AND state != 'closed'",
+                        (self.board_id, self.board_id)
+                    )
+                }
+                known = {row['sprint_id'] for row in self._conn.execute("SELECT sprint_id FROM sprints")}
+
+            # Katalogda ochiq edi, endi ochiqlar ro'yxatida yo'q - yopilgan (yoki o'chirilgan)
+            fetched_ids = {int(sprint['id']) for sprint in fetched}
+            gone = sorted(known_open - fetched_ids) if incremental else []
+            for sprint_id in gone:
+                try:
+                    fetched.append(self._fetch_sprint(jira, sprint_id))
+                except Exception as e:
+                    if getattr(e, 'status_code', None) != 404:
+                        raise
+                    with self._transaction() as conn:
+                        conn.execute("DELETE FROM sprints WHERE sprint_id = ?", (sprint_id,))
+                        conn.execute("DELETE FROM board_sprints WHERE sprint_id = ?", (sprint_id,))
+
+            # gone sprintlar ham shu board ro'yxatidan kelgan edi - bog'lanish saqlanadi
+            self._upsert(fetched, on_board=True)
+            with self._transaction() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO boards (board_id, refreshed_at) VALUES (?, ?)",
+                    (self.board_id, time.time())
+                )
+
+        discovered = len({int(sprint['id']) for sprint in fetched} - known)
+        self.stats['discovered'] += discovered
+        self.stats['refreshed'] += len(fetched) - discovered
+        return {
+            'skipped': False,
+            'discovered': discovered,
+            'refreshed': len(fetched) - discovered,
+            'requests': self.stats['requests'] - requests_before,
+            'seconds': round(time.perf_counter() - started, 2),
+        }
+
+    # ------------------------------------------------------------------------
+    # Read
+    # ------------------------------------------------------------------------
+    @staticmethod
+    def _info(row: sqlite3.Row) -> Dict[str, Any]:
+        """get_sprint_info formati"""
+        return {
+            'id': row['sprint_id'],
+            'name': row['name'],
+            'state': row['state'],
+            'startDate': row['start_date'],
+            'endDate': row['end_date'],
+        }
+
+    def sprint_info(self, jira, sprint_id: int) -> Dict[str, Any]:
+        """
+        Sprint ma'lumotlari - katalogdan; yo'q bo'lsa yoki ochiq va eskirgan bo'lsa JIRA'dan
+
+        jira=None - faqat katalog (offline)
+        """
+        sprint_id = int(sprint_id)
+        row = self._row(sprint_id)
+        fresh = row is not None and (
+            row['state'] == 'closed' or time.time() - row['updated_at'] < self.ttl_seconds
+        )
+        if fresh or jira is None:
+            return self._info(row) if row is not None else None
+
+        self._upsert([self._fetch_sprint(jira, sprint_id)])
+        return self._info(self._row(sprint_id))
+
+    def select(self, last: int = None, states: Iterable[str] = None, board_only: bool = True) -> List[int]:
+        """
+        Katalogdan sprint ID'lar (eng yangisi birinchi - start date bo'yicha)
+
+        Args:
+            last: Faqat oxirgi N ta
+            states: ['closed'], ['active'], ... (default: hammasi)
+            board_only: Faqat shu board sprintlari (boshqa board'da yaratilgan, lekin shu board'dagilari ham)
+        """
+        query = "SELECT sprint_id FROM sprints"
+        where, params = [], []
+        if board_only:
+            where.append(self._ON_BOARD)
+            params.extend([self.board_id, self.board_id])
+        if states:
+            states = [state.lower() for state in states]
+            where.append("state IN (%s)" % ", ".join("?" * len(states)))
+            params.extend(states)
+        if where:
+            query += " WHERE " + " AND ".join(where)
+        query += " ORDER BY COALESCE(start_date, '9999') DESC, sprint_id DESC"
+        if last:
+            query += " LIMIT ?"
+            params.append(int(last))
+
+        with self._lock:
+            return [row['sprint_id'] for row in self._conn.execute(query, params)]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM sprints").fetchone()[0]
@@ -0,0 +1,220 @@
+# utils/sprint_snapshot.py
+"""
+Sprint snapshot - Parquet (columnar) format
+
+download_file.py har bir sprint uchun .xlsx yonida bir xil nomli .parquet
+snapshot yozadi (ustunlar - ACTIVE_COLUMNS). Excel faqat odamlar uchun qoladi,
+dasturlar (2_load_sprints.py, ui/pages/statistics.py) snapshot'ni o'qiydi:
+
+    - to'liq sprint bitta vectorized read (pyarrow) - millisekundlar
+    - ustunlar typed: son ustunlar int/float, qolganlari string
+    - row count metadata'dan (fayl o'qilmaydi)
+
+Snapshot bo'lmasa yoki .xlsx undan yangiroq bo'lsa (qo'lda tahrirlangan) -
+SprintWorkbookReader ishlatiladi.
+"""
+import os
+from typing import List, Dict, Any, Iterator, Tuple, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from utils.sprint_workbook_reader import (
+    SprintWorkbookReader, ISSUE_COLUMNS, parse_sprint_id, _to_int, _to_number
+)
+
+SNAPSHOT_EXT = '.parquet'
+EXCEL_EXT = '.xlsx'
+
+# Son ustunlar (qolganlari string)
+NUMERIC_COLUMNS = {
+    'Story Points': pa.float64(),
+    'PR Count': pa.int64(),
+    'Comment Count': pa.int64(),
+    'Return Count': pa.int64(),
+    'Return from Test Count': pa.int64(),
+}
+
+
+def snapshot_path(excel_path: str) -> str:
+    """report.xlsx → report.parquet"""
+    return os.path.splitext(excel_path)[0] + SNAPSHOT_EXT
+
+
+def resolve_sprint_source(path: str) -> str:
+    """
+    O'qish uchun fayl: snapshot bor va .xlsx'dan eski bo'lmasa - .parquet
+
+    Args:
+        path: .xlsx yoki .parquet yo'li
+    """
+    if path.endswith(SNAPSHOT_EXT):
+        return path
+
+    parquet = snapshot_path(path)
+    if not os.path.exists(parquet):
+        return path
+    if os.path.exists(path) and os.path.getmtime(path) > os.path.getmtime(parquet):
+        return path
+    return parquet
+
+
+def list_sprint_sources(directory: str) -> List[str]:
+    """
+    Papkadagi sprint fayllar (nomlari)
+
+    .xlsx va .parquet bir xil nomli bo'lsa bitta yozuv (.xlsx nomi) - manifest
+    va UI'da sprint identifikatori o'zgarmaydi. Faqat .parquet bo'lsa - uning nomi.
+    """
+    if not os.path.isdir(directory):
+        return []
+
+    names = {}
+    for name in sorted(os.listdir(directory)):
+        if name.startswith('~$'):
+            continue
+        stem, ext = os.path.splitext(name)
+        if ext == EXCEL_EXT:
+            names[stem] = name
+        elif ext == SNAPSHOT_EXT:
+            names.setdefault(stem, name)
+    return sorted(names.values())
+
+
+def _column_array(values: List[Any], pa_type: Optional[pa.DataType]) -> pa.Array:
+    if pa_type is None:
+        return pa.array(['' if v is None else str(v) for v in values], type=pa.string())
+
+    converted = []
+    for v in values:
+        if v is None or v == '':
+            converted.append(None)
+            continue
+        try:
+            converted.append(float(v) if pa.types.is_floating(pa_type) else int(float(v)))
+        except (TypeError, ValueError):
+            converted.append(None)
+    return pa.array(converted, type=pa_type)
+
+
+def write_sprint_snapshot(rows: List[Dict[str, Any]], columns: List[str], path: str) -> str:
+    """
+    Snapshot yozish (tmp fayl + os.replace - yarim yozilgan fayl qolmaydi)
+
+    Args:
+        rows: {ustun nomi: qiymat} - download_file.build_report_rows() natijasi
+        columns: Ustunlar tartibi (ACTIVE_COLUMNS)
+        path: .parquet yo'li
+
+    Returns:
+        path
+    """
+    table = pa.table({
+        column: _column_array([row.get(column) for row in rows], NUMERIC_COLUMNS.get(column))
+        for column in columns
+    })
+
+    tmp_path = path + '.tmp'
+    pq.write_table(table, tmp_path, compression='zstd')
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_snapshot_frame(path: str, columns: List[str] = None) -> pd.DataFrame:
+    """Snapshot → DataFrame (faqat kerakli ustunlar)"""
+    if columns is not None:
+        available = set(pq.read_schema(path).names)
+        columns = [c for c in columns if c in available]
+    return pd.read_parquet(path, columns=columns)
+
+
+def snapshot_issue_frame(path: str, sprint_id: str = None) -> pd.DataFrame:
+    """
+    Snapshot → issue DataFrame (build_issue() maydon nomlari, vectorized)
+
+    Default qiymatlar va header alias'lari ISSUE_COLUMNS bilan bir xil;
+    key bo'sh qatorlar tashlanadi.
+    """
+    headers = [h for _, names, _, _ in ISSUE_COLUMNS for h in names]
+    frame = read_snapshot_frame(path, headers)
+
+    data = {}
+    for field, names, default, convert in ISSUE_COLUMNS:
+        present = [h for h in names if h in frame.columns]
+        if not present:
+            data[field] = pd.Series(default, index=frame.index)
+            continue
+
+        series = frame[present[0]]
+        for alias in present[1:]:
+            series = series.where(series.notna() & (series != ''), frame[alias])
+
+        if convert is _to_int:
+            series = pd.to_numeric(series, errors='coerce').fillna(default).astype(int)
+        elif convert is _to_number:
+            series = pd.to_numeric(series, errors='coerce')
+        else:
+            series = series.fillna('').astype(str)
+            if default:
+                series = series.mask(series == '', default)
+        data[field] = series
+
+    issues = pd.DataFrame(data)
+    issues['sprint_id'] = sprint_id or parse_sprint_id(path)
+    return issues[issues['key'] != ''].reset_index(drop=True)
+
+
+class SprintSnapshotReader(SprintWorkbookReader):
+    """
+    SprintWorkbookReader bilan bir xil interfeys, manba - Parquet snapshot
+
+    Qator raqamlari Excel'dagidek 2 dan boshlanadi - checkpoint'lar (last_row)
+    ikkala format uchun bir xil ma'noda.
+    """
+
+    def __init__(self, file_path: str, sprint_id: str = None):
+        self.file_path = file_path
+        self.sprint_id = sprint_id or parse_sprint_id(file_path)
+
+        self._file = pq.ParquetFile(file_path)
+        self._headers: Optional[Dict[str, int]] = None
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @property
+    def headers(self) -> Dict[str, int]:
+        if self._headers is None:
+            self._headers = {name: idx for idx, name in enumerate(self._file.schema_arrow.names)}
+        return self._headers
+
+    @property
+    def total_rows(self) -> int:
+        return self._file.metadata.num_rows
+
+    def iter_rows(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        row_idx = 2
+        for batch in self._file.iter_batches():
+            columns = batch.to_pydict()
+            names = list(columns.keys())
+            for values in zip(*columns.values()):
+                yield row_idx, dict(zip(names, values))
+                row_idx += 1
+
+
+def open_sprint_reader(path: str, sprint_id: str = None) -> SprintWorkbookReader:
+    """
+    Sprint fayl reader - snapshot bo'lsa Parquet, bo'lmasa Excel
+
+    Args:
+        path: .xlsx yoki .parquet
+        sprint_id: Sprint ID (default: fayl nomidan)
+    """
+    sprint_id = sprint_id or parse_sprint_id(path)
+    source = resolve_sprint_source(path)
+    if source.endswith(SNAPSHOT_EXT):
+        return SprintSnapshotReader(source, sprint_id=sprint_id)
+    return SprintWorkbookReader(source, sprint_id=sprint_id)
@@ -0,0 +1,259 @@
+# utils/sprint_statistics.py
+"""
+Sprint statistikasi - typed columnar jadval + groupby (pandas)
+
+Oldin download skriptlardagi generate_statistics/update_statistics har bir
+issue uchun extractor'larni qayta chaqirib dict'larga sanardi, Statistics
+sahifasi esa tab'lar bo'yicha lambda'li agg'lar bilan alohida hisoblardi.
+Endi bitta modul:
+
+    - kirish: report qatorlari (ACTIVE_COLUMNS nomlari) yoki UI DataFrame'i
+      (build_issue() maydon nomlari) → bitta typed jadval
+      (category ustunlar, son ustunlar int/float, closed/bug/returned flaglar)
+    - hamma kesimlar (developer, sprint, component, priority, status, type,
+      QA) - bir xil groupby aggregatsiya, Python loop yo'q
+    - CLI (print_statistics) va dashboard (ui/pages/statistics.py) shu natijani
+      ishlatadi - raqamlar ikkala joyda bir xil
+
+Usage:
+    stats = SprintStatistics.from_report_rows(rows)
+    stats.overview()            # {'total': ..., 'closed': ..., 'return_rate': ...}
+    stats.by_developer()        # DataFrame: Developer, Total Tasks, Closed, ...
+
+    stats = SprintStatistics(ui_df)
+"""
+from typing import List, Dict, Any, Iterable, Optional
+
+import pandas as pd
+
+from config.settings import settings
+
+# Report ustuni (download_file.ACTIVE_COLUMNS) → statistika maydoni (build_issue nomlari)
+REPORT_FIELDS = {
+    'Key': 'key',
+    'Sprint': 'sprint',
+    'Type': 'type',
+    'Status': 'status',
+    'Priority': 'priority',
+    'Assignee': 'assignee',
+    'Story Points': 'story_points',
+    'PR Count': 'pr_count',
+    'Testing Time': 'testing_time',
+    'Return Count': 'return_count',
+    'Testing Return Who': 'testing_returner',
+    'Components': 'components',
+}
+
+# Statistika uchun kerakli report ustunlari (ACTIVE_COLUMNS'da bo'lmasa ham hisoblanadi)
+STATS_REPORT_COLUMNS = [column for column in REPORT_FIELDS if column != 'Components']
+
+# Bo'sh qiymat o'rniga (extractor'lar va build_issue() bilan bir xil)
+FIELD_DEFAULTS = {
+    'assignee': 'Unassigned',
+    'priority': 'None',
+}
+
+# Kam qiymatli ustunlar - category (groupby tezroq, xotira kam)
+CATEGORY_FIELDS = ('sprint', 'type', 'status', 'priority', 'assignee')
+NUMBER_FIELDS = ('story_points', 'return_count', 'pr_count')
+
+# Guruh natijasi ustunlari (hamma kesimlar uchun bir xil)
+GROUP_COLUMNS = [
+    'Issues', 'Closed', 'Bugs', 'Story Points', 'Bug Points', 'Returns', 'Tasks with Returns',
+    'Completion Rate', 'Return Rate', 'Testing Hours', 'Avg Testing Hours',
+]
+
+
+def _text(frame: pd.DataFrame, field: str) -> pd.Series:
+    if field not in frame.columns:
+        return pd.Series(FIELD_DEFAULTS.get(field, ''), index=frame.index, dtype=object)
+    series = frame[field].astype(object).where(frame[field].notna(), '').astype(str)
+    default = FIELD_DEFAULTS.get(field)
+    return series.mask(series == '', default) if default else series
+
+
+def _number(frame: pd.DataFrame, field: str) -> pd.Series:
+    if field not in frame.columns:
+        return pd.Series(0.0, index=frame.index)
+    return pd.to_numeric(frame[field], errors='coerce').fillna(0)
+
+
+def _testing_hours(frame: pd.DataFrame) -> pd.Series:
+    """'12.5h' (Testing Time ustuni) → 12.5; testing_hours ustuni bo'lsa - o'zi"""
+    if 'testing_hours' in frame.columns:
+        return _number(frame, 'testing_hours')
+    if 'testing_time' not in frame.columns:
+        return pd.Series(0.0, index=frame.index)
+    text = frame['testing_time'].astype(object).where(frame['testing_time'].notna(), '').astype(str)
+    return pd.to_numeric(text.str.rstrip('h'), errors='coerce').fillna(0)
+
+
+def prepare_frame(frame: pd.DataFrame, done_statuses: Iterable[str] = None) -> pd.DataFrame:
+    """
+    Issue DataFrame (build_issue() maydon nomlari) → typed statistika jadvali
+
+    Yo'q ustunlar default bilan to'ldiriladi (masalan UI'da testing_returner yo'q).
+    """
+    done_statuses = list(done_statuses or settings.DONE_STATUSES)
+
+    data = {'key': _text(frame, 'key')}
+    for field in CATEGORY_FIELDS:
+        data[field] = _text(frame, field)
+    for field in NUMBER_FIELDS:
+        data[field] = _number(frame, field)
+    data['testing_hours'] = _testing_hours(frame)
+    data['testing_returner'] = _text(frame, 'testing_returner')
+    data['components'] = _text(frame, 'components')
+
+    table = pd.DataFrame(data, index=frame.index).reset_index(drop=True)
+    table['return_count'] = table['return_count'].astype(int)
+    table['pr_count'] = table['pr_count'].astype(int)
+    for field in CATEGORY_FIELDS:
+        table[field] = table[field].astype('category')
+
+    # Aggregatsiya uchun tayyor flag/son ustunlar (sum = count)
+    table['closed'] = table['status'].isin(done_statuses).astype(int)
+    table['bug'] = (table['type'] == 'Bug').astype(int)
+    table['bug_points'] = table['story_points'].where(table['bug'] == 1, 0.0)
+    table['returned'] = (table['return_count'] > 0).astype(int)
+    table['has_pr'] = (table['pr_count'] > 0).astype(int)
+    return table
+
+
+class SprintStatistics:
+    """Issue jadvali ustidan groupby statistika (natijalar keshlanadi)"""
+
+    def __init__(self, frame: pd.DataFrame, done_statuses: Iterable[str] = None):
+        """
+        Args:
+            frame: Issue DataFrame (build_issue() maydon nomlari: key, sprint, status, ...)
+            done_statuses: Yopilgan status'lar (default: settings.DONE_STATUSES)
+        """
+        self.frame = prepare_frame(frame, done_statuses)
+        self._cache: Dict[str, Any] = {}
+
+    @classmethod
+    def from_report_rows(cls, rows: List[Dict[str, Any]], done_statuses: Iterable[str] = None) -> 'SprintStatistics':
+        """Report qatorlari ({ustun: qiymat}, build_report_row natijasi) → statistika"""
+        columns = [column for column in REPORT_FIELDS if rows and column in rows[0]]
+        frame = pd.DataFrame.from_records(rows, columns=columns).rename(columns=REPORT_FIELDS)
+        return cls(frame, done_statuses)
+
+    @property
+    def total(self) -> int:
+        return len(self.frame)
+
+    def _cached(self, name: str, compute):
+        if name not in self._cache:
+            self._cache[name] = compute()
+        return self._cache[name]
+
+    # ------------------------------------------------------------------------
+    # Umumiy
+    # ------------------------------------------------------------------------
+    def overview(self) -> Dict[str, Any]:
+        """Jami ko'rsatkichlar (bitta vectorized sum)"""
+        def compute():
+            frame = self.frame
+            sums = frame[['closed', 'bug', 'story_points', 'bug_points', 'return_count',
+                          'returned', 'has_pr', 'testing_hours']].sum()
+            total = len(frame)
+            tested = int((frame['testing_hours'] > 0).sum())
+            return {
+                'total': total,
+                'closed': int(sums['closed']),
+                'bugs': int(sums['bug']),
+                'story_points': float(sums['story_points']),
+                'bug_points': float(sums['bug_points']),
+                'returns': int(sums['return_count']),
+                'tasks_with_returns': int(sums['returned']),
+                'return_rate': sums['returned'] / total * 100 if total else 0.0,
+                'avg_returns': sums['return_count'] / total if total else 0.0,
+                'pr_tasks': int(sums['has_pr']),
+                'testing_hours': float(sums['testing_hours']),
+                'avg_testing_hours': float(sums['testing_hours']) / tested if tested else 0.0,
+            }
+        return self._cached('overview', compute)
+
+    # ------------------------------------------------------------------------
+    # Kesimlar
+    # ------------------------------------------------------------------------
+    def _group(self, field: str, label: str, separator: Optional[str] = None) -> pd.DataFrame:
+        """
+        field bo'yicha GROUP_COLUMNS (Issues bo'yicha kamayish tartibida)
+
+        Args:
+            separator: Ko'p qiymatli ustun ('Sprint 1, Sprint 2') - har biriga alohida sanaladi
+        """
+        frame = self.frame
+        if separator is not None:
+            frame = frame.assign(**{field: frame[field].astype(str).str.split(separator)}).explode(field)
+            frame = frame[frame[field].str.strip() != '']
+
+        grouped = frame.groupby(field, observed=True, sort=False).agg(
+            **{
+                'Issues': ('key', 'size'),
+                'Closed': ('closed', 'sum'),
+                'Bugs': ('bug', 'sum'),
+                'Story Points': ('story_points', 'sum'),
+                'Bug Points': ('bug_points', 'sum'),
+                'Returns': ('return_count', 'sum'),
+                'Tasks with Returns': ('returned', 'sum'),
+                'Testing Hours': ('testing_hours', 'sum'),
+            }
+        )
+
+        tested = frame[frame['testing_hours'] > 0].groupby(field, observed=True).size()
+        grouped['Completion Rate'] = (grouped['Closed'] / grouped['Issues'] * 100).round(1)
+        grouped['Return Rate'] = (grouped['Tasks with Returns'] / grouped['Issues'] * 100).round(1)
+        grouped['Avg Testing Hours'] = (
+            grouped['Testing Hours'] / tested.reindex(grouped.index).where(lambda x: x > 0)
+        ).fillna(0).round(1)
+        grouped['Testing Hours'] = grouped['Testing Hours'].round(1)
+
+        result = grouped[GROUP_COLUMNS].reset_index().rename(columns={field: label})
+        result[label] = result[label].astype(str)
+        return result.sort_values(['Issues', label], ascending=[False, True], ignore_index=True)
+
+    def by_developer(self) -> pd.DataFrame:
+        return self._cached('developer', lambda: self._group('assignee', 'Developer'))
+
+    def by_sprint(self) -> pd.DataFrame:
+        """Sprint ustuni bir nechta nom bo'lishi mumkin ('S1, S2') - har biriga sanaladi"""
+        return self._cached('sprint', lambda: self._group('sprint', 'Sprint', separator=', '))
+
+    def by_component(self) -> pd.DataFrame:
+        return self._cached('component', lambda: self._group('components', 'Component', separator=', '))
+
+    def by_priority(self) -> pd.DataFrame:
+        return self._cached('priority', lambda: self._group('priority', 'Priority'))
+
+    def counts(self, field: str, label: str) -> pd.DataFrame:
+        """Oddiy taqsimot: label, Count, Percent (status, type)"""
+        def compute():
+            counts = self.frame[field].value_counts(sort=True)
+            counts = counts[counts > 0]
+            result = counts.rename_axis(label).reset_index(name='Count')
+            result[label] = result[label].astype(str)
+            result['Percent'] = (result['Count'] / self.total * 100).round(1) if self.total else 0.0
+            return result
+        return self._cached(f'counts:{field}', compute)
+
+    def by_status(self) -> pd.DataFrame:
+        return self.counts('status', 'Status')
+
+    def by_type(self) -> pd.DataFrame:
+        return self.counts('type', 'Type')
+
+    def by_returner(self) -> pd.DataFrame:
+        """QA bo'yicha qaytarishlar (Testing Return Who - har qatorda bitta ism)"""
+        def compute():
+            names = self.frame['testing_returner'].str.split('\n').explode()
+            names = names[names.str.strip() != '']
+            return names.value_counts().rename_axis('Returner').reset_index(name='Returns')
+        return self._cached('returner', compute)
+
+    def returned_issues(self) -> pd.DataFrame:
+        """Qaytarilgan task'lar (eng ko'p qaytganlar birinchi)"""
+        frame = self.frame[self.frame['returned'] == 1]
+        return frame.sort_values(['return_count', 'key'], ascending=[False, True], ignore_index=True)
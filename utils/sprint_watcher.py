@@ -0,0 +1,371 @@
+# utils/sprint_watcher.py
+"""
+Sprint papkasini kuzatish (watch mode) - yangi/o'zgargan fayllar avtomatik yuklanadi
+
+Backend:
+    - watchdog (inotify - Linux, ReadDirectoryChangesW - Windows, FSEvents - macOS)
+    - polling (watchdog o'rnatilmagan yoki use_watchdog=False) - har poll_interval
+      sekundda papka skan qilinadi (size + mtime)
+
+watchdog bilan ham vaqti-vaqti bilan to'liq skan qilinadi - tarmoq disklarida
+event'lar yo'qolishi mumkin.
+
+Debounce: Excel/download skript faylni bir necha bosqichda yozadi. Fayl
+debounce_seconds davomida o'zgarmasa (size va mtime bir xil) - tayyor.
+~$ lock fayllar va .tmp (snapshot yozilayotgan) e'tiborga olinmaydi.
+
+Retry: yuklanmagan fayl (on_ready xatolik yoki muvaffaqiyatli ro'yxatda yo'q) yana
+dirty bo'ladi - retry_backoff, 2x, ... retry_backoff_max gacha kutib qayta uriniladi.
+Kutish paytida pending_files / freshness_lag_seconds'da ko'rinadi.
+
+Freshness lag: fayl papkaga tushgan vaqt (mtime; nusxa ko'chirilgan faylda mtime
+eski qolsa - watcher uni birinchi ko'rgan vaqt) → VectorDB'ga yozilgan vaqt.
+metrics() va metrics_path (JSON) orqali ko'rinadi.
+
+Usage:
+    watcher = SprintDirWatcher(excel_dir, on_ready=lambda paths: service.ingest_workbooks(paths))
+    watcher.run()   # Ctrl+C gacha
+"""
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Callable, Tuple, Any
+
+from dotenv import load_dotenv
+
+from utils.sprint_snapshot import EXCEL_EXT, SNAPSHOT_EXT
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    _HAS_WATCHDOG = True
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+    _HAS_WATCHDOG = False
+
+load_dotenv()
+
+WATCH_EXTENSIONS = (EXCEL_EXT, SNAPSHOT_EXT)
+
+
+def is_sprint_file(name: str) -> bool:
+    """Kuzatiladigan fayl: .xlsx / .parquet, Office lock (~$) emas"""
+    name = os.path.basename(name)
+    return not name.startswith('~$') and os.path.splitext(name)[1] in WATCH_EXTENSIONS
+
+
+def _stat(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+class _EventHandler(FileSystemEventHandler):
+    """watchdog event → watcher.mark_dirty()"""
+
+    def __init__(self, watcher: 'SprintDirWatcher'):
+        super().__init__()
+        self.watcher = watcher
+
+    def on_any_event(self, event):
+        if event.is_directory:
+            return
+        for path in (getattr(event, 'src_path', None), getattr(event, 'dest_path', None)):
+            if path and is_sprint_file(path):
+                self.watcher.mark_dirty(os.path.basename(path))
+
+
+class SprintDirWatcher:
+    """Papkadagi sprint fayllarni kuzatib, tayyor bo'lganlarini on_ready'ga berish"""
+
+    def __init__(
+            self,
+            directory: str,
+            on_ready: Callable[[List[str]], Optional[List[str]]],
+            debounce_seconds: float = None,
+            poll_interval: float = None,
+            use_watchdog: bool = True,
+            metrics_path: str = None,
+            retry_backoff: float = None,
+            retry_backoff_max: float = None
+    ):
+        """
+        Args:
+            directory: Kuzatiladigan papka (EXCEL_DIR)
+            on_ready: Tayyor fayllar (sprint nomi bo'yicha, .xlsx ustun) → muvaffaqiyatli
+                yuklanganlar ro'yxati (None - hammasi)
+            debounce_seconds: Fayl shuncha vaqt o'zgarmasa tayyor (default: INGEST_WATCH_DEBOUNCE yoki 5)
+            poll_interval: To'liq skan oralig'i (default: INGEST_WATCH_INTERVAL yoki 10)
+            use_watchdog: False - faqat polling
+            metrics_path: Metrikalar JSON fayli (default: DATA_DIR/ingest_watch_metrics.json)
+            retry_backoff: Yuklanmagan faylni qayta urinishdan oldin kutish, har urinishda 2x
+                (default: INGEST_WATCH_RETRY_BACKOFF yoki 30)
+            retry_backoff_max: Kutishning yuqori chegarasi (default: INGEST_WATCH_RETRY_MAX yoki 600)
+        """
+        self.directory = directory
+        self.on_ready = on_ready
+        self.debounce_seconds = debounce_seconds if debounce_seconds is not None \
+            else float(os.getenv('INGEST_WATCH_DEBOUNCE', 5))
+        self.poll_interval = poll_interval if poll_interval is not None \
+            else float(os.getenv('INGEST_WATCH_INTERVAL', 10))
+        self.metrics_path = metrics_path or os.path.join(
+            os.getenv('DATA_DIR', './data'), 'ingest_watch_metrics.json'
+        )
+        self.retry_backoff = retry_backoff if retry_backoff is not None \
+            else float(os.getenv('INGEST_WATCH_RETRY_BACKOFF', 30))
+        self.retry_backoff_max = retry_backoff_max if retry_backoff_max is not None \
+            else float(os.getenv('INGEST_WATCH_RETRY_MAX', 600))
+        self.backend = 'watchdog' if use_watchdog and _HAS_WATCHDOG else 'polling'
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._snapshot: Dict[str, Tuple[int, int]] = {}          # oxirgi skan: name → (size, mtime_ns)
+        # name → (oxirgi o'zgarish - monotonic, stat, papkaga tushgan vaqt - epoch)
+        self._dirty: Dict[str, Tuple[float, Optional[Tuple[int, int]], float]] = {}
+        self._attempts: Dict[str, int] = {}                         # name → ketma-ket muvaffaqiyatsiz urinishlar
+        self._observer = None
+        self._last_scan = 0.0
+
+        self._metrics: Dict[str, Any] = {
+            'backend': self.backend,
+            'directory': directory,
+            'started_at': None,
+            'files_ingested': 0,
+            'ingest_runs': 0,
+            'failed_files': 0,
+            'last_ingest_at': None,
+            'last_ingest_lag_seconds': None,
+            'max_ingest_lag_seconds': None,
+        }
+
+    # ------------------------------------------------------------------------
+    # Change detection
+    # ------------------------------------------------------------------------
+    def mark_dirty(self, name: str, delay: float = 0.0, landed: float = None):
+        """
+        Fayl o'zgardi - debounce qaytadan boshlanadi
+
+        Args:
+            delay: Debounce'dan oldin qo'shimcha kutish (retry backoff)
+            landed: Papkaga tushgan vaqt (retry - birinchi aniqlangani saqlanadi)
+        """
+        stat = _stat(os.path.join(self.directory, name))
+        with self._lock:
+            if name in self._dirty:
+                landed = min(self._dirty[name][2], landed if landed is not None else float('inf'))
+            elif landed is None:
+                landed = self._landed_at(stat)
+            self._dirty[name] = (time.monotonic() + delay, stat, landed)
+
+    def _landed_at(self, stat: Optional[Tuple[int, int]]) -> float:
+        """Fayl papkaga tushgan vaqt: mtime, agar u aniqlash vaqtiga yaqin bo'lsa"""
+        now = time.time()
+        if stat is None:
+            return now
+        mtime = stat[1] / 1e9
+        return mtime if now - mtime <= self.poll_interval + self.debounce_seconds else now
+
+    def scan(self) -> List[str]:
+        """
+        To'liq skan (size + mtime) - o'zgargan fayllar dirty bo'ladi
+
+        Returns:
+            O'zgargan fayl nomlari
+        """
+        current = {}
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.is_file() and is_sprint_file(entry.name):
+                        st = entry.stat()
+                        current[entry.name] = (st.st_size, st.st_mtime_ns)
+        except OSError:
+            return []
+
+        changed = [name for name, stat in current.items() if self._snapshot.get(name) != stat]
+        self._snapshot = current
+        self._last_scan = time.monotonic()
+        for name in changed:
+            self.mark_dirty(name)
+        return changed
+
+    def _pop_ready(self) -> Dict[str, float]:
+        """Debounce vaqtida o'zgarmagan fayllar → papkaga tushgan vaqt (o'chirilganlari tashlanadi)"""
+        now = time.monotonic()
+        ready = {}
+        with self._lock:
+            for name, (changed_at, stat, landed) in list(self._dirty.items()):
+                if now - changed_at < self.debounce_seconds:
+                    continue
+                current = _stat(os.path.join(self.directory, name))
+                if current is None:
+                    del self._dirty[name]
+                    self._attempts.pop(name, None)
+                elif current != stat:
+                    # Hali yozilmoqda
+                    self._dirty[name] = (now, current, landed)
+                else:
+                    ready[name] = landed
+                    del self._dirty[name]
+        return ready
+
+    def _sprint_paths(self, ready: Dict[str, float]) -> Dict[str, float]:
+        """
+        report.xlsx / report.parquet → bitta sprint yo'li (.xlsx bo'lsa shu - manifest nomi)
+
+        Returns:
+            {yo'l: eng eski papkaga tushgan vaqt}
+        """
+        paths = {}
+        for name, landed in sorted(ready.items()):
+            stem = os.path.splitext(name)[0]
+            excel = os.path.join(self.directory, stem + EXCEL_EXT)
+            path = excel if os.path.exists(excel) else os.path.join(self.directory, stem + SNAPSHOT_EXT)
+            if os.path.exists(path):
+                paths[path] = min(landed, paths.get(path, landed))
+        return paths
+
+    def _schedule_retry(self, failed: List[str], landed: Dict[str, float]):
+        """Yuklanmagan fayllar yana dirty - exponential backoff bilan (landed o'zgarmaydi)"""
+        for path in failed:
+            name = os.path.basename(path)
+            with self._lock:
+                attempt = self._attempts.get(name, 0) + 1
+                self._attempts[name] = attempt
+            delay = min(self.retry_backoff * 2 ** (attempt - 1), self.retry_backoff_max)
+            self.mark_dirty(name, delay=delay, landed=landed[path])
+            print(f"🔁 Watch: {name} {delay:.0f}s dan keyin qayta yuklanadi ({attempt}-urinish)")
+
+    # ------------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------------
+    def _pending_lag(self) -> float:
+        """Hali yuklanmagan eng eski o'zgarishdan beri o'tgan vaqt (sekund)"""
+        with self._lock:
+            landed = [landed for _, _, landed in self._dirty.values()]
+        if not landed:
+            return 0.0
+        return max(time.time() - min(landed), 0.0)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Watch metrikalari
+
+        freshness_lag_seconds - hozirgi holat: eng eski yuklanmagan o'zgarish yoshi
+        (0 - indeks papka bilan bir xil). last/max_ingest_lag_seconds - fayl
+        tushgan vaqtdan (mtime) VectorDB'ga yozilguncha.
+        """
+        with self._lock:
+            data = dict(self._metrics)
+            data['pending_files'] = len(self._dirty)
+        data['freshness_lag_seconds'] = round(self._pending_lag(), 2)
+        data['updated_at'] = datetime.now().isoformat()
+        return data
+
+    def write_metrics(self):
+        """Metrikalarni JSON faylga yozish (tmp + os.replace)"""
+        if not self.metrics_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.metrics_path)), exist_ok=True)
+            tmp_path = self.metrics_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.metrics(), f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.metrics_path)
+        except OSError as e:
+            print(f"⚠️  Metrikalarni yozishda xatolik: {e}")
+
+    # ------------------------------------------------------------------------
+    # Loop
+    # ------------------------------------------------------------------------
+    def process_ready(self) -> List[str]:
+        """Tayyor fayllarni on_ready'ga berish, lag metrikasini yangilash"""
+        landed = self._sprint_paths(self._pop_ready())
+        if not landed:
+            return []
+
+        paths = list(landed)
+        try:
+            succeeded = self.on_ready(paths)
+        except Exception as e:
+            print(f"❌ Watch: yuklashda xatolik: {e}")
+            succeeded = []
+        if succeeded is None:
+            succeeded = paths
+
+        done = set(succeeded)
+        self._schedule_retry([path for path in paths if path not in done], landed)
+
+        now = time.time()
+        with self._lock:
+            for path in succeeded:
+                self._attempts.pop(os.path.basename(path), None)
+            self._metrics['ingest_runs'] += 1
+            self._metrics['files_ingested'] += len(succeeded)
+            self._metrics['failed_files'] += len(paths) - len(succeeded)
+            if succeeded:
+                lag = max(now - landed[path] for path in succeeded)
+                self._metrics['last_ingest_at'] = datetime.now().isoformat()
+                self._metrics['last_ingest_lag_seconds'] = round(lag, 2)
+                self._metrics['max_ingest_lag_seconds'] = round(
+                    max(lag, self._metrics['max_ingest_lag_seconds'] or 0), 2
+                )
+        self.write_metrics()
+        return succeeded
+
+    def baseline(self):
+        """
+        Boshlang'ich holat - hozir bor fayllar dirty emas
+
+        Boshlang'ich yuklashdan OLDIN chaqirilsa, yuklash paytida tushgan
+        fayllar ham keyingi skanda topiladi.
+        """
+        self.scan()
+        with self._lock:
+            self._dirty.clear()
+
+    def start(self):
+        """Kuzatishni boshlash (baseline() chaqirilmagan bo'lsa - shu yerda)"""
+        self._stop.clear()
+        if not self._last_scan:
+            self.baseline()
+        with self._lock:
+            self._metrics['started_at'] = datetime.now().isoformat()
+
+        if self.backend == 'watchdog':
+            self._observer = Observer()
+            self._observer.schedule(_EventHandler(self), self.directory, recursive=False)
+            self._observer.daemon = True
+            self._observer.start()
+        self.write_metrics()
+
+    def stop(self):
+        self._stop.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+    def tick(self):
+        """Bitta sikl: kerak bo'lsa skan, tayyor fayllarni yuklash"""
+        if time.monotonic() - self._last_scan >= self.poll_interval:
+            self.scan()
+            self.write_metrics()
+        self.process_ready()
+
+    def run(self):
+        """stop() yoki Ctrl+C gacha"""
+        self.start()
+        sleep = min(1.0, self.debounce_seconds / 2) if self.debounce_seconds > 0 else 0.5
+        try:
+            while not self._stop.wait(sleep):
+                self.tick()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
@@ -0,0 +1,187 @@
+# utils/sprint_workbook_reader.py
+"""
+Sprint Excel reportlarini streaming o'qish
+
+download_file.py yaratgan .xlsx fayllarni iter_rows(values_only=True) bilan
+bir marta ketma-ket o'qiydi: ws.cell(row, col) random-access yo'q, butun sheet
+object modeli xotirada ushlab turilmaydi.
+
+2_load_sprints.py va ui/pages/statistics.py shu reader'dan foydalanadi.
+"""
+import os
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+from openpyxl import load_workbook
+
+
+def _to_str(value: Any) -> str:
+    return str(value) if value is not None else ''
+
+
+def _to_int(value: Any) -> int:
+    if value is None or value == '':
+        return 0
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _to_number(value: Any):
+    """Story Points - son yoki '' (Excel'da bo'sh bo'lishi mumkin)"""
+    if value is None or value == '':
+        return ''
+    try:
+        number = value if isinstance(value, (int, float)) else float(value)
+    except (TypeError, ValueError):
+        return ''
+    # 3.0 → 3: Excel (openpyxl) va Parquet (float64) bir xil qiymat bersin
+    if isinstance(number, float) and number.is_integer():
+        return int(number)
+    return number
+
+
+# (issue field, Excel header(lar), default, converter)
+ISSUE_COLUMNS: List[Tuple[str, Tuple[str, ...], Any, Any]] = [
+    ('key', ('Key',), '', _to_str),
+    ('summary', ('Summary',), '', _to_str),
+    ('description', ('Description',), '', _to_str),
+    ('type', ('Type',), '', _to_str),
+    ('status', ('Status',), '', _to_str),
+    ('assignee', ('Assignee',), 'Unassigned', _to_str),
+    ('reporter', ('Reporter',), 'Unknown', _to_str),
+    ('priority', ('Priority',), 'None', _to_str),
+    ('story_points', ('Story Points',), '', _to_number),
+    ('created_date', ('Created Date',), '', _to_str),
+    ('resolved_date', ('Resolved Date',), '', _to_str),
+    ('comments', ('Comments',), '', _to_str),
+    ('comment_authors', ('Comment Authors',), '', _to_str),
+    ('return_count', ('Return Count', 'Return from Test Count'), 0, _to_int),
+    ('return_reasons', ('Return Reasons',), '', _to_str),
+    ('status_history', ('Status History',), '', _to_str),
+    ('testing_time', ('Testing Time',), '', _to_str),
+    ('labels', ('Labels',), '', _to_str),
+    ('components', ('Components',), '', _to_str),
+    ('linked_issues', ('Linked Issues',), '', _to_str),
+    ('pr_status', ('PR Status',), '', _to_str),
+    ('pr_count', ('PR Count',), 0, _to_int),
+    ('pr_last_updated', ('PR Last Updated',), '', _to_str),
+]
+
+
+def parse_sprint_id(filename: str) -> str:
+    """
+    Fayl nomidan sprint ID
+
+    Format: DEV_Sprint_2148_Sprint 46 (PRODUCT)_20251223_171622.xlsx → '2148'
+    """
+    name = os.path.basename(filename)
+    if 'Sprint' not in name:
+        return "Unknown"
+    parts = os.path.splitext(name)[0].split('_')
+    return next((p for p in parts if p.isdigit()), "Unknown")
+
+
+def build_issue(row: Dict[str, Any], sprint_id: str = "Unknown") -> Dict[str, Any]:
+    """
+    Header → qiymat dict'idan typed issue dict (2_load_sprints.py formatida)
+
+    Excel qatori va JIRA'dan to'g'ridan-to'g'ri olingan ustunlar uchun ham ishlatiladi.
+    """
+    issue = {}
+    for field, headers, default, convert in ISSUE_COLUMNS:
+        value = None
+        for header in headers:
+            value = row.get(header)
+            if value is not None and value != '':
+                break
+        issue[field] = convert(value) if value is not None and value != '' else default
+    issue['sprint_id'] = sprint_id
+    return issue
+
+
+class SprintWorkbookReader:
+    """
+    Sprint workbook streaming reader
+
+    Usage:
+        with SprintWorkbookReader(path) as reader:
+            for issue in reader.iter_issues():
+                ...
+    """
+
+    def __init__(self, file_path: str, sprint_id: str = None):
+        """
+        Args:
+            file_path: .xlsx fayl yo'li
+            sprint_id: Sprint ID (default: fayl nomidan)
+        """
+        self.file_path = file_path
+        self.sprint_id = sprint_id or parse_sprint_id(file_path)
+
+        self._wb = load_workbook(file_path, read_only=True, data_only=True)
+        self._ws = self._wb.active
+        self._rows = None
+        self._headers: Optional[Dict[str, int]] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        if self._wb is not None:
+            self._wb.close()
+            self._wb = None
+
+    @property
+    def headers(self) -> Dict[str, int]:
+        """Header nomi → ustun indeksi (0 dan)"""
+        if self._headers is None:
+            self._rows = self._ws.iter_rows(values_only=True)
+            header_row = next(self._rows, ()) or ()
+            self._headers = {
+                str(name).strip(): idx for idx, name in enumerate(header_row) if name
+            }
+        return self._headers
+
+    @property
+    def total_rows(self) -> int:
+        """Data qatorlar soni (sheet dimension'dan, header'siz)"""
+        max_row = self._ws.max_row
+        return max(max_row - 1, 0) if max_row else 0
+
+    def iter_rows(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Xom qatorlar: (Excel qator raqami, {header: value})
+
+        Faqat bir marta iteratsiya qilinadi (streaming).
+        """
+        headers = self.headers
+        columns = list(headers.items())
+
+        for row_idx, values in enumerate(self._rows, start=2):
+            width = len(values)
+            yield row_idx, {
+                name: values[idx] if idx < width else None for name, idx in columns
+            }
+
+    def iter_issues(self, start_row: int = 2) -> Iterator[Dict[str, Any]]:
+        """
+        Typed issue dict'lar
+
+        Args:
+            start_row: Shu Excel qatoridan boshlab (oldingilari o'tkazib yuboriladi)
+
+        Yields:
+            build_issue() natijasi + 'row' (Excel qator raqami). Key bo'sh qatorlar o'tkaziladi.
+        """
+        for row_idx, row in self.iter_rows():
+            if row_idx < start_row:
+                continue
+            issue = build_issue(row, self.sprint_id)
+            if not issue['key']:
+                continue
+            issue['row'] = row_idx
+            yield issue
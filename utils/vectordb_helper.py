@@ -10,8 +10,12 @@ load_dotenv()
 
 
 class VectorDBHelper:
-    def __init__(self):
-        db_path = os.getenv('VECTOR_DB_PATH', './data/vector_db')
+    def __init__(self, db_path: str = None):
+        """
+        Args:
+            db_path: VectorDB papkasi (default: VECTOR_DB_PATH env)
+        """
+        db_path = db_path or os.getenv('VECTOR_DB_PATH', './data/vector_db')
 
         print(f"VectorDB ga ulanmoqda: {db_path}")
 
@@ -88,17 +92,12 @@ class VectorDBHelper:
             metadatas=[metadata_with_chunks]
         )
 
-    def add_issues_batch_with_chunks(
-            self,
-            keys: List[str],
-            weighted_embeddings: List[List[float]],
-            full_texts: List[str],
+    @staticmethod
+    def _metadatas_with_chunks(
             metadatas: List[Dict[str, Any]],
             all_chunks_data: List[List[Dict[str, Any]]]
-    ):
-        """
-        Batch format - ko'p issue'larni chunks bilan qo'shish
-        """
+    ) -> List[Dict[str, Any]]:
+        """Metadata'ga chunks preview qo'shish (batch)"""
         metadatas_with_chunks = []
 
         for metadata, chunks_data in zip(metadatas, all_chunks_data):
@@ -119,11 +118,45 @@ class VectorDBHelper:
             }
             metadatas_with_chunks.append(metadata_with_chunks)
 
+        return metadatas_with_chunks
+
+    def add_issues_batch_with_chunks(
+            self,
+            keys: List[str],
+            weighted_embeddings: List[List[float]],
+            full_texts: List[str],
+            metadatas: List[Dict[str, Any]],
+            all_chunks_data: List[List[Dict[str, Any]]]
+    ):
+        """
+        Batch format - ko'p issue'larni chunks bilan qo'shish
+        """
         self.collection.add(
             ids=keys,
             embeddings=weighted_embeddings,
             documents=full_texts,
-            metadatas=metadatas_with_chunks
+            metadatas=self._metadatas_with_chunks(metadatas, all_chunks_data)
+        )
+
+    def upsert_issues_batch_with_chunks(
+            self,
+            keys: List[str],
+            weighted_embeddings: List[List[float]],
+            full_texts: List[str],
+            metadatas: List[Dict[str, Any]],
+            all_chunks_data: List[List[Dict[str, Any]]]
+    ):
+        """
+        add_issues_batch_with_chunks kabi, lekin mavjud ID'lar yangilanadi
+
+        Ingest pipeline shuni ishlatadi: yiqilgan yuklashni qayta boshlash yoki
+        qayta yuklangan sprint fayli duplicate ID xatosiga olib kelmaydi.
+        """
+        self.collection.upsert(
+            ids=keys,
+            embeddings=weighted_embeddings,
+            documents=full_texts,
+            metadatas=self._metadatas_with_chunks(metadatas, all_chunks_data)
         )
 
     def search(self, query_embedding, n_results=10, filters=None):
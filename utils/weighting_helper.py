@@ -0,0 +1,100 @@
+# utils/weighting_helper.py
+from typing import List, Dict, Any, Sequence
+import numpy as np
+
+# multilingual-e5-large vektor o'lchami
+EMBEDDING_DIM = 1024
+
+
+class WeightingHelper:
+    """
+    Chunk embedding'laridan issue uchun weighted average vektor hisoblash
+
+    Avval bu qadam 2_load_sprints.py ichida har bir issue uchun Python loop
+    bilan qilinardi. Endi barcha issue'lar bitta numpy operatsiyasida
+    hisoblanadi (segment sum) - benchmark va tuning uchun ham qayta ishlatiladi.
+    """
+
+    @staticmethod
+    def weighted_average(embeddings: Sequence[Sequence[float]], weights: Sequence[float]) -> List[float]:
+        """
+        Bitta issue uchun weighted average
+
+        Args:
+            embeddings: Chunk embedding'lari
+            weights: Har bir chunk weight'i
+
+        Returns:
+            Weighted average embedding (bo'sh list - agar weight 0 bo'lsa)
+        """
+        if len(embeddings) == 0:
+            return []
+
+        weights_arr = np.asarray(weights, dtype=np.float64)
+        total_weight = weights_arr.sum()
+        if total_weight <= 0:
+            return []
+
+        emb_arr = np.asarray(embeddings, dtype=np.float64)
+        return ((weights_arr / total_weight) @ emb_arr).tolist()
+
+    @staticmethod
+    def weight_issues(
+            all_chunks_data: List[List[Dict[str, Any]]],
+            all_embeddings_flat: Sequence[Sequence[float]],
+            dim: int = EMBEDDING_DIM,
+            as_list: bool = True
+    ):
+        """
+        Ko'p issue uchun weighted average - vectorized
+
+        Args:
+            all_chunks_data: Har bir issue chunk'lari (ketma-ket)
+            all_embeddings_flat: Barcha chunk embedding'lari (flat, all_chunks_data tartibida)
+            dim: Embedding o'lchami (chunk bo'lmasa nol vektor uchun)
+            as_list: True - List[List[float]] (ChromaDB uchun), False - np.ndarray
+
+        Returns:
+            Har bir issue uchun bitta weighted embedding.
+            Chunk'i yoki weight'i bo'lmagan issue uchun nol vektor.
+        """
+        counts = np.fromiter((len(c) for c in all_chunks_data), dtype=np.int64, count=len(all_chunks_data))
+        n_issues = len(counts)
+
+        embeddings = np.asarray(all_embeddings_flat, dtype=np.float64)
+        if embeddings.ndim == 2 and embeddings.shape[0] > 0:
+            dim = embeddings.shape[1]
+
+        result = np.zeros((n_issues, dim), dtype=np.float64)
+
+        if n_issues == 0 or embeddings.size == 0:
+            return result.tolist() if as_list else result
+
+        if embeddings.shape[0] != counts.sum():
+            raise ValueError(
+                f"Embedding soni ({embeddings.shape[0]}) chunk soniga ({counts.sum()}) mos emas"
+            )
+
+        weights = np.fromiter(
+            (chunk.get('weight', 1.0) for issue_chunks in all_chunks_data for chunk in issue_chunks),
+            dtype=np.float64,
+            count=int(counts.sum())
+        )
+
+        # Har bir chunk qaysi issue'ga tegishli
+        issue_idx = np.repeat(np.arange(n_issues), counts)
+        totals = np.bincount(issue_idx, weights=weights, minlength=n_issues)
+
+        # Normalized weight: weight / issue total weight
+        safe_totals = np.where(totals > 0, totals, 1.0)
+        scaled = embeddings * (weights / safe_totals[issue_idx])[:, None]
+
+        # Segment sum - faqat chunk'i bor issue'lar uchun
+        offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        non_empty = counts > 0
+        result[non_empty] = np.add.reduceat(scaled, offsets[non_empty], axis=0)
+
+        # Total weight 0 bo'lsa - nol vektor (eski xatti-harakat)
+        result[totals <= 0] = 0.0
+
+        return result.tolist() if as_list else result